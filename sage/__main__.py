@@ -0,0 +1,46 @@
+"""Entry point for the ``sage`` console script and ``python -m sage``.
+
+``sage --version``, ``sage --help`` and ``sage <group> --help`` are
+answered here, before Click or any of the CLI modules are imported, so
+they stay near-instant. The help text comes from :mod:`sage._help`,
+which ``scripts/gen_cli_help.py`` generates. Everything else is handed
+to :func:`sage.cli.main`.
+"""
+
+import sys
+
+_VERSION_FLAGS = ("--version", "-V")
+
+
+def _static_help(args: list[str]) -> str | None:
+    """Pre-rendered help for ``--help`` or ``<group> --help``, if available."""
+    if not args or args[-1] != "--help" or len(args) > 2:
+        return None
+
+    from sage._help import HELP
+
+    return HELP.get(args[0] if len(args) == 2 else "main")
+
+
+def main() -> None:
+    """Run the Sage CLI, short-circuiting bare version and help requests."""
+    args = sys.argv[1:]
+    if len(args) == 1 and args[0] in _VERSION_FLAGS:
+        from sage import __version__
+
+        # Same wording as click.version_option
+        print(f"sage, version {__version__}")
+        return
+
+    help_text = _static_help(args)
+    if help_text is not None:
+        sys.stdout.write(help_text)
+        return
+
+    from sage.cli import main as cli_main
+
+    cli_main(prog_name="sage")
+
+
+if __name__ == "__main__":
+    main()
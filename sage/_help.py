@@ -0,0 +1,206 @@
+"""Pre-rendered ``--help`` text for ``sage`` and its command groups.
+
+Generated by ``scripts/gen_cli_help.py`` -- do not edit by hand.
+"""
+
+HELP = {
+    "main": (
+        "Usage: sage [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Sage: Semantic checkpointing for Claude Code.\n"
+        "\n"
+        "Options:\n"
+        "  -V, --version  Show the version and exit.\n"
+        "  --help         Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  admin       Administrative commands for Sage maintenance.\n"
+        "  ask         One-shot question with skill context.\n"
+        "  checkpoint  Manage research checkpoints.\n"
+        "  config      Manage configuration.\n"
+        "  context     Show what a skill knows.\n"
+        "  continuity  Manage session continuity markers.\n"
+        "  debug       Debug retrieval scoring for a query.\n"
+        "  health      Check Sage system health and diagnostics.\n"
+        "  history     Show query history for a skill.\n"
+        "  hooks       Manage Claude Code hooks for auto-checkpointing.\n"
+        "  init        Initialize Sage (first-time setup).\n"
+        "  knowledge   Manage knowledge items for recall.\n"
+        "  list        List all Sage-managed skills.\n"
+        "  mcp         Manage MCP server for Claude Code.\n"
+        "  new         Create a new research skill.\n"
+        "  rm          Delete a research skill.\n"
+        "  show        Show full query and response from history.\n"
+        "  skills      Manage Sage methodology skills.\n"
+        "  templates   Manage checkpoint templates.\n"
+        "  todo        Manage persistent todos.\n"
+        "  ui          Start local web UI for browsing checkpoints and knowledge.\n"
+        "  usage       Show usage analytics.\n"
+        "  watcher     Manage compaction watcher daemon for session continuity.\n"
+    ),
+    "admin": (
+        "Usage: sage admin [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Administrative commands for Sage maintenance.\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  clear-cache         Clear all cached data (embeddings, etc.).\n"
+        "  rebuild-embeddings  Rebuild all embeddings after model change.\n"
+    ),
+    "checkpoint": (
+        "Usage: sage checkpoint [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage research checkpoints.\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  list          List saved checkpoints.\n"
+        "  post-compact  Save recovery checkpoint after compaction with the summary.\n"
+        "  restore       Restore a checkpoint and start a query with its context.\n"
+        "  rm            Delete a checkpoint.\n"
+        "  show          Show details of a checkpoint.\n"
+    ),
+    "config": (
+        "Usage: sage config [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage configuration.\n"
+        "\n"
+        "  Sage has two config files: - config.yaml: Runtime settings (api_key, model,\n"
+        "  etc.) - tuning.yaml: Retrieval/detection thresholds (recall_threshold, etc.)\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  list   Show current configuration.\n"
+        "  reset  Reset tuning configuration to defaults.\n"
+        "  set    Set a configuration value.\n"
+    ),
+    "continuity": (
+        "Usage: sage continuity [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage session continuity markers.\n"
+        "\n"
+        "  Continuity markers are created by the watcher when compaction is detected. The\n"
+        "  marker tells Sage to inject checkpoint context on the next tool call.\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  clear   Clear pending continuity marker.\n"
+        "  inject  Output continuity context for hook injection.\n"
+        "  mark    Manually create a continuity marker.\n"
+        "  status  Show current continuity status.\n"
+    ),
+    "hooks": (
+        "Usage: sage hooks [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage Claude Code hooks for auto-checkpointing.\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  install    Install Sage hooks into Claude Code.\n"
+        "  status     Show current hook installation status.\n"
+        "  uninstall  Remove Sage hooks from Claude Code.\n"
+    ),
+    "knowledge": (
+        "Usage: sage knowledge [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage knowledge items for recall.\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  add        Add a knowledge item from a file.\n"
+        "  archive    Archive a knowledge item (hide from recall).\n"
+        "  deprecate  Mark a knowledge item as deprecated.\n"
+        "  edit       Edit an existing knowledge item.\n"
+        "  list       List knowledge items.\n"
+        "  match      Test what knowledge would be recalled for a query.\n"
+        "  rm         Remove a knowledge item.\n"
+    ),
+    "mcp": (
+        "Usage: sage mcp [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage MCP server for Claude Code.\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  install    Install Sage MCP server into Claude Code.\n"
+        "  status     Show MCP server installation status.\n"
+        "  uninstall  Remove Sage MCP server from Claude Code.\n"
+    ),
+    "skills": (
+        "Usage: sage skills [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage Sage methodology skills.\n"
+        "\n"
+        "  Sage ships default skills that teach Claude how to use Sage effectively. These\n"
+        "  are separate from research skills created via 'sage create'.\n"
+        "\n"
+        "  Skills are installed to ~/.claude/skills/sage/\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  install  Install default Sage methodology skills.\n"
+        "  list     List installed Sage methodology skills.\n"
+        "  show     Show a Sage methodology skill's content.\n"
+        "  update   Update Sage methodology skills to latest versions.\n"
+    ),
+    "templates": (
+        "Usage: sage templates [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage checkpoint templates.\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  list  List available checkpoint templates.\n"
+        "  show  Show details of a checkpoint template.\n"
+    ),
+    "todo": (
+        "Usage: sage todo [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage persistent todos.\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  done     Mark a todo as done.\n"
+        "  list     List pending todos.\n"
+        "  pending  Show pending todos (for session start).\n"
+    ),
+    "watcher": (
+        "Usage: sage watcher [OPTIONS] COMMAND [ARGS]...\n"
+        "\n"
+        "  Manage compaction watcher daemon for session continuity.\n"
+        "\n"
+        "  The watcher monitors Claude Code transcripts for compaction events. When\n"
+        "  detected, it writes a marker so the next Sage tool call can inject context\n"
+        "  from the most recent checkpoint.\n"
+        "\n"
+        "Options:\n"
+        "  --help  Show this message and exit.\n"
+        "\n"
+        "Commands:\n"
+        "  autostart  Enable or disable watcher autostart.\n"
+        "  start      Start the compaction watcher daemon.\n"
+        "  status     Show watcher daemon status.\n"
+        "  stop       Stop the compaction watcher daemon.\n"
+    ),
+}
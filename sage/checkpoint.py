@@ -12,8 +12,10 @@ embeddings to avoid saving semantically similar checkpoints.
 """
 
 import logging
+import os
 import re
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -29,7 +31,50 @@ logger = logging.getLogger(__name__)
 CHECKPOINTS_DIR = SAGE_DIR / "checkpoints"
 
 
-@dataclass(frozen=True)
+# ============================================================================
+# YAML Loader/Dumper
+# ============================================================================
+
+# Prefer the libyaml-backed classes; fall back to pure Python if unavailable
+_BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_BaseDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_TIMESTAMP_TAG = "tag:yaml.org,2002:timestamp"
+
+
+class _FastLoader(_BaseLoader):
+    """Safe loader shared by all checkpoint parses.
+
+    Timestamp resolution is disabled so `ts` stays a plain string (which is
+    how Checkpoint stores it) instead of round-tripping through datetime.
+    """
+
+
+# Copy the resolver table before filtering - it is shared with SafeLoader
+_FastLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag != _TIMESTAMP_TAG]
+    for first, resolvers in _BaseLoader.yaml_implicit_resolvers.items()
+}
+
+
+class _FastDumper(_BaseDumper):
+    """Safe dumper shared by all checkpoint saves."""
+
+
+def _load_yaml(text: str):
+    """Parse YAML text with the shared checkpoint loader."""
+    return yaml.load(text, Loader=_FastLoader)  # noqa: S506 - _FastLoader is a SafeLoader
+
+
+def _intern(value):
+    """Intern small-vocabulary strings so loaded checkpoints share one object.
+
+    Non-string values (None, or odd YAML types) pass through unchanged.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
 class Source:
     """A source referenced in research."""
 
@@ -39,7 +84,7 @@ class Source:
     relation: str  # supports, contradicts, nuances
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tension:
     """A disagreement between sources."""
 
@@ -48,7 +93,7 @@ class Tension:
     resolution: str  # unresolved, resolved, moot
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Contribution:
     """A unique discovery or synthesis."""
 
@@ -56,7 +101,7 @@ class Contribution:
     content: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CodeRef:
     """Reference to code that informed the checkpoint.
 
@@ -71,7 +116,7 @@ class CodeRef:
     relevance: str = "context"  # "supports" | "contradicts" | "context" | "stale"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Checkpoint:
     """A semantic checkpoint of research state."""
 
@@ -121,12 +166,20 @@ class Checkpoint:
     related_knowledge: tuple[str, ...] = ()  # Related knowledge item IDs
 
 
+_ID_TS_FORMAT = "%Y-%m-%dT%H-%M-%S"
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _generate_checkpoint_id(description: str, now: datetime) -> CheckpointId:
+    """Build a checkpoint ID from an already-sampled timestamp."""
+    # Slugify description
+    slug = _SLUG_RE.sub("-", description.lower()).strip("-")[:40]
+    return CheckpointId(f"{now.strftime(_ID_TS_FORMAT)}_{slug}")
+
+
 def generate_checkpoint_id(description: str) -> CheckpointId:
     """Generate a checkpoint ID from timestamp and description."""
-    ts = datetime.now(UTC).strftime("%Y-%m-%dT%H-%M-%S")
-    # Slugify description
-    slug = re.sub(r"[^a-z0-9]+", "-", description.lower()).strip("-")[:40]
-    return CheckpointId(f"{ts}_{slug}")
+    return _generate_checkpoint_id(description, datetime.now(UTC))
 
 
 def get_checkpoints_dir(project_path: Path | None = None, auto_create: bool = True) -> Path:
@@ -279,8 +332,12 @@ def _checkpoint_to_markdown(checkpoint: Checkpoint) -> str:
     body = "\n".join(lines)
 
     # Combine frontmatter and body
-    fm_yaml = yaml.safe_dump(
-        frontmatter, default_flow_style=False, sort_keys=False, allow_unicode=True
+    fm_yaml = yaml.dump(
+        frontmatter,
+        Dumper=_FastDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
     )
     return f"---\n{fm_yaml}---\n\n{body}"
 
@@ -301,7 +358,7 @@ def _markdown_to_checkpoint(content: str) -> Checkpoint | None:
         body = content[end_idx + 3 :].strip()
 
         # Parse frontmatter
-        fm = yaml.safe_load(fm_text) or {}
+        fm = _load_yaml(fm_text) or {}
 
         # Parse body sections
         core_question = ""
@@ -395,15 +452,10 @@ def _markdown_to_checkpoint(content: str) -> Checkpoint | None:
         related_knowledge_raw = fm.get("related_knowledge", [])
         related_knowledge = tuple(related_knowledge_raw) if related_knowledge_raw else ()
 
-        # YAML auto-converts ISO timestamps to datetime, convert back to string
-        ts_value = fm.get("ts", "")
-        if hasattr(ts_value, "isoformat"):
-            ts_value = ts_value.isoformat()
-
         return Checkpoint(
             id=fm.get("id", ""),
-            ts=ts_value,
-            trigger=fm.get("trigger", ""),
+            ts=fm.get("ts", ""),
+            trigger=_intern(fm.get("trigger", "")),
             core_question=core_question,
             thesis=thesis,
             confidence=fm.get("confidence", 0.0),
@@ -414,13 +466,13 @@ def _markdown_to_checkpoint(content: str) -> Checkpoint | None:
             key_evidence=key_evidence,
             reasoning_trace=reasoning_trace,
             action_goal=fm.get("action_goal", ""),
-            action_type=fm.get("action_type", ""),
-            skill=fm.get("skill"),
-            project=fm.get("project"),
+            action_type=_intern(fm.get("action_type", "")),
+            skill=_intern(fm.get("skill")),
+            project=_intern(fm.get("project")),
             parent_checkpoint=fm.get("parent_checkpoint"),
             message_count=fm.get("message_count", 0),
             token_estimate=fm.get("token_estimate", 0),
-            template=fm.get("template", "default"),
+            template=_intern(fm.get("template", "default")),
             # Code context (v1.3)
             files_explored=files_explored,
             files_changed=files_changed,
@@ -462,7 +514,9 @@ def _parse_source_line(line: str) -> Source | None:
             take = rest
             relation = ""
 
-        return Source(id=source_id, type=source_type, take=take, relation=relation)
+        return Source(
+            id=source_id, type=sys.intern(source_type), take=take, relation=sys.intern(relation)
+        )
     except (IndexError, ValueError):
         return None
 
@@ -499,7 +553,7 @@ def _parse_tension_line(line: str) -> Tension | None:
             nature = rest
             resolution = ""
 
-        return Tension(between=(src1, src2), nature=nature, resolution=resolution)
+        return Tension(between=(src1, src2), nature=nature, resolution=sys.intern(resolution))
     except (IndexError, ValueError):
         return None
 
@@ -514,7 +568,7 @@ def _parse_contribution_line(line: str) -> Contribution | None:
             return None
         contrib_type = line[4:type_end]
         content = line[type_end + 3 :].strip()  # Skip **:
-        return Contribution(type=contrib_type, content=content)
+        return Contribution(type=sys.intern(contrib_type), content=content)
     except (IndexError, ValueError):
         return None
 
@@ -958,10 +1012,36 @@ def _validate_checkpoint_schema(data: dict) -> str | None:
     return None
 
 
-def _load_checkpoint_file(file_path: Path) -> Checkpoint | None:
-    """Load a checkpoint from a file path. Supports both .md and .yaml formats."""
+# Readahead hints (None where posix_fadvise is unavailable, e.g. macOS)
+_ADVICE_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+_ADVICE_RANDOM = getattr(os, "POSIX_FADV_RANDOM", None)
+
+
+def _advise(fd: int, advice: int | None) -> None:
+    """Tell the kernel how a checkpoint file is about to be read.
+
+    Purely a performance hint - failures are ignored.
+    """
+    if advice is None:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _load_checkpoint_file(
+    file_path: Path, advice: int | None = _ADVICE_RANDOM
+) -> Checkpoint | None:
+    """Load a checkpoint from a file path. Supports both .md and .yaml formats.
+
+    Args:
+        file_path: Checkpoint file to read
+        advice: posix_fadvise hint - random for single loads, sequential for scans
+    """
     try:
         with open(file_path) as f:
+            _advise(f.fileno(), advice)
             content = f.read()
 
         # Detect format by extension or content
@@ -969,7 +1049,7 @@ def _load_checkpoint_file(file_path: Path) -> Checkpoint | None:
             return _markdown_to_checkpoint(content)
 
         # Legacy YAML format
-        data = yaml.safe_load(content)
+        data = _load_yaml(content)
 
         # Validate schema before accessing
         validation_error = _validate_checkpoint_schema(data)
@@ -981,15 +1061,10 @@ def _load_checkpoint_file(file_path: Path) -> Checkpoint | None:
         meta = cp.get("metadata", {})
         action = cp.get("action", {})
 
-        # YAML auto-converts ISO timestamps to datetime, convert back to string
-        ts_value = cp["ts"]
-        if hasattr(ts_value, "isoformat"):
-            ts_value = ts_value.isoformat()
-
         return Checkpoint(
             id=cp["id"],
-            ts=ts_value,
-            trigger=cp["trigger"],
+            ts=cp["ts"],
+            trigger=_intern(cp["trigger"]),
             core_question=cp["core_question"],
             thesis=cp["thesis"],
             confidence=cp["confidence"],
@@ -997,9 +1072,9 @@ def _load_checkpoint_file(file_path: Path) -> Checkpoint | None:
             sources=[
                 Source(
                     id=s["id"],
-                    type=s["type"],
+                    type=_intern(s["type"]),
                     take=s["take"],
-                    relation=s["relation"],
+                    relation=_intern(s["relation"]),
                 )
                 for s in cp.get("sources", [])
             ],
@@ -1007,18 +1082,18 @@ def _load_checkpoint_file(file_path: Path) -> Checkpoint | None:
                 Tension(
                     between=tuple(t["between"]),
                     nature=t["nature"],
-                    resolution=t["resolution"],
+                    resolution=_intern(t["resolution"]),
                 )
                 for t in cp.get("tensions", [])
             ],
             unique_contributions=[
-                Contribution(type=c["type"], content=c["content"])
+                Contribution(type=_intern(c["type"]), content=c["content"])
                 for c in cp.get("unique_contributions", [])
             ],
             action_goal=action.get("goal", ""),
-            action_type=action.get("type", ""),
-            skill=meta.get("skill"),
-            project=meta.get("project"),
+            action_type=_intern(action.get("type", "")),
+            skill=_intern(meta.get("skill")),
+            project=_intern(meta.get("project")),
             parent_checkpoint=meta.get("parent_checkpoint"),
             message_count=meta.get("message_count", 0),
             token_estimate=meta.get("token_estimate", 0),
@@ -1044,7 +1119,7 @@ def list_checkpoints(
 
     checkpoints = []
     for file_path in sorted(files, reverse=True):
-        cp = _load_checkpoint_file(file_path)
+        cp = _load_checkpoint_file(file_path, advice=_ADVICE_SEQUENTIAL)
         if cp:
             if skill and cp.skill != skill:
                 continue
@@ -1423,11 +1498,13 @@ def create_checkpoint_from_dict(
     Returns:
         Checkpoint object
     """
-    ts = datetime.now(UTC).isoformat()
+    # Sample the clock once so the ID and ts always agree
+    now = datetime.now(UTC)
+    ts = now.isoformat()
 
     # Generate ID
     description = data.get("thesis", data.get("decision", "checkpoint"))[:50]
-    checkpoint_id = generate_checkpoint_id(description)
+    checkpoint_id = _generate_checkpoint_id(description, now)
 
     # Extract custom fields (anything not in standard schema)
     standard_fields = {
@@ -1536,37 +1613,10 @@ def enrich_checkpoint_with_code_context(
         new_files_explored = checkpoint.files_explored | context.files_read
         new_files_changed = checkpoint.files_changed | context.files_changed
 
-        # Create new checkpoint with updated fields
-        # Using dataclasses.replace would be cleaner but Checkpoint is frozen
-        return Checkpoint(
-            id=checkpoint.id,
-            ts=checkpoint.ts,
-            trigger=checkpoint.trigger,
-            core_question=checkpoint.core_question,
-            thesis=checkpoint.thesis,
-            confidence=checkpoint.confidence,
-            open_questions=checkpoint.open_questions,
-            sources=checkpoint.sources,
-            tensions=checkpoint.tensions,
-            unique_contributions=checkpoint.unique_contributions,
-            key_evidence=checkpoint.key_evidence,
-            reasoning_trace=checkpoint.reasoning_trace,
-            action_goal=checkpoint.action_goal,
-            action_type=checkpoint.action_type,
-            skill=checkpoint.skill,
-            project=checkpoint.project,
-            parent_checkpoint=checkpoint.parent_checkpoint,
-            message_count=checkpoint.message_count,
-            token_estimate=checkpoint.token_estimate,
-            template=checkpoint.template,
-            custom_fields=checkpoint.custom_fields,
-            code_refs=checkpoint.code_refs,
+        return replace(
+            checkpoint,
             files_explored=new_files_explored,
             files_changed=new_files_changed,
-            git_context=checkpoint.git_context,
-            diff_summary=checkpoint.diff_summary,
-            continues_from=checkpoint.continues_from,
-            related_knowledge=checkpoint.related_knowledge,
         )
 
     return checkpoint
@@ -1595,33 +1645,8 @@ def enrich_checkpoint_with_git_context(
 
     diff = get_diff_summary(project_path)
 
-    return Checkpoint(
-        id=checkpoint.id,
-        ts=checkpoint.ts,
-        trigger=checkpoint.trigger,
-        core_question=checkpoint.core_question,
-        thesis=checkpoint.thesis,
-        confidence=checkpoint.confidence,
-        open_questions=checkpoint.open_questions,
-        sources=checkpoint.sources,
-        tensions=checkpoint.tensions,
-        unique_contributions=checkpoint.unique_contributions,
-        key_evidence=checkpoint.key_evidence,
-        reasoning_trace=checkpoint.reasoning_trace,
-        action_goal=checkpoint.action_goal,
-        action_type=checkpoint.action_type,
-        skill=checkpoint.skill,
-        project=checkpoint.project,
-        parent_checkpoint=checkpoint.parent_checkpoint,
-        message_count=checkpoint.message_count,
-        token_estimate=checkpoint.token_estimate,
-        template=checkpoint.template,
-        custom_fields=checkpoint.custom_fields,
-        code_refs=checkpoint.code_refs,
-        files_explored=checkpoint.files_explored,
-        files_changed=checkpoint.files_changed,
+    return replace(
+        checkpoint,
         git_context=git_ctx.to_dict(),
         diff_summary=diff.to_dict() if diff.files_changed or diff.staged_files else None,
-        continues_from=checkpoint.continues_from,
-        related_knowledge=checkpoint.related_knowledge,
     )
@@ -0,0 +1,426 @@
+"""Sage CLI - Research orchestration layer for Agent Skills.
+
+Most commands live in submodules of this package and are only imported
+when invoked (see :class:`LazyGroup`). ``init``, ``health`` and ``config``
+stay here because they read the module-level config names below.
+"""
+
+import functools
+import importlib
+import sys
+from collections.abc import Callable
+
+import click
+
+from sage import __version__
+from sage.cli._console import console
+
+# Keep module-level imports light: the Anthropic client, knowledge store and
+# skills are imported inside the commands that use them, so `sage --help`
+# and `sage --version` don't pay for them.
+from sage.config import SAGE_DIR, Config, SageConfig, get_sage_config
+from sage.errors import format_error
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use.
+
+    ``lazy_subcommands`` maps a command name to ``(module, attribute)``.
+    The module is only imported when Click asks for that command, so
+    running one command never loads the others.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr = self.lazy_subcommands[cmd_name]
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}.{attr} is not a Click command")
+        return command
+
+
+_LAZY_SUBCOMMANDS = {
+    # Skills and queries
+    "ask": ("sage.cli.core", "ask"),
+    "context": ("sage.cli.core", "context"),
+    "debug": ("sage.cli.core", "debug"),
+    "history": ("sage.cli.core", "history"),
+    "list": ("sage.cli.core", "list_cmd"),
+    "new": ("sage.cli.core", "new"),
+    "rm": ("sage.cli.core", "rm"),
+    "show": ("sage.cli.core", "show"),
+    "ui": ("sage.cli.core", "ui"),
+    "usage": ("sage.cli.core", "usage"),
+    # Groups
+    "admin": ("sage.cli.admin", "admin"),
+    "checkpoint": ("sage.cli.checkpoint", "checkpoint"),
+    "continuity": ("sage.cli.continuity", "continuity"),
+    "hooks": ("sage.cli.hooks", "hooks"),
+    "knowledge": ("sage.cli.knowledge", "knowledge"),
+    "mcp": ("sage.cli.mcp", "mcp"),
+    "skills": ("sage.cli.skills", "skills"),
+    "templates": ("sage.cli.templates", "templates"),
+    "todo": ("sage.cli.knowledge", "todo"),
+    "watcher": ("sage.cli.watcher", "watcher"),
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=_LAZY_SUBCOMMANDS)
+@click.version_option(__version__, "--version", "-V")
+def main():
+    """Sage: Semantic checkpointing for Claude Code."""
+    pass
+
+
+@main.command()
+@click.option("--api-key", help="Anthropic API key")
+@click.option("--skill", help="Create first skill with this name")
+@click.option("--description", help="Skill description (requires --skill)")
+@click.option("--non-interactive", is_flag=True, help="Run without prompts")
+def init(api_key, skill, description, non_interactive):
+    """Initialize Sage (first-time setup). Use 'sage hooks install' for hooks."""
+    from sage.init import run_init
+
+    result = run_init(
+        api_key=api_key,
+        skill_name=skill,
+        skill_description=description,
+        non_interactive=non_interactive,
+    )
+    if not result.ok:
+        console.print(f"[red]{format_error(result.error)}[/red]")
+        sys.exit(1)
+
+
+@main.command()
+def health():
+    """Check Sage system health and diagnostics."""
+
+    from sage.checkpoint import CHECKPOINTS_DIR, list_checkpoints
+    from sage.config import CONFIG_PATH, SAGE_DIR, detect_project_root, get_sage_config
+    from sage.embeddings import check_model_mismatch, get_configured_model, is_available
+    from sage.knowledge import KNOWLEDGE_DIR, list_knowledge
+    from sage.tasks import TASKS_DIR, load_pending_tasks
+
+    project_root = detect_project_root()
+
+    console.print("[bold]Sage Health Check[/bold]")
+    console.print("─" * 40)
+
+    issues = []
+
+    # Check .sage directory
+    if SAGE_DIR.exists():
+        console.print(f"[green]✓[/green] Sage directory: {SAGE_DIR}")
+    else:
+        console.print(f"[red]✗[/red] Sage directory missing: {SAGE_DIR}")
+        issues.append("Run 'sage init' to create directory")
+
+    # Check config
+    _ = get_sage_config()  # Validates config loads correctly
+    if CONFIG_PATH.exists():
+        console.print(f"[green]✓[/green] Config loaded: {CONFIG_PATH}")
+    else:
+        console.print("[yellow]![/yellow] No config file (using defaults)")
+
+    # Check embeddings
+    if is_available():
+        model_name = get_configured_model()
+        mismatch, old_model, new_model = check_model_mismatch()
+        if mismatch:
+            console.print(f"[yellow]![/yellow] Embeddings: model changed ({old_model} → {new_model})")
+            issues.append("Run 'sage admin rebuild-embeddings' to update")
+        else:
+            console.print(f"[green]✓[/green] Embeddings: {model_name}")
+    else:
+        console.print("[yellow]![/yellow] Embeddings: not available (install sentence-transformers)")
+
+    # Check checkpoints
+    if CHECKPOINTS_DIR.exists():
+        checkpoints = list_checkpoints(project_path=project_root)
+        total_size = sum(f.stat().st_size for f in CHECKPOINTS_DIR.glob("*.md"))
+        size_str = f"{total_size / 1024:.1f}KB" if total_size < 1024 * 1024 else f"{total_size / 1024 / 1024:.1f}MB"
+        console.print(f"[green]✓[/green] Checkpoints: {len(checkpoints)} saved ({size_str})")
+    else:
+        console.print("[dim]○[/dim] Checkpoints: none yet")
+
+    # Check knowledge
+    if KNOWLEDGE_DIR.exists():
+        knowledge = list_knowledge()
+        console.print(f"[green]✓[/green] Knowledge: {len(knowledge)} items")
+    else:
+        console.print("[dim]○[/dim] Knowledge: none yet")
+
+    # Check file permissions
+    sensitive_files = [CONFIG_PATH, SAGE_DIR / "tuning.yaml"]
+    perm_issues = []
+    for f in sensitive_files:
+        if f.exists():
+            mode = f.stat().st_mode & 0o777
+            if mode != 0o600:
+                perm_issues.append(f"{f.name}: {oct(mode)} (should be 0o600)")
+    if perm_issues:
+        console.print(f"[yellow]![/yellow] File permissions: {len(perm_issues)} issue(s)")
+        for issue in perm_issues:
+            console.print(f"    {issue}")
+            issues.append(f"Fix permissions: chmod 600 {issue.split(':')[0]}")
+    else:
+        console.print("[green]✓[/green] File permissions: OK")
+
+    # Check pending tasks
+    if TASKS_DIR.exists():
+        pending = load_pending_tasks()
+        if pending:
+            console.print(f"[yellow]![/yellow] Pending tasks: {len(pending)} from previous session")
+            issues.append("Pending tasks will be processed on next MCP server start")
+        else:
+            console.print("[green]✓[/green] Pending tasks: none")
+    else:
+        console.print("[dim]○[/dim] Tasks directory: not created yet")
+
+    # Summary
+    console.print()
+    if issues:
+        console.print(f"[yellow]Found {len(issues)} issue(s):[/yellow]")
+        for issue in issues:
+            console.print(f"  • {issue}")
+    else:
+        console.print("[green]All systems healthy![/green]")
+
+
+@main.group()
+def config():
+    """Manage configuration.
+
+    Sage has two config files:
+    - config.yaml: Runtime settings (api_key, model, etc.)
+    - tuning.yaml: Retrieval/detection thresholds (recall_threshold, etc.)
+    """
+    pass
+
+
+@config.command("list")
+def config_list():
+    """Show current configuration.
+
+    Examples:
+        sage config list
+    """
+    cfg = Config.load()
+    effective = get_sage_config()
+    defaults = SageConfig()
+
+    console.print("[bold]Runtime Configuration[/bold] [dim](~/.sage/config.yaml)[/dim]")
+    console.print()
+    api_display = "[not set]"
+    if cfg.api_key:
+        api_display = "*" * 20 + cfg.api_key[-8:]
+    console.print(f"  api_key: {api_display}")
+    console.print(f"  model: {cfg.model}")
+    console.print(f"  max_history: {cfg.max_history}")
+    console.print(f"  cache_ttl: {cfg.cache_ttl}")
+
+    console.print()
+    console.print("[bold]Tuning Configuration[/bold] [dim](tuning.yaml)[/dim]")
+    console.print()
+
+    console.print("  [dim]# Retrieval[/dim]")
+    _show_tuning_value("recall_threshold", effective.recall_threshold, defaults.recall_threshold)
+    _show_tuning_value("dedup_threshold", effective.dedup_threshold, defaults.dedup_threshold)
+    _show_tuning_value("embedding_weight", effective.embedding_weight, defaults.embedding_weight)
+    _show_tuning_value("keyword_weight", effective.keyword_weight, defaults.keyword_weight)
+
+    console.print("  [dim]# Structural detection[/dim]")
+    _show_tuning_value(
+        "topic_drift_threshold", effective.topic_drift_threshold, defaults.topic_drift_threshold
+    )
+    _show_tuning_value(
+        "convergence_question_drop",
+        effective.convergence_question_drop,
+        defaults.convergence_question_drop,
+    )
+    _show_tuning_value(
+        "depth_min_messages", effective.depth_min_messages, defaults.depth_min_messages
+    )
+    _show_tuning_value("depth_min_tokens", effective.depth_min_tokens, defaults.depth_min_tokens)
+
+    console.print("  [dim]# Model[/dim]")
+    _show_tuning_value("embedding_model", effective.embedding_model, defaults.embedding_model)
+
+    console.print("  [dim]# Modules[/dim]")
+    modules_str = ",".join(effective.modules)
+    defaults_str = ",".join(defaults.modules)
+    _show_tuning_value("modules", modules_str, defaults_str)
+
+    console.print()
+    console.print("[dim]sage config set KEY VALUE      Set a value[/dim]")
+    console.print("[dim]sage config set KEY VALUE --project   Set project-level[/dim]")
+    console.print("[dim]sage config reset              Reset tuning to defaults[/dim]")
+
+
+@config.command("set")
+@click.argument("key")
+@click.argument("value")
+@click.option("--project", is_flag=True, help="Set in project-level config")
+def config_set(key: str, value: str, project: bool):
+    """Set a configuration value.
+
+    Examples:
+        sage config set model claude-opus-4
+        sage config set recall_threshold 0.65
+        sage config set recall_threshold 0.60 --project
+    """
+    from pathlib import Path
+
+    # Determine SageConfig location
+    if project:
+        sage_dir = Path.cwd() / ".sage"
+    else:
+        sage_dir = SAGE_DIR
+
+    # Load configs
+    cfg = Config.load()
+    tuning = get_sage_config() if not project else SageConfig.load(sage_dir)
+
+    # Define which keys belong to which config
+    legacy_keys = {"api_key", "model", "max_history", "cache_ttl"}
+    tuning_parsers = _tuning_parsers()
+
+    # Normalize key (allow hyphens)
+    key = key.replace("-", "_")
+
+    if key in legacy_keys:
+        # Runtime Config
+        if key == "api_key":
+            cfg.api_key = value
+        elif key == "model":
+            cfg.model = value
+        elif key == "max_history":
+            try:
+                cfg.max_history = int(value)
+            except ValueError:
+                console.print(f"[red]Invalid integer value: {value}[/red]")
+                sys.exit(1)
+        elif key == "cache_ttl":
+            try:
+                cfg.cache_ttl = int(value)
+            except ValueError:
+                console.print(f"[red]Invalid integer value: {value}[/red]")
+                sys.exit(1)
+        cfg.save()
+        console.print(f"[green]✓[/green] Set {key} (runtime config)")
+
+    elif key in tuning_parsers:
+        # SageConfig (tuning)
+        # Type coercion
+        parse, type_label = tuning_parsers[key]
+        if parse is not None:
+            try:
+                typed_value = parse(value)
+            except ValueError:
+                console.print(f"[red]Invalid {type_label} value: {value}[/red]")
+                sys.exit(1)
+        elif key == "modules":
+            # Special handling for modules tuple - parse comma-separated string
+            typed_value = tuple(m.strip() for m in value.split(",") if m.strip())
+            valid_modules = {"core", "knowledge", "code", "extras"}
+            invalid = set(typed_value) - valid_modules
+            if invalid:
+                console.print(f"[red]Invalid module(s): {invalid}[/red]")
+                console.print(f"[dim]Valid modules: {', '.join(sorted(valid_modules))}[/dim]")
+                sys.exit(1)
+        else:
+            typed_value = value
+
+        # Create new config with updated value
+        current_dict = tuning.to_dict()
+        current_dict[key] = typed_value
+        new_tuning = SageConfig(**current_dict)
+        new_tuning.save(sage_dir)
+
+        location = "project" if project else "user"
+        console.print(f"[green]✓[/green] Set {key} = {typed_value} ({location}-level tuning)")
+    else:
+        console.print(f"[red]Unknown config key: {key}[/red]")
+        console.print()
+        console.print("[dim]Runtime keys: api_key, model, max_history, cache_ttl[/dim]")
+        console.print(
+            "[dim]Tuning keys: recall_threshold, dedup_threshold, embedding_weight, ...[/dim]"
+        )
+        sys.exit(1)
+
+
+@config.command("reset")
+@click.option("--project", is_flag=True, help="Reset project-level config")
+def config_reset(project: bool):
+    """Reset tuning configuration to defaults.
+
+    Examples:
+        sage config reset
+        sage config reset --project
+    """
+    from pathlib import Path
+
+    if project:
+        sage_dir = Path.cwd() / ".sage"
+    else:
+        sage_dir = SAGE_DIR
+
+    defaults = SageConfig()
+    defaults.save(sage_dir)
+    location = "project" if project else "user"
+    console.print(f"[green]✓[/green] Reset tuning config to defaults ({location}-level)")
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean config value (true/false, yes/no, on/off, 1/0)."""
+    normalized = value.strip().lower()
+    if normalized in ("true", "yes", "on", "1"):
+        return True
+    if normalized in ("false", "no", "off", "0"):
+        return False
+    raise ValueError(value)
+
+
+_VALUE_PARSERS: dict[type, tuple[Callable[[str], object], str]] = {
+    bool: (_parse_bool, "boolean"),
+    float: (float, "float"),
+    int: (int, "integer"),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _tuning_parsers() -> dict[str, tuple[Callable[[str], object] | None, str]]:
+    """Map each tuning key to its value parser and type label.
+
+    Built once from SageConfig's fields. String and tuple fields get no
+    parser and are handled case by case in config_set.
+    """
+    return {
+        f.name: _VALUE_PARSERS.get(f.type, (None, "string"))
+        for f in SageConfig.__dataclass_fields__.values()
+    }
+
+
+def _show_tuning_value(key: str, value, default):
+    """Display a tuning value, highlighting if non-default."""
+    if value != default:
+        console.print(f"  {key}: [cyan]{value}[/cyan] [dim](default: {default})[/dim]")
+    else:
+        console.print(f"  {key}: {value}")
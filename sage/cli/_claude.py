@@ -0,0 +1,38 @@
+"""Helpers for Claude Code's JSON config files.
+
+``~/.claude/settings.json`` (hooks) and ``~/.claude.json`` (MCP servers)
+belong to Claude Code, so they are replaced atomically: a crash mid-write
+must never leave the user with a truncated config.
+"""
+
+import json
+import stat
+from pathlib import Path
+from typing import Any
+
+from sage.errors import Result, SageError
+
+CLAUDE_DIR = Path.home() / ".claude"
+CLAUDE_HOOKS_DIR = CLAUDE_DIR / "hooks"
+CLAUDE_SETTINGS_PATH = CLAUDE_DIR / "settings.json"
+CLAUDE_JSON_PATH = Path.home() / ".claude.json"
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON config file.
+
+    Raises FileNotFoundError if it is missing and json.JSONDecodeError if
+    it cannot be parsed.
+    """
+    return json.loads(path.read_bytes())
+
+
+def write_json(path: Path, data: Any) -> Result[Path, SageError]:
+    """Atomically replace a JSON config file, keeping its permissions."""
+    from sage.atomic import atomic_write_json
+
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o600
+    return atomic_write_json(path, data, mode=mode)
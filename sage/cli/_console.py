@@ -0,0 +1,79 @@
+"""Shared Rich console for CLI commands.
+
+Rich is only imported the first time something is printed, so commands
+that never touch the console (and ``--version``/``--help``) skip it.
+"""
+
+import sys
+from collections.abc import Collection, Iterable, Sequence
+from itertools import islice
+
+# Above this many rows, tables are printed as plain aligned text: Rich's
+# per-row layout cost turns listings of thousands of items into seconds.
+PLAIN_TABLE_THRESHOLD = 2000
+
+_console = None
+
+
+def get_console():
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+class _LazyConsole:
+    """Stand-in that forwards attribute access to the real console."""
+
+    def __getattr__(self, name):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
+
+
+def truncate(text: str, width: int) -> str:
+    """Cut ``text`` to ``width`` characters, marking the cut with "..."."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def print_table(
+    columns: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    right: Collection[str] = (),
+    plain_threshold: int = PLAIN_TABLE_THRESHOLD,
+) -> None:
+    """Print rows under the given column headers.
+
+    Small tables go through a Rich ``Table``. Once there are more than
+    ``plain_threshold`` rows, column widths are measured in one pass and
+    the rows are written as plain text, with no per-row Rich layout.
+    Columns named in ``right`` are right-justified.
+    """
+    rows = iter(rows)
+    head = list(islice(rows, plain_threshold + 1))
+
+    if len(head) <= plain_threshold:
+        from rich.table import Table
+
+        table = Table()
+        for name in columns:
+            table.add_column(name, justify="right" if name in right else "left")
+        for row in head:
+            table.add_row(*row)
+        console.print(table)
+        return
+
+    all_rows = [columns, *head, *rows]
+    widths = [max(map(len, cells)) for cells in zip(*all_rows, strict=True)]
+    pads = [str.rjust if name in right else str.ljust for name in columns]
+    sys.stdout.write(
+        "".join(
+            "  ".join(pad(cell, width) for pad, cell, width in zip(pads, row, widths)).rstrip()
+            + "\n"
+            for row in all_rows
+        )
+    )
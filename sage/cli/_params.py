@@ -0,0 +1,19 @@
+"""Parameter checks shared by CLI commands.
+
+File options are declared as plain ``click.Path()`` and checked here, in
+the command body, so Click does no filesystem work while parsing.
+"""
+
+import os
+
+import click
+
+
+def require_file(path: str | None, param_hint: str) -> None:
+    """Raise a usage error unless ``path`` is unset or an existing file."""
+    if path is not None and not os.path.isfile(path):
+        raise click.BadParameter(
+            f"File '{path}' does not exist or is not a file.",
+            ctx=click.get_current_context(silent=True),
+            param_hint=param_hint,
+        )
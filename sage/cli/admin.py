@@ -0,0 +1,128 @@
+"""Administrative maintenance commands."""
+
+import click
+
+from sage.cli._console import console
+
+
+@click.group()
+def admin():
+    """Administrative commands for Sage maintenance."""
+    pass
+
+
+@admin.command("rebuild-embeddings")
+@click.option("--force", "-f", is_flag=True, help="Rebuild even if model hasn't changed")
+def admin_rebuild_embeddings(force):
+    """Rebuild all embeddings after model change.
+
+    Use this after changing the embedding_model config to regenerate all
+    stored embeddings with the new model. This ensures consistent similarity
+    scores across all knowledge items and checkpoints.
+
+    Note: For the MCP server to use the new model, also call sage_reload_config
+    via Claude, or restart Claude Code.
+    """
+    from sage import embeddings
+    from sage.checkpoint import (
+        _get_checkpoint_embedding_store,
+        _save_checkpoint_embedding_store,
+        list_checkpoints,
+    )
+    from sage.config import detect_project_root
+    from sage.knowledge import _get_embedding_store, _save_embedding_store, list_knowledge
+
+    project_root = detect_project_root()
+
+    # Check for model mismatch
+    is_mismatch, stored_model, current_model = embeddings.check_model_mismatch()
+
+    if not is_mismatch and not force:
+        console.print(f"[yellow]Embeddings already use {current_model}[/yellow]")
+        console.print("[dim]Use --force to rebuild anyway[/dim]")
+        return
+
+    if is_mismatch:
+        console.print(f"[bold]Model changed: {stored_model} -> {current_model}[/bold]")
+    else:
+        console.print(f"[bold]Force rebuilding embeddings for: {current_model}[/bold]")
+
+    console.print()
+
+    # Rebuild knowledge embeddings
+    knowledge_items = list_knowledge()
+    if knowledge_items:
+        console.print(f"Rebuilding {len(knowledge_items)} knowledge embeddings...")
+
+        # Load knowledge store (will be empty due to mismatch detection)
+        store = _get_embedding_store()
+
+        # Rebuild each item, then add them to the store in one go
+        ids, vectors = [], []
+        for item in knowledge_items:
+            result = embeddings.get_embedding(item.content)
+            if result.is_err():
+                console.print(f"  [red]✗[/red] {item.id}: {result.unwrap_err().message}")
+                continue
+            ids.append(item.id)
+            vectors.append(result.unwrap())
+            console.print(f"  [green]✓[/green] {item.id}")
+        store = store.add_many(ids, vectors)
+
+        # Save rebuilt store
+        _save_embedding_store(store)
+        console.print(f"[green]✓[/green] Saved {len(store)} knowledge embeddings")
+    else:
+        console.print("[dim]No knowledge items to rebuild[/dim]")
+
+    console.print()
+
+    # Rebuild checkpoint embeddings
+    checkpoints = list_checkpoints(project_path=project_root, limit=100)
+    if checkpoints:
+        console.print(f"Rebuilding {len(checkpoints)} checkpoint embeddings...")
+
+        # Load checkpoint store (will be empty due to mismatch detection)
+        store = _get_checkpoint_embedding_store()
+
+        # Rebuild each checkpoint, then add them to the store in one go
+        ids, vectors = [], []
+        for cp in checkpoints:
+            result = embeddings.get_embedding(cp.thesis)
+            if result.is_err():
+                console.print(f"  [red]✗[/red] {cp.id[:30]}: {result.unwrap_err().message}")
+                continue
+            ids.append(cp.id)
+            vectors.append(result.unwrap())
+            console.print(f"  [green]✓[/green] {cp.id[:30]}...")
+        store = store.add_many(ids, vectors)
+
+        # Save rebuilt store
+        _save_checkpoint_embedding_store(store)
+        console.print(f"[green]✓[/green] Saved {len(store)} checkpoint embeddings")
+    else:
+        console.print("[dim]No checkpoints to rebuild[/dim]")
+
+    console.print()
+    console.print("[bold]Embeddings rebuilt![/bold]")
+    console.print()
+    console.print("[dim]If using MCP server, call sage_reload_config via Claude[/dim]")
+    console.print("[dim]or restart Claude Code to pick up the new embeddings.[/dim]")
+
+
+@admin.command("clear-cache")
+def admin_clear_cache():
+    """Clear all cached data (embeddings, etc.)."""
+    import shutil
+
+    from sage.config import SAGE_DIR
+
+    embeddings_dir = SAGE_DIR / "embeddings"
+
+    if not embeddings_dir.exists():
+        console.print("[yellow]No cache to clear[/yellow]")
+        return
+
+    shutil.rmtree(embeddings_dir)
+    console.print(f"[green]✓[/green] Cleared {embeddings_dir}")
+    console.print("[dim]Embeddings will be regenerated on next use[/dim]")
@@ -0,0 +1,193 @@
+"""Checkpoint commands."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from sage.cli._console import console, print_table, truncate
+
+
+@click.group()
+def checkpoint():
+    """Manage research checkpoints."""
+    pass
+
+
+@checkpoint.command("list")
+@click.option("--skill", "-s", help="Filter by skill")
+@click.option("--limit", "-n", default=10, help="Number of checkpoints to show")
+def checkpoint_list(skill, limit):
+    """List saved checkpoints."""
+    from sage.checkpoint import list_checkpoints
+    from sage.config import detect_project_root
+
+    project_root = detect_project_root()
+    checkpoints = list_checkpoints(project_path=project_root, skill=skill, limit=limit)
+
+    if not checkpoints:
+        console.print("[yellow]No checkpoints found.[/yellow]")
+        console.print("Create one with: /checkpoint in Claude Code or sage checkpoint save")
+        return
+
+    def rows():
+        for cp in checkpoints:
+            # Handle both datetime objects and ISO strings
+            if hasattr(cp.ts, "strftime"):
+                ts = cp.ts.strftime("%Y-%m-%d %H:%M")
+            else:
+                ts = str(cp.ts)[:16].replace("T", " ")
+
+            yield (
+                truncate(cp.id, 30),
+                cp.trigger,
+                truncate(cp.thesis, 40),
+                f"{cp.confidence:.0%}",
+                ts,
+            )
+
+    print_table(("ID", "TRIGGER", "THESIS", "CONF", "SAVED"), rows(), right={"CONF"})
+
+
+@checkpoint.command("show")
+@click.argument("checkpoint_id")
+def checkpoint_show(checkpoint_id):
+    """Show details of a checkpoint."""
+    from sage.checkpoint import format_checkpoint_for_context, load_checkpoint
+    from sage.config import detect_project_root
+
+    project_root = detect_project_root()
+    cp = load_checkpoint(checkpoint_id, project_path=project_root)
+
+    if not cp:
+        console.print(f"[red]Checkpoint '{checkpoint_id}' not found[/red]")
+        return
+
+    console.print(format_checkpoint_for_context(cp))
+
+
+@checkpoint.command("restore")
+@click.argument("checkpoint_id")
+@click.argument("skill")
+def checkpoint_restore(checkpoint_id, skill):
+    """Restore a checkpoint and start a query with its context."""
+    from sage.checkpoint import format_checkpoint_for_context, load_checkpoint
+    from sage.config import detect_project_root
+
+    project_root = detect_project_root()
+    cp = load_checkpoint(checkpoint_id, project_path=project_root)
+
+    if not cp:
+        console.print(f"[red]Checkpoint '{checkpoint_id}' not found[/red]")
+        return
+
+    # Show what's being restored
+    console.print(f"[bold]Restoring checkpoint:[/bold] {cp.id}")
+    console.print(
+        f"  Thesis: {cp.thesis[:60]}..." if len(cp.thesis) > 60 else f"  Thesis: {cp.thesis}"
+    )
+    console.print(f"  Confidence: {cp.confidence:.0%}")
+    console.print(f"  Open questions: {len(cp.open_questions)}")
+    console.print(f"  Sources: {len(cp.sources)}")
+    console.print()
+
+    # Format context for injection
+    context = format_checkpoint_for_context(cp)
+    console.print("[dim]Checkpoint context ready. Use with:[/dim]")
+    console.print(
+        f'[dim]  sage ask {skill} "<your question>" --input <checkpoint-context-file>[/dim]'
+    )
+    console.print()
+    console.print("[bold]Or copy this context:[/bold]")
+    console.print()
+    console.print(context)
+
+
+@checkpoint.command("rm")
+@click.argument("checkpoint_id")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+def checkpoint_rm(checkpoint_id, force):
+    """Delete a checkpoint."""
+    from sage.checkpoint import delete_checkpoint
+
+    if not force:
+        if not click.confirm(f"Delete checkpoint '{checkpoint_id}'?"):
+            console.print("Cancelled.")
+            return
+
+    if delete_checkpoint(checkpoint_id):
+        console.print(f"[green]✓[/green] Deleted: {checkpoint_id}")
+    else:
+        console.print(f"[red]Checkpoint '{checkpoint_id}' not found[/red]")
+
+
+@checkpoint.command("post-compact")
+@click.option("--project", "-p", type=click.Path(exists=True), help="Project directory")
+@click.option(
+    "--transcript", "-t", type=click.Path(exists=True), help="Transcript file path"
+)
+def checkpoint_post_compact(project, transcript):
+    """Save recovery checkpoint after compaction with the summary.
+
+    Called automatically by SessionStart hook when source is 'compact'.
+    Reads the compaction summary from the transcript and uses it as the
+    checkpoint thesis for high-quality context restoration.
+    """
+    from sage.config import detect_project_root
+    from sage.watcher import find_active_transcript
+
+    project_path = Path(project) if project else detect_project_root()
+
+    # Use provided transcript or find active one
+    if transcript:
+        transcript_path = Path(transcript)
+    else:
+        transcript_path = find_active_transcript(project_path)
+
+    if not transcript_path or not transcript_path.exists():
+        print("No transcript found, skipping post-compact checkpoint", file=sys.stderr)
+        return
+
+    try:
+        from sage.recovery import (
+            extract_recovery_checkpoint,
+            save_recovery_checkpoint,
+        )
+        from sage.transcript import get_compaction_summary, read_full_transcript
+
+        # Read transcript to find compaction summary
+        window = read_full_transcript(transcript_path, max_entries=500)
+
+        if window.is_empty:
+            print("Empty transcript, skipping post-compact checkpoint", file=sys.stderr)
+            return
+
+        # Get the compaction summary
+        compaction_summary = get_compaction_summary(window)
+
+        if not compaction_summary:
+            print(
+                "No compaction summary found in transcript, skipping", file=sys.stderr
+            )
+            return
+
+        # Extract recovery checkpoint with the summary
+        checkpoint = extract_recovery_checkpoint(
+            window=window,
+            trigger="postcompact",
+            use_claude=False,  # Use the summary directly, no LLM needed
+            compaction_summary=compaction_summary,
+        )
+
+        # Save to project-local
+        save_recovery_checkpoint(checkpoint, project_path=project_path)
+        print(
+            f"Post-compact checkpoint saved: {checkpoint.id} "
+            f"(summary: {len(compaction_summary)} chars)",
+            file=sys.stderr,
+        )
+
+    except ImportError as e:
+        print(f"Recovery modules not available: {e}", file=sys.stderr)
+    except Exception as e:
+        print(f"Failed to save post-compact checkpoint: {e}", file=sys.stderr)
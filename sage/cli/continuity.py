@@ -0,0 +1,234 @@
+"""Session continuity marker commands."""
+
+import sys
+
+import click
+
+from sage.cli._console import console
+
+
+@click.group()
+def continuity():
+    """Manage session continuity markers.
+
+    Continuity markers are created by the watcher when compaction is detected.
+    The marker tells Sage to inject checkpoint context on the next tool call.
+    """
+    pass
+
+
+@continuity.command("status")
+def continuity_status():
+    """Show current continuity status."""
+    from sage.config import detect_project_root, get_sage_config
+    from sage.continuity import (
+        get_continuity_marker,
+        get_most_recent_checkpoint,
+        has_pending_continuity,
+    )
+    from sage.watcher import get_watcher_status
+
+    config = get_sage_config()
+    project_root = detect_project_root()
+
+    console.print("[bold]Session Continuity Status[/bold]")
+    console.print("─" * 40)
+
+    # Config status
+    if config.continuity_enabled:
+        console.print("[green]✓[/green] Continuity enabled")
+    else:
+        console.print("[yellow]○[/yellow] Continuity disabled")
+        console.print("  [dim]Enable: sage config set continuity_enabled true[/dim]")
+
+    # Watcher status
+    watcher = get_watcher_status()
+    if watcher["running"]:
+        console.print(f"[green]✓[/green] Watcher running (PID {watcher['pid']})")
+    else:
+        console.print("[dim]○[/dim] Watcher not running")
+        console.print("  [dim]Start: sage watcher start[/dim]")
+
+    # Pending marker
+    console.print()
+    if has_pending_continuity(project_root):
+        marker = get_continuity_marker(project_root)
+        console.print("[yellow]⚡[/yellow] Pending continuity marker!")
+        if marker:
+            console.print(f"  Reason: {marker.get('reason', 'unknown')}")
+            console.print(f"  Marked at: {marker.get('marked_at', 'unknown')}")
+            if marker.get("checkpoint_id"):
+                console.print(f"  Checkpoint: {marker['checkpoint_id']}")
+            if marker.get("compaction_summary"):
+                summary = marker["compaction_summary"][:100]
+                console.print(f"  Summary: {summary}...")
+        console.print()
+        console.print("[dim]Context will be injected on next sage tool call[/dim]")
+    else:
+        console.print("[dim]○[/dim] No pending continuity")
+
+    # Most recent checkpoint
+    console.print()
+    recent_cp = get_most_recent_checkpoint(project_root)
+    if recent_cp:
+        console.print(f"[dim]Most recent checkpoint: {recent_cp.name}[/dim]")
+    else:
+        console.print("[dim]No checkpoints saved yet[/dim]")
+
+
+@continuity.command("clear")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+def continuity_clear(force):
+    """Clear pending continuity marker.
+
+    Use this if you want to skip automatic context injection after compaction.
+    """
+    from sage.config import detect_project_root
+    from sage.continuity import clear_continuity, has_pending_continuity
+
+    project_root = detect_project_root()
+
+    if not has_pending_continuity(project_root):
+        console.print("[yellow]No pending continuity marker[/yellow]")
+        return
+
+    if not force:
+        if not click.confirm("Clear pending continuity marker?"):
+            console.print("Cancelled.")
+            return
+
+    clear_continuity(project_root)
+    console.print("[green]✓[/green] Continuity marker cleared")
+
+
+@continuity.command("mark")
+@click.option("--reason", "-r", default="manual", help="Reason for marking")
+def continuity_mark(reason):
+    """Manually create a continuity marker.
+
+    This is mainly for testing. The marker will trigger context injection
+    on the next sage MCP tool call.
+    """
+    from sage.config import detect_project_root
+    from sage.continuity import mark_for_continuity
+
+    project_root = detect_project_root()
+    result = mark_for_continuity(reason=reason, project_dir=project_root)
+
+    if result.ok:
+        console.print("[green]✓[/green] Continuity marker created")
+        console.print(f"  Reason: {reason}")
+        console.print(f"  Marker: {result.value}")
+        console.print()
+        console.print("[dim]Context will be injected on next sage tool call[/dim]")
+    else:
+        console.print(f"[red]Failed to create marker: {result.unwrap_err().message}[/red]")
+        sys.exit(1)
+
+
+@continuity.command("inject")
+def continuity_inject():
+    """Output continuity context for hook injection.
+
+    This command is designed to be called from SessionStart hooks.
+    It outputs raw context (no formatting) that gets injected into
+    Claude's context at session start.
+
+    If there's no pending continuity, outputs nothing.
+    """
+    from sage.checkpoint import format_checkpoint_for_context, load_checkpoint
+    from sage.config import detect_project_root, get_sage_config
+    from sage.continuity import clear_continuity, get_continuity_marker, has_pending_continuity
+    from sage.session import get_pending_injections
+
+    config = get_sage_config()
+    project_root = detect_project_root()
+
+    if not config.continuity_enabled:
+        return
+
+    # Check for pending marker or queued checkpoints (project-scoped)
+    has_marker = has_pending_continuity(project_root)
+    marker = get_continuity_marker(project_root) if has_marker else None
+
+    try:
+        queued = get_pending_injections()
+    except Exception:
+        queued = []
+
+    if not marker and not queued:
+        return
+
+    # Build output with prominent header
+    lines = [
+        "",
+        "╔══════════════════════════════════════════════════════════════════════╗",
+        "║  SAGE: Session context restored from checkpoint                      ║",
+        "╚══════════════════════════════════════════════════════════════════════╝",
+        "",
+    ]
+
+    # Load checkpoint from marker - this is the PRIMARY source of truth
+    injected_ids = []
+    checkpoint_id = marker.get("checkpoint_id") if marker else None
+    has_quality_checkpoint = False
+
+    if checkpoint_id:
+        checkpoint = load_checkpoint(checkpoint_id, project_path=project_root)
+        if checkpoint:
+            # Check if this is a quality checkpoint (not just a recovery stub)
+            is_quality = (
+                checkpoint.get("confidence", 0) > 0
+                or (checkpoint.get("thesis") or "").strip()
+                or len(checkpoint.get("open_questions", []) or []) > 0
+            )
+            if is_quality:
+                has_quality_checkpoint = True
+            lines.append("**Last Checkpoint:**")
+            lines.append(format_checkpoint_for_context(checkpoint))
+            injected_ids.append(checkpoint_id)
+
+    # Load queued checkpoints (up to 3)
+    if queued:
+        lines.append("")
+        lines.append("**Session Checkpoints:**")
+        for entry in queued[:3]:
+            if entry.checkpoint_id in injected_ids:
+                continue
+            checkpoint = load_checkpoint(entry.checkpoint_id, project_path=project_root)
+            if checkpoint:
+                lines.append(f"*[{entry.checkpoint_type}]*")
+                lines.append(format_checkpoint_for_context(checkpoint))
+                injected_ids.append(entry.checkpoint_id)
+                # Check if any queued checkpoint is quality
+                if checkpoint.get("confidence", 0) > 0 or (checkpoint.get("thesis") or ""):
+                    has_quality_checkpoint = True
+
+    # Include compaction summary:
+    # - If we have a quality checkpoint: skip it (checkpoint is higher signal)
+    # - If no quality checkpoint: include as fallback context
+    if marker and marker.get("compaction_summary"):
+        if has_quality_checkpoint:
+            # Quality checkpoint exists - the summary is redundant/lower signal
+            # Just note that it was available but skipped
+            lines.append("")
+            lines.append("*[Compaction summary omitted - checkpoint has higher signal]*")
+        else:
+            # No quality checkpoint - include summary as fallback
+            summary = marker["compaction_summary"]
+            if len(summary) > 3000:
+                summary = summary[:3000] + "..."
+            lines.append("")
+            lines.append("**Claude Code Compaction Summary:**")
+            lines.append("*(No quality checkpoint available - using compaction summary as fallback)*")
+            lines.append(summary)
+
+    lines.append("")
+    lines.append("╚══════════════════════════════════════════════════════════════════════╝")
+
+    # Output raw (no Rich formatting - this goes to Claude's context)
+    print("\n".join(lines))
+
+    # Clear marker after injection
+    if marker:
+        clear_continuity(project_root)
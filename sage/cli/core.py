@@ -0,0 +1,703 @@
+"""Top-level skill and query commands (new, ask, list, history, ...)."""
+
+import re
+import sys
+
+import click
+
+from sage.cli._console import console, print_table, truncate
+from sage.cli._params import require_file
+from sage.errors import format_error
+
+# Buffer size for streaming `ask --output` responses to disk
+_OUTPUT_BUFFER_SIZE = 256 * 1024
+
+# A shared-memory insight: a line that reads "- <text>" once stripped
+_INSIGHT_LINE = re.compile(r"^[^\S\n]*- .*\S.*$", re.MULTILINE)
+
+
+def _output_file_mode(path) -> int:
+    """Mode for an --output file: keep an existing file's, else the umask default."""
+    import os
+    import stat
+
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+@click.command()
+@click.argument("query")
+@click.option("--skill", "-s", default="", help="Skill context for knowledge matching")
+@click.option("--knowledge-only", "-k", is_flag=True, help="Only show knowledge matches")
+@click.option("--checkpoints-only", "-c", is_flag=True, help="Only show checkpoint matches")
+def debug(query, skill, knowledge_only, checkpoints_only):
+    """Debug retrieval scoring for a query.
+
+    Shows what knowledge and checkpoints would match, with detailed
+    score breakdowns and near-miss analysis for threshold tuning.
+    """
+    from sage import embeddings
+    from sage.checkpoint import _get_checkpoint_embedding_store, list_checkpoints
+    from sage.config import detect_project_root, get_sage_config
+    from sage.knowledge import (
+        _get_all_embedding_similarities,
+        get_type_threshold,
+        load_index,
+        score_item_combined,
+    )
+
+    project_root = detect_project_root()
+    config = get_sage_config()
+    show_knowledge = not checkpoints_only
+    show_checkpoints = not knowledge_only
+
+    console.print(f"[bold]Debug Query:[/bold] \"{query}\"")
+    console.print(f"[dim]Skill context: {skill or '(none)'}[/dim]")
+    console.print()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Knowledge Scoring
+    # ─────────────────────────────────────────────────────────────────────────
+    if show_knowledge:
+        console.print("[bold cyan]═══ Knowledge Matches ═══[/bold cyan]")
+        console.print(f"[dim]Weights: embedding={config.embedding_weight:.0%}, keyword={config.keyword_weight:.0%}[/dim]")
+        console.print()
+
+        items = load_index()
+        if not items:
+            console.print("[yellow]No knowledge items found.[/yellow]")
+        else:
+            # Get embedding similarities
+            embedding_sims = {}
+            if embeddings.is_available():
+                embedding_sims = _get_all_embedding_similarities(query)
+
+            # Score all items
+            scored = []
+            for item in items:
+                sim = embedding_sims.get(item.id)
+                score = score_item_combined(item, query, skill, sim)
+                threshold = get_type_threshold(item.item_type)
+                scored.append((item, score, sim, threshold))
+
+            # Sort by score descending
+            scored.sort(key=lambda x: x[1], reverse=True)
+
+            # Separate above/below threshold
+            above = [(i, s, sim, t) for i, s, sim, t in scored if s >= t]
+            near_miss = [(i, s, sim, t) for i, s, sim, t in scored if t - 2.0 <= s < t]
+
+            if above:
+                console.print(f"[green]Would recall ({len(above)} items):[/green]")
+                for item, score, sim, threshold in above:
+                    sim_str = f"emb={sim:.2f}" if sim is not None else "emb=N/A"
+                    console.print(f"  [green]✓[/green] {item.id}")
+                    console.print(f"      score={score:.2f} ({sim_str}) threshold={threshold:.1f} type={item.item_type}")
+                    console.print(f"      keywords: {', '.join(item.triggers.keywords[:5])}")
+                console.print()
+            else:
+                console.print("[yellow]No items above threshold.[/yellow]")
+                console.print()
+
+            if near_miss:
+                console.print(f"[yellow]Near misses ({len(near_miss)} items within 2.0 of threshold):[/yellow]")
+                for item, score, sim, threshold in near_miss:
+                    sim_str = f"emb={sim:.2f}" if sim is not None else "emb=N/A"
+                    gap = threshold - score
+                    console.print(f"  [yellow]✗[/yellow] {item.id}")
+                    console.print(f"      score={score:.2f} ({sim_str}) threshold={threshold:.1f} gap={gap:.2f}")
+                    console.print(f"      keywords: {', '.join(item.triggers.keywords[:5])}")
+
+                # Threshold suggestion
+                highest_miss_score = max(s for _, s, _, _ in near_miss)
+                suggested = (highest_miss_score / 10.0) - 0.01  # Convert to 0-1 scale
+                console.print()
+                console.print(f"[dim]Tip: `sage config set recall_threshold {suggested:.2f}` would include more items[/dim]")
+                console.print()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Checkpoint Scoring
+    # ─────────────────────────────────────────────────────────────────────────
+    if show_checkpoints:
+        console.print("[bold cyan]═══ Checkpoint Matches ═══[/bold cyan]")
+
+        if not embeddings.is_available():
+            console.print("[yellow]Embeddings not available for checkpoint search.[/yellow]")
+        else:
+            checkpoints = list_checkpoints(project_path=project_root, limit=50)
+            if not checkpoints:
+                console.print("[yellow]No checkpoints found.[/yellow]")
+            else:
+                # Get query embedding
+                result = embeddings.get_query_embedding(query)
+                if result.is_err():
+                    console.print(f"[red]Failed to embed query: {result.unwrap_err().message}[/red]")
+                else:
+                    query_emb = result.unwrap()
+                    store = _get_checkpoint_embedding_store()
+
+                    # Score checkpoints
+                    scored = []
+                    for cp in checkpoints:
+                        cp_emb = store.get(cp.id)
+                        if cp_emb is not None:
+                            sim = float(embeddings.cosine_similarity(query_emb, cp_emb))
+                            scored.append((cp, sim))
+
+                    if not scored:
+                        console.print("[yellow]No checkpoints with embeddings found.[/yellow]")
+                    else:
+                        scored.sort(key=lambda x: x[1], reverse=True)
+
+                        # Show top matches (similarity > 0.5) and near-misses (0.3-0.5)
+                        matches = [(cp, sim) for cp, sim in scored if sim >= 0.5]
+                        near_miss = [(cp, sim) for cp, sim in scored if 0.3 <= sim < 0.5]
+
+                        if matches:
+                            console.print(f"[green]Relevant checkpoints ({len(matches)}):[/green]")
+                            for cp, sim in matches[:5]:
+                                console.print(f"  [green]✓[/green] {cp.id} (similarity={sim:.2f})")
+                                console.print(f"      {cp.thesis[:80]}...")
+                            console.print()
+                        else:
+                            console.print("[yellow]No highly relevant checkpoints (similarity < 0.5).[/yellow]")
+                            console.print()
+
+                        if near_miss:
+                            console.print(f"[yellow]Potentially related ({len(near_miss)}):[/yellow]")
+                            for cp, sim in near_miss[:3]:
+                                console.print(f"  [yellow]~[/yellow] {cp.id} (similarity={sim:.2f})")
+                                console.print(f"      {cp.thesis[:80]}...")
+                            console.print()
+
+
+@click.command()
+@click.argument("name")
+@click.option("--description", "-d", help="Skill domain expertise description")
+@click.option("--docs", multiple=True, type=click.Path(), help="Doc files to include")
+def new(name, description, docs):
+    """Create a new research skill."""
+    import shutil
+    from pathlib import Path
+
+    from sage.config import ensure_directories, get_skill_path
+    from sage.skill import create_skill
+
+    for doc in docs:
+        require_file(doc, "'--docs'")
+
+    ensure_directories()
+
+    # Interactive if no description provided
+    if not description:
+        console.print(f"[bold]Creating skill: {name}[/bold]")
+        console.print()
+        description = click.prompt("Describe this skill's domain expertise")
+
+    result = create_skill(name, description)
+    if not result.ok:
+        console.print(f"[red]{format_error(result.error)}[/red]")
+        sys.exit(1)
+
+    console.print(f"[green]✓[/green] Created skill: {name}")
+    console.print(f"  Skill: ~/.claude/skills/{name}/SKILL.md")
+    console.print(f"  Metadata: ~/.sage/skills/{name}/")
+
+    # Copy docs if provided
+    if docs:
+        # create_skill made this directory; copyfile skips copy()'s chmod
+        skill_docs = get_skill_path(name) / "docs"
+        for doc in docs:
+            src = Path(doc)
+            shutil.copyfile(src, skill_docs / src.name)
+            console.print(f"  [green]✓[/green] Added doc: {src.name}")
+
+
+@click.command()
+@click.argument("name")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+def rm(name, force):
+    """Delete a research skill."""
+    import shutil
+
+    from sage.config import get_sage_skill_path, get_skill_path
+
+    skill_path = get_skill_path(name)
+    sage_path = get_sage_skill_path(name)
+
+    if not skill_path.exists():
+        console.print(f"[red]Skill '{name}' not found[/red]")
+        sys.exit(1)
+
+    if not force:
+        if not click.confirm(f"Delete skill '{name}'? This removes all history and sessions."):
+            console.print("Cancelled.")
+            return
+
+    # Remove both directories; rmtree's own lstat covers a missing one
+    for path in (skill_path, sage_path):
+        try:
+            shutil.rmtree(path)
+        except FileNotFoundError:
+            pass
+
+    console.print(f"[green]✓[/green] Deleted skill: {name}")
+
+
+@click.command()
+@click.argument("skill")
+@click.argument("query")
+@click.option("--no-search", is_flag=True, help="Disable web search")
+@click.option("--model", help="Override model")
+@click.option("--input", "input_file", type=click.Path(), help="Read file as context")
+@click.option("--output", "output_file", type=click.Path(), help="Write response to file")
+@click.option("--stdout", "to_stdout", is_flag=True, help="Write to stdout (for piping)")
+def ask(skill, query, no_search, model, input_file, output_file, to_stdout):
+    """One-shot question with skill context."""
+    import os
+    import tempfile
+    from pathlib import Path
+
+    from sage.client import Message, create_client, send_message
+    from sage.config import Config
+    from sage.history import append_entry, create_entry
+    from sage.knowledge import format_recalled_context, recall_knowledge
+    from sage.skill import build_context, load_skill
+
+    require_file(input_file, "'--input'")
+    config = Config.load()
+
+    # Load skill
+    skill_result = load_skill(skill)
+    if not skill_result.ok:
+        console.print(f"[red]{format_error(skill_result.error)}[/red]")
+        sys.exit(1)
+
+    skill_data = skill_result.value
+
+    # Create client
+    client_result = create_client(config)
+    if not client_result.ok:
+        console.print(f"[red]{format_error(client_result.error)}[/red]")
+        sys.exit(1)
+
+    client = client_result.value
+
+    # Build context
+    system = build_context(skill_data)
+
+    # Recall relevant knowledge
+    recall_result = recall_knowledge(query, skill)
+    if recall_result.count > 0:
+        console.print(f"📚 [dim]Knowledge recalled ({recall_result.count})[/dim]")
+        for item in recall_result.items:
+            console.print(f"   [dim]├─ {item.id} (~{item.metadata.tokens} tokens)[/dim]")
+        system += format_recalled_context(recall_result)
+
+    # Add input file content if provided. Pieces are joined once at the end
+    # so large inputs are copied a single time, not once per concatenation.
+    query_parts = [query]
+    if input_file:
+        with open(input_file) as f:
+            query_parts += ["\n\n---\n\nFile content:\n\n", f.read()]
+
+    # Check for stdin
+    if not sys.stdin.isatty():
+        stdin_content = sys.stdin.read()
+        if stdin_content.strip():
+            query_parts += ["\n\n---\n\nInput:\n\n", stdin_content]
+    query = "".join(query_parts)
+
+    messages = [Message(role="user", content=query)]
+
+    # Output handling. With --output, chunks are streamed straight into a
+    # buffered temp file next to the target, which only replaces the target
+    # once the request succeeds; a failure leaves any existing file alone.
+    out = None
+    if output_file:
+        target = Path(output_file)
+        out = tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            buffering=_OUTPUT_BUFFER_SIZE,
+            dir=target.parent,
+            prefix=f".{target.name}.",
+            suffix=".tmp",
+            delete=False,
+        )
+    interactive = not to_stdout and out is None
+
+    def on_text(text: str):
+        if out is not None:
+            out.write(text)
+        elif interactive:
+            # Model text is not Rich markup: write it as-is rather than
+            # having the console parse and style every chunk.
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    # Send message
+    if interactive:
+        console.print()
+
+    try:
+        result = send_message(
+            client=client,
+            system=system,
+            messages=messages,
+            model=model or config.model,
+            enable_search=not no_search,
+            on_text=on_text,
+        )
+        if out is not None:
+            out.close()
+            if result.ok:
+                # Temp files are created 0600; give it the mode open() would have
+                os.chmod(out.name, _output_file_mode(target))
+                os.replace(out.name, target)
+    finally:
+        if out is not None:
+            out.close()
+            Path(out.name).unlink(missing_ok=True)  # Already gone after os.replace
+
+    if not result.ok:
+        console.print(f"\n[red]{format_error(result.error)}[/red]")
+        sys.exit(1)
+
+    response = result.value
+
+    if interactive:
+        console.print()
+        console.print()
+
+    # Write output
+    if out is not None:
+        console.print(f"[green]✓[/green] Written to {output_file}")
+    elif to_stdout:
+        print(response.content)
+
+    # Log to history
+    entry = create_entry(
+        entry_type="ask",
+        query=query,
+        model=model or config.model,
+        tokens_in=response.tokens_in,
+        tokens_out=response.tokens_out,
+        searches=response.searches,
+        cache_hits=response.cache_read,
+        response=response.content,
+    )
+    append_entry(skill, entry)
+
+
+@click.command("list")
+def list_cmd():
+    """List all Sage-managed skills."""
+    from rich.table import Table
+
+    from sage.skill import get_all_skill_info
+
+    skills = get_all_skill_info()
+
+    if not skills:
+        console.print("[yellow]No skills found.[/yellow]")
+        console.print("Create one with: sage new <name>")
+        return
+
+    table = Table()
+    table.add_column("SKILL")
+    table.add_column("DOCS", justify="right")
+    table.add_column("HISTORY", justify="right")
+    table.add_column("SESSIONS", justify="right")
+    table.add_column("LAST ACTIVE")
+
+    for skill_name, info in skills.items():
+        last_active = info["last_active"]
+        if last_active:
+            # Format: just date and time
+            last_active = last_active[:16].replace("T", " ")
+
+        table.add_row(
+            skill_name,
+            str(info["doc_count"]),
+            str(info["history_count"]),
+            str(info["session_count"]),
+            last_active or "-",
+        )
+
+    console.print(table)
+
+    # Show shared memory count
+    from sage.config import SHARED_MEMORY_PATH
+
+    if SHARED_MEMORY_PATH.exists():
+        # Count insight lines, streaming rather than loading the file
+        with open(SHARED_MEMORY_PATH) as f:
+            insights = sum(1 for line in f if _INSIGHT_LINE.match(line))
+        if insights:
+            console.print()
+            console.print(f"Shared memory: {insights} insights")
+
+
+@click.command()
+@click.argument("skill")
+@click.option(
+    "--limit", "-n", default=20, type=click.IntRange(min=1), help="Number of entries to show"
+)
+@click.option("--json", "as_json", is_flag=True, help="Output raw JSONL")
+def history(skill, limit, as_json):
+    """Show query history for a skill."""
+    from sage.history import read_history
+
+    entries = read_history(skill, limit=limit)
+
+    if not entries:
+        console.print(f"[yellow]No history for '{skill}'[/yellow]")
+        return
+
+    if as_json:
+        import json
+
+        # Emit the whole batch in one write rather than a print() per entry
+        sys.stdout.write("".join(json.dumps(entry.to_dict()) + "\n" for entry in entries))
+        return
+
+    rows = (
+        (
+            entry.ts[:16].replace("T", " "),
+            entry.type,
+            truncate(entry.query, 50),
+            f"{entry.tokens_in:,} / {entry.tokens_out:,}",
+            f"${entry.cost:.2f}" if entry.cost >= 0 else "-",
+        )
+        for entry in entries
+    )
+    print_table(("TIME", "TYPE", "QUERY", "TOKENS", "COST"), rows, right={"TOKENS", "COST"})
+
+
+@click.command()
+@click.argument("skill")
+@click.argument("index", type=click.IntRange(min=1), default=1)
+def show(skill, index):
+    """Show full query and response from history.
+
+    INDEX is which entry to show (1 = most recent, 2 = second most recent, etc.)
+    """
+    from sage.history import read_history
+
+    entries = read_history(skill, limit=index)
+
+    if not entries or len(entries) < index:
+        console.print(f"[yellow]Entry {index} not found in '{skill}' history[/yellow]")
+        return
+
+    entry = entries[index - 1]
+
+    console.print()
+    console.print(f"[dim]{entry.ts[:19].replace('T', ' ')} | {entry.type} | {entry.model}[/dim]")
+    console.print()
+    console.print("[bold]Query:[/bold]")
+    console.print(entry.query)
+    console.print()
+    console.print("[bold]Response:[/bold]")
+    if entry.response:
+        console.print(entry.response)
+    else:
+        console.print("[dim](Response not stored for this entry)[/dim]")
+
+
+@click.command()
+@click.argument("skill")
+def context(skill):
+    """Show what a skill knows."""
+    from sage.history import read_history
+    from sage.skill import list_doc_sizes, load_skill
+
+    # Load skill; docs are only sized here, so skip reading them
+    skill_result = load_skill(skill, include_docs=False)
+    if not skill_result.ok:
+        console.print(f"[red]{format_error(skill_result.error)}[/red]")
+        sys.exit(1)
+
+    skill_data = skill_result.value
+    doc_sizes = list_doc_sizes(skill)
+    # Read history once; the header needs the total and the list the last five
+    all_history = read_history(skill)
+    mem_tokens = len(skill_data.shared_memory) // 4  # rough token estimate
+
+    console.print()
+    console.print(f"[bold]{'═' * 60}[/bold]")
+    console.print(f"[bold]SKILL: {skill}[/bold]")
+    console.print(f"[bold]{'═' * 60}[/bold]")
+
+    # Metadata
+    console.print()
+    console.print("[bold]─── METADATA ───[/bold]")
+    console.print(f"name: {skill_data.metadata.name}")
+    console.print(f"description: {skill_data.metadata.description[:80]}...")
+    console.print(f"version: {skill_data.metadata.version}")
+    console.print(f"tags: {', '.join(skill_data.metadata.tags)}")
+
+    # Documents
+    console.print()
+    console.print(f"[bold]─── DOCUMENTS ({len(doc_sizes)}) ───[/bold]")
+    if doc_sizes:
+        for doc_name, size in doc_sizes:
+            tokens = size // 4
+            console.print(f"  {doc_name:<30} {tokens:>6} tokens")
+    else:
+        console.print("  [dim]No documents[/dim]")
+
+    # Shared memory
+    console.print()
+    console.print(f"[bold]─── SHARED MEMORY ({mem_tokens} tokens) ───[/bold]")
+    if skill_data.shared_memory:
+        insights = _INSIGHT_LINE.findall(skill_data.shared_memory.strip())
+        for insight in insights[:5]:
+            console.print(f"  {insight}")
+        if len(insights) > 5:
+            console.print(f"  [dim]... and {len(insights) - 5} more[/dim]")
+    else:
+        console.print("  [dim]No shared memory[/dim]")
+
+    # Recent history
+    console.print()
+    history = all_history[:5]
+    console.print(
+        f"[bold]─── RECENT HISTORY (last {len(history)} of {len(all_history)}) ───[/bold]"
+    )
+    if history:
+        for entry in history:
+            ts = entry.ts[:16].replace("T", " ")
+            query_preview = truncate(entry.query, 50)
+            console.print(f"  [{ts}] {entry.type}: {query_preview}")
+    else:
+        console.print("  [dim]No history[/dim]")
+
+    # Context size estimate
+    console.print()
+    console.print("[bold]─── CONTEXT SIZE ───[/bold]")
+    skill_tokens = len(skill_data.content) // 4
+    doc_tokens = sum(size // 4 for _, size in doc_sizes)
+    total = skill_tokens + doc_tokens + mem_tokens
+
+    console.print(f"  Skill + Docs:     {skill_tokens + doc_tokens:>8} tokens (cache-eligible)")
+    console.print(f"  Shared Memory:    {mem_tokens:>8} tokens (cache-eligible)")
+    console.print("  " + "─" * 40)
+    console.print(f"  [bold]Estimated Total: {total:>8} tokens[/bold]")
+
+
+@click.command()
+@click.option("--port", "-p", default=5555, help="Port to listen on")
+@click.option("--no-browser", is_flag=True, help="Don't open browser automatically")
+@click.option("--api-only", is_flag=True, help="Only serve REST API, no web UI")
+def ui(port, no_browser, api_only):
+    """Start local web UI for browsing checkpoints and knowledge.
+
+    Opens a web interface at http://localhost:5555 (default).
+    Works offline, no external dependencies.
+
+    Examples:
+        sage ui                  # Start on default port
+        sage ui --port 8080      # Custom port
+        sage ui --api-only       # REST API only (for custom frontends)
+
+    REST API endpoints:
+        GET  /api/health              - Health check
+        GET  /api/checkpoints         - List checkpoints
+        GET  /api/checkpoints/:id     - Get checkpoint details
+        GET  /api/checkpoints/search?q=  - Search checkpoints
+        GET  /api/knowledge           - List knowledge
+        GET  /api/knowledge/:id       - Get knowledge item
+        GET  /api/knowledge/recall?q= - Recall matching knowledge
+        POST /api/knowledge           - Add knowledge
+        PUT  /api/knowledge/:id       - Update knowledge
+        DELETE /api/knowledge/:id     - Remove knowledge
+    """
+    from sage.config import detect_project_root
+    from sage.ui.server import run_server
+
+    project_path = detect_project_root()
+    run_server(
+        port=port,
+        project_path=project_path,
+        open_browser=not no_browser,
+        api_only=api_only,
+    )
+
+
+@click.command()
+@click.argument("skill", required=False)
+@click.option("--period", default=7, help="Number of days to analyze")
+def usage(skill, period):
+    """Show usage analytics."""
+    from rich.table import Table
+
+    from sage.history import calculate_usage_batch
+    from sage.skill import list_skills
+
+    skills_to_check = [skill] if skill else list_skills()
+
+    if not skills_to_check:
+        console.print("[yellow]No skills found.[/yellow]")
+        return
+
+    console.print()
+    console.print(f"[bold]{'═' * 60}[/bold]")
+    console.print(f"[bold]USAGE: Last {period} days[/bold]")
+    console.print(f"[bold]{'═' * 60}[/bold]")
+    console.print()
+
+    table = Table()
+    table.add_column("SKILL")
+    table.add_column("TOKENS IN", justify="right")
+    table.add_column("TOKENS OUT", justify="right")
+    table.add_column("SEARCHES", justify="right")
+    table.add_column("COST", justify="right")
+
+    total_in = 0
+    total_out = 0
+    total_searches = 0
+    total_cost = 0.0
+    total_cache = 0
+
+    for s, stats in calculate_usage_batch(skills_to_check, period).items():
+        if stats["entries"] == 0:
+            continue
+
+        total_in += stats["tokens_in"]
+        total_out += stats["tokens_out"]
+        total_searches += stats["searches"]
+        total_cost += stats["cost"]
+        total_cache += stats["cache_hits"]
+
+        table.add_row(
+            s,
+            f"{stats['tokens_in']:,}",
+            f"{stats['tokens_out']:,}",
+            str(stats["searches"]),
+            f"${stats['cost']:.2f}",
+        )
+
+    if total_in > 0:
+        table.add_section()
+        table.add_row(
+            "[bold]TOTAL[/bold]",
+            f"[bold]{total_in:,}[/bold]",
+            f"[bold]{total_out:,}[/bold]",
+            f"[bold]{total_searches}[/bold]",
+            f"[bold]${total_cost:.2f}[/bold]",
+        )
+
+    console.print(table)
+
+    if total_cache > 0:
+        console.print()
+        console.print("[bold]Cache Statistics:[/bold]")
+        cache_rate = (total_cache / total_in * 100) if total_in > 0 else 0
+        console.print(f"  Cache-eligible tokens: {total_in:,}")
+        console.print(f"  Cache hits:           {total_cache:,} ({cache_rate:.0f}%)")
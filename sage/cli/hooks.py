@@ -0,0 +1,247 @@
+"""Claude Code hook management commands.
+
+Hook files managed:
+  - post-response-context-check.sh (context threshold detection)
+  - post-response-semantic-detector.sh (synthesis/branch point detection)
+  - session-start-sage.sh (continuity injection on session start)
+"""
+
+import filecmp
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import click
+
+from sage.cli._claude import CLAUDE_HOOKS_DIR, CLAUDE_SETTINGS_PATH, read_json, write_json
+from sage.cli._console import console
+from sage.errors import format_error
+
+# NOTE: pre-compact.sh was removed - causes deadlock bug and fires before summary exists
+# See knowledge item: precompact-hook-deadlock
+_HOOK_FILES = (
+    "post-response-context-check.sh",
+    "post-response-semantic-detector.sh",
+    "session-start-sage.sh",
+)
+
+# Hook scripts ship in .claude/hooks/ next to the sage package
+_HOOKS_SRC = Path(__file__).parent.parent.parent / ".claude" / "hooks"
+
+# Settings event each installed hook is registered under, in settings order.
+# NOTE: PreCompact hooks removed - causes deadlock bug (see precompact-hook-deadlock)
+_HOOK_EVENTS = (
+    ("SessionStart", ("session-start-sage.sh",)),
+    ("Stop", ("post-response-context-check.sh", "post-response-semantic-detector.sh")),
+)
+
+# Settings events uninstall clears, including the legacy PreCompact entry
+_UNINSTALL_EVENTS = tuple(event for event, _ in _HOOK_EVENTS) + ("PreCompact",)
+
+# Hooks from earlier versions that uninstall still cleans up
+_LEGACY_HOOK_FILES = (
+    "post-response-sage-notify.sh",  # never implemented
+    "pre-compact.sh",  # removed due to deadlock bug
+)
+
+
+@click.group()
+def hooks():
+    """Manage Claude Code hooks for auto-checkpointing."""
+    pass
+
+
+def _hook_config(hooks_dir: Path, present: set[str]) -> dict:
+    """settings.json hook entries for the installed hook scripts in ``present``."""
+    config = {}
+    for event, names in _HOOK_EVENTS:
+        commands = [
+            {"type": "command", "command": str(hooks_dir / name)}
+            for name in names
+            if name in present
+        ]
+        if commands:
+            config[event] = [{"matcher": "", "hooks": commands}]
+    return config
+
+
+def _present_hook_files(hooks_dir: Path) -> set[str]:
+    """Names of the files in ``hooks_dir``, from a single directory scan."""
+    try:
+        with os.scandir(hooks_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+@hooks.command("install")
+@click.option("--force", "-f", is_flag=True, help="Overwrite existing hooks")
+def hooks_install(force):
+    """Install Sage hooks into Claude Code.
+
+    Copies hook scripts to ~/.claude/hooks/ and updates
+    ~/.claude/settings.json with the hook configuration.
+    """
+    hooks_src = _HOOKS_SRC
+    if not hooks_src.is_dir():
+        console.print("[red]Could not find hook source files.[/red]")
+        console.print("[dim]Expected at: .claude/hooks/ relative to sage package[/dim]")
+        sys.exit(1)
+
+    # Destination directories
+    hooks_dest = CLAUDE_HOOKS_DIR
+    settings_path = CLAUDE_SETTINGS_PATH
+
+    # Create hooks directory
+    hooks_dest.mkdir(parents=True, exist_ok=True)
+    present = _present_hook_files(hooks_dest)
+
+    # Copy hook files
+    copied = []
+    for hook_file in _HOOK_FILES:
+        src = hooks_src / hook_file
+        dest = hooks_dest / hook_file
+
+        if not src.exists():
+            console.print(f"[yellow]Warning: {hook_file} not found in source[/yellow]")
+            continue
+
+        if hook_file in present:
+            # Re-installing the same version is a no-op, with or without --force
+            if filecmp.cmp(src, dest, shallow=False):
+                console.print(f"[dim]{hook_file} is up to date[/dim]")
+                continue
+            if not force:
+                console.print(
+                    f"[yellow]Skipping {hook_file} (exists, use --force to overwrite)[/yellow]"
+                )
+                continue
+
+        shutil.copy2(src, dest)
+        dest.chmod(0o755)  # Make executable
+        copied.append(hook_file)
+        present.add(hook_file)
+        console.print(f"[green]✓[/green] Copied {hook_file}")
+
+    # Update settings.json
+    settings = {}
+    if settings_path.exists():
+        try:
+            settings = read_json(settings_path)
+        except json.JSONDecodeError:
+            console.print("[yellow]Warning: Could not parse existing settings.json[/yellow]")
+
+    # Build hook configuration - only include hooks that were copied or already exist
+    hook_config = _hook_config(hooks_dest, present)
+
+    # Merge with existing hooks (don't overwrite other hooks)
+    if "hooks" not in settings:
+        settings["hooks"] = {}
+
+    if all(settings["hooks"].get(event) == entry for event, entry in hook_config.items()):
+        # Already configured: leave the file (and its mtime) alone
+        console.print(f"[dim]{settings_path} unchanged[/dim]")
+    else:
+        settings["hooks"].update(hook_config)
+
+        # Write settings
+        result = write_json(settings_path, settings)
+        if not result.ok:
+            console.print(f"[red]{format_error(result.error)}[/red]")
+            sys.exit(1)
+        console.print(f"[green]✓[/green] Updated {settings_path}")
+
+    console.print()
+    console.print("[bold]Sage hooks installed![/bold]")
+    console.print("[dim]Restart Claude Code for changes to take effect.[/dim]")
+
+
+@hooks.command("uninstall")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+def hooks_uninstall(force):
+    """Remove Sage hooks from Claude Code.
+
+    Removes hook scripts from ~/.claude/hooks/ and removes
+    Sage hook configuration from ~/.claude/settings.json.
+    """
+    if not force:
+        if not click.confirm("Remove Sage hooks from Claude Code?"):
+            console.print("Cancelled.")
+            return
+
+    hooks_dest = CLAUDE_HOOKS_DIR
+    settings_path = CLAUDE_SETTINGS_PATH
+
+    # Remove hook files (includes legacy hooks that may still be installed)
+    present = _present_hook_files(hooks_dest)
+    for hook_file in _HOOK_FILES + _LEGACY_HOOK_FILES:
+        if hook_file in present:
+            (hooks_dest / hook_file).unlink()
+            console.print(f"[green]✓[/green] Removed {hook_file}")
+
+    # Update settings.json. A substring probe on the raw bytes skips parsing
+    # and rewriting it when none of our events can be present.
+    raw = settings_path.read_bytes() if settings_path.exists() else b""
+    if any(f'"{event}"'.encode() in raw for event in _UNINSTALL_EVENTS):
+        try:
+            settings = json.loads(raw)
+            hooks_config = settings.get("hooks", {})
+            # Remove Stop, SessionStart, and PreCompact entries that contain our hooks
+            removed = [event for event in _UNINSTALL_EVENTS if event in hooks_config]
+            if removed:
+                for event in removed:
+                    del hooks_config[event]
+
+                # Clean up empty hooks object
+                if not hooks_config:
+                    del settings["hooks"]
+
+                result = write_json(settings_path, settings)
+                if not result.ok:
+                    console.print(f"[red]{format_error(result.error)}[/red]")
+                    sys.exit(1)
+                console.print(f"[green]✓[/green] Updated {settings_path}")
+        except json.JSONDecodeError:
+            console.print("[yellow]Warning: Could not parse settings.json[/yellow]")
+
+    console.print()
+    console.print("[bold]Sage hooks uninstalled.[/bold]")
+
+
+@hooks.command("status")
+def hooks_status():
+    """Show current hook installation status."""
+    hooks_dest = CLAUDE_HOOKS_DIR
+    settings_path = CLAUDE_SETTINGS_PATH
+
+    console.print("[bold]Hook Files:[/bold]")
+    present = _present_hook_files(hooks_dest)
+    for hook_file in _HOOK_FILES:
+        hook_path = hooks_dest / hook_file
+        if hook_file in present:
+            console.print(f"  [green]✓[/green] {hook_path}")
+        else:
+            console.print(f"  [red]✗[/red] {hook_path} [dim](not found)[/dim]")
+
+    console.print()
+    console.print("[bold]Settings Configuration:[/bold]")
+    if settings_path.exists():
+        try:
+            settings = read_json(settings_path)
+            hooks_config = settings.get("hooks", {})
+
+            if "Stop" in hooks_config:
+                console.print("  [green]✓[/green] Stop hooks configured")
+            else:
+                console.print("  [red]✗[/red] Stop hooks not configured")
+
+            if "SessionStart" in hooks_config:
+                console.print("  [green]✓[/green] SessionStart hooks configured")
+            else:
+                console.print("  [red]✗[/red] SessionStart hooks not configured")
+        except json.JSONDecodeError:
+            console.print(f"  [red]✗[/red] Could not parse {settings_path}")
+    else:
+        console.print(f"  [red]✗[/red] {settings_path} not found")
@@ -0,0 +1,363 @@
+"""Knowledge and todo commands."""
+
+import sys
+
+import click
+
+from sage.cli._console import console, print_table
+from sage.cli._params import require_file
+
+
+@click.group()
+def knowledge():
+    """Manage knowledge items for recall."""
+    pass
+
+
+@knowledge.command("add")
+@click.argument("file", type=click.Path())
+@click.option("--id", "knowledge_id", required=True, help="Unique identifier for this knowledge")
+@click.option("--keywords", "-k", required=True, help="Comma-separated trigger keywords")
+@click.option("--skill", "-s", help="Scope to specific skill (omit for global)")
+@click.option("--source", help="Where this knowledge came from")
+def knowledge_add(file, knowledge_id, keywords, skill, source):
+    """Add a knowledge item from a file."""
+    from pathlib import Path
+
+    from sage.config import detect_project_root
+    from sage.knowledge import add_knowledge
+
+    require_file(file, "'FILE'")
+    project_root = detect_project_root()
+    content = Path(file).read_text()
+    keyword_list = [k.strip() for k in keywords.split(",")]
+
+    item = add_knowledge(
+        content=content,
+        knowledge_id=knowledge_id,
+        keywords=keyword_list,
+        skill=skill,
+        source=source or "",
+        project_path=project_root,
+    )
+
+    scope = f"skill:{skill}" if skill else "global"
+    console.print(f"[green]✓[/green] Added knowledge: {item.id} ({scope})")
+    console.print(f"  Keywords: {', '.join(item.triggers.keywords)}")
+    console.print(f"  Tokens: ~{item.metadata.tokens}")
+
+
+@knowledge.command("list")
+@click.option("--skill", "-s", help="Filter by skill")
+@click.option(
+    "--type", "-t", "item_type", help="Filter by type (knowledge, preference, todo, reference)"
+)
+def knowledge_list(skill, item_type):
+    """List knowledge items."""
+    from rich.table import Table
+
+    from sage.config import detect_project_root
+    from sage.knowledge import list_knowledge
+
+    project_root = detect_project_root()
+    items = list_knowledge(skill, project_path=project_root)
+
+    # Filter by type if specified
+    if item_type:
+        items = [i for i in items if i.item_type == item_type]
+
+    if not items:
+        console.print("[yellow]No knowledge items found.[/yellow]")
+        console.print("Add one with: sage knowledge add <file> --id <id> --keywords <kw1,kw2>")
+        return
+
+    table = Table()
+    table.add_column("ID")
+    table.add_column("TYPE")
+    table.add_column("SCOPE")
+    table.add_column("KEYWORDS")
+    table.add_column("TOKENS", justify="right")
+    table.add_column("ADDED")
+
+    for item in items:
+        scope = ", ".join(item.scope.skills) if item.scope.skills else "global"
+        keywords = ", ".join(item.triggers.keywords[:3])
+        if len(item.triggers.keywords) > 3:
+            keywords += "..."
+        type_display = item.item_type
+        if item.item_type == "todo" and item.metadata.status:
+            type_display = f"todo ({item.metadata.status})"
+
+        table.add_row(
+            item.id,
+            type_display,
+            scope,
+            keywords,
+            str(item.metadata.tokens),
+            item.metadata.added,
+        )
+
+    console.print(table)
+
+
+@knowledge.command("rm")
+@click.argument("knowledge_id")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+def knowledge_rm(knowledge_id, force):
+    """Remove a knowledge item."""
+    from sage.config import detect_project_root
+    from sage.knowledge import remove_knowledge
+
+    project_root = detect_project_root()
+    if not force:
+        if not click.confirm(f"Remove knowledge '{knowledge_id}'?"):
+            console.print("Cancelled.")
+            return
+
+    if remove_knowledge(knowledge_id, project_path=project_root):
+        console.print(f"[green]✓[/green] Removed: {knowledge_id}")
+    else:
+        console.print(f"[red]Knowledge '{knowledge_id}' not found[/red]")
+
+
+@knowledge.command("match")
+@click.argument("query")
+@click.option("--skill", "-s", default="test", help="Skill context for matching")
+def knowledge_match(query, skill):
+    """Test what knowledge would be recalled for a query."""
+    from sage.config import detect_project_root
+    from sage.knowledge import recall_knowledge
+
+    project_root = detect_project_root()
+    result = recall_knowledge(query, skill, project_path=project_root)
+
+    if result.count == 0:
+        console.print("[yellow]No knowledge matched this query.[/yellow]")
+        return
+
+    console.print(
+        f"📚 [bold]Would recall {result.count} items (~{result.total_tokens} tokens):[/bold]"
+    )
+    for item in result.items:
+        console.print(f"  [green]✓[/green] {item.id}")
+        console.print(f"    Keywords: {', '.join(item.triggers.keywords)}")
+        if item.metadata.source:
+            console.print(f"    Source: {item.metadata.source}")
+
+
+@knowledge.command("edit")
+@click.argument("knowledge_id")
+@click.option("--content", "-c", help="New content (or use --file)")
+@click.option("--file", "-f", "content_file", type=click.Path(), help="Read new content from file")
+@click.option("--keywords", "-k", help="New keywords (comma-separated)")
+@click.option("--source", "-s", help="New source attribution")
+@click.option("--status", type=click.Choice(["active", "deprecated", "archived"]), help="Set item status")
+def knowledge_edit(knowledge_id, content, content_file, keywords, source, status):
+    """Edit an existing knowledge item.
+
+    Update content, keywords, source, or status of an existing item.
+    Only provided fields are changed; others remain as-is.
+
+    Examples:
+        sage knowledge edit my-item --keywords "new,keywords,here"
+        sage knowledge edit my-item --file updated-content.md
+        sage knowledge edit my-item --status active  # restore archived item
+    """
+    from pathlib import Path
+
+    from sage.config import detect_project_root
+    from sage.knowledge import update_knowledge
+
+    # Handle content from file
+    require_file(content_file, "'--file'")
+    if content_file:
+        content = Path(content_file).read_text()
+
+    # Parse keywords
+    kw_list = None
+    if keywords:
+        kw_list = [k.strip() for k in keywords.split(",") if k.strip()]
+
+    # Check at least one update
+    if content is None and kw_list is None and source is None and status is None:
+        console.print("[red]Provide at least one field to update (--content, --keywords, --source, or --status)[/red]")
+        sys.exit(1)
+
+    project_root = detect_project_root()
+    result = update_knowledge(
+        knowledge_id=knowledge_id,
+        content=content,
+        keywords=kw_list,
+        source=source,
+        status=status,
+        project_path=project_root,
+    )
+
+    if result is None:
+        console.print(f"[red]Knowledge item not found: {knowledge_id}[/red]")
+        sys.exit(1)
+
+    console.print(f"[green]✓[/green] Updated: {knowledge_id}")
+    if content:
+        console.print(f"    Content: {len(content)} chars")
+    if kw_list:
+        console.print(f"    Keywords: {', '.join(kw_list)}")
+    if source:
+        console.print(f"    Source: {source}")
+    if status:
+        console.print(f"    Status: {status}")
+
+
+@knowledge.command("deprecate")
+@click.argument("knowledge_id")
+@click.option("--reason", "-r", required=True, help="Why this is deprecated")
+@click.option("--replacement", help="ID of replacement item")
+def knowledge_deprecate(knowledge_id, reason, replacement):
+    """Mark a knowledge item as deprecated.
+
+    Deprecated items still appear in search results but show a warning.
+    Use this for outdated information you want to flag but not delete.
+
+    Examples:
+        sage knowledge deprecate old-api-patterns --reason "API v2 released"
+        sage knowledge deprecate old-item --reason "Outdated" --replacement new-item
+    """
+    from sage.config import detect_project_root
+    from sage.knowledge import deprecate_knowledge
+
+    project_root = detect_project_root()
+    result = deprecate_knowledge(
+        knowledge_id=knowledge_id,
+        reason=reason,
+        replacement_id=replacement,
+        project_path=project_root,
+    )
+
+    if result is None:
+        console.print(f"[red]Knowledge item not found: {knowledge_id}[/red]")
+        sys.exit(1)
+
+    console.print(f"[yellow]⚠[/yellow] Deprecated: {knowledge_id}")
+    console.print(f"    Reason: {reason}")
+    if replacement:
+        console.print(f"    Replacement: {replacement}")
+
+
+@knowledge.command("archive")
+@click.argument("knowledge_id")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+def knowledge_archive(knowledge_id, force):
+    """Archive a knowledge item (hide from recall).
+
+    Archived items are preserved but excluded from retrieval.
+    Use this for obsolete items you want to keep for reference.
+
+    To restore, use: sage knowledge edit <id> --status active
+    """
+    from sage.config import detect_project_root
+    from sage.knowledge import archive_knowledge, list_knowledge
+
+    project_root = detect_project_root()
+
+    # Find item first
+    items = list_knowledge(project_path=project_root)
+    item = next((i for i in items if i.id == knowledge_id), None)
+
+    if item is None:
+        console.print(f"[red]Knowledge item not found: {knowledge_id}[/red]")
+        sys.exit(1)
+
+    if not force:
+        click.confirm(
+            f"Archive '{knowledge_id}'? It will be hidden from recall.",
+            abort=True,
+        )
+
+    result = archive_knowledge(knowledge_id, project_path=project_root)
+
+    if result is None:
+        console.print(f"[red]Failed to archive: {knowledge_id}[/red]")
+        sys.exit(1)
+
+    console.print(f"[dim]📦[/dim] Archived: {knowledge_id}")
+    console.print(f"    [dim]Restore with: sage knowledge edit {knowledge_id} --status active[/dim]")
+
+
+# ============================================================================
+# Todo Commands
+# ============================================================================
+
+
+@click.group()
+def todo():
+    """Manage persistent todos."""
+    pass
+
+
+@todo.command("list")
+@click.option("--all", "show_all", is_flag=True, help="Show all todos (including done)")
+def todo_list(show_all):
+    """List pending todos."""
+    from sage.config import detect_project_root
+    from sage.knowledge import list_todos
+
+    project_root = detect_project_root()
+    if show_all:
+        todos = list_todos(project_path=project_root)
+    else:
+        todos = list_todos(status="pending", project_path=project_root)
+
+    if not todos:
+        status_msg = "" if show_all else "pending "
+        console.print(f"[yellow]No {status_msg}todos found.[/yellow]")
+        console.print("Add one via Claude Code: sage_save_knowledge(..., item_type='todo')")
+        return
+
+    def rows():
+        for item in todos:
+            status_icon = "☐" if item.metadata.status == "pending" else "☑"
+            keywords = ", ".join(item.triggers.keywords[:3])
+            if len(item.triggers.keywords) > 3:
+                keywords += "..."
+
+            yield status_icon, item.id, keywords, item.metadata.added
+
+    print_table(("STATUS", "ID", "KEYWORDS", "ADDED"), rows())
+
+
+@todo.command("done")
+@click.argument("todo_id")
+def todo_done(todo_id):
+    """Mark a todo as done."""
+    from sage.config import detect_project_root
+    from sage.knowledge import mark_todo_done
+
+    project_root = detect_project_root()
+    if mark_todo_done(todo_id, project_path=project_root):
+        console.print(f"[green]✓[/green] Marked as done: {todo_id}")
+    else:
+        console.print(f"[red]Todo '{todo_id}' not found[/red]")
+
+
+@todo.command("pending")
+def todo_pending():
+    """Show pending todos (for session start)."""
+    from sage.config import detect_project_root
+    from sage.knowledge import get_pending_todos
+
+    project_root = detect_project_root()
+    todos = get_pending_todos(project_path=project_root)
+
+    if not todos:
+        console.print("[dim]No pending todos.[/dim]")
+        return
+
+    # Collect every line and print once: one markup pass and one write
+    lines = ["[bold]📋 Pending Todos:[/bold]", ""]
+    for item in todos:
+        lines.append(f"  ☐ [bold]{item.id}[/bold]")
+        if item.triggers.keywords:
+            lines.append(f"    Keywords: {', '.join(item.triggers.keywords[:5])}")
+    lines += ["", "[dim]Mark done with: sage todo done <id>[/dim]"]
+
+    console.print("\n".join(lines))
@@ -0,0 +1,144 @@
+"""MCP server installation commands."""
+
+import json
+import shutil
+import sys
+
+import click
+
+from sage.cli._claude import CLAUDE_JSON_PATH, read_json, write_json
+from sage.cli._console import console
+from sage.errors import format_error
+
+
+@click.group()
+def mcp():
+    """Manage MCP server for Claude Code."""
+    pass
+
+
+@mcp.command("install")
+def mcp_install():
+    """Install Sage MCP server into Claude Code.
+
+    Adds the sage MCP server to ~/.claude.json so Claude Code
+    can use Sage checkpoint and knowledge tools.
+    """
+    claude_json = CLAUDE_JSON_PATH
+
+    # Find python executable
+    python_path = shutil.which("python") or shutil.which("python3")
+    if not python_path:
+        console.print("[red]Could not find python executable[/red]")
+        sys.exit(1)
+
+    # Load existing config
+    config = {}
+    if claude_json.exists():
+        try:
+            config = read_json(claude_json)
+        except json.JSONDecodeError:
+            console.print("[yellow]Warning: Could not parse existing ~/.claude.json[/yellow]")
+
+    # Add MCP server config
+    if "mcpServers" not in config:
+        config["mcpServers"] = {}
+
+    server = {
+        "type": "stdio",
+        "command": python_path,
+        "args": ["-m", "sage.mcp_server"],
+        "env": {},
+    }
+
+    if config["mcpServers"].get("sage") == server:
+        # Already configured: leave the file (and its mtime) alone
+        console.print(f"[dim]sage MCP server already configured in {claude_json}[/dim]")
+    else:
+        config["mcpServers"]["sage"] = server
+
+        # Write config
+        result = write_json(claude_json, config)
+        if not result.ok:
+            console.print(f"[red]{format_error(result.error)}[/red]")
+            sys.exit(1)
+        console.print(f"[green]✓[/green] Added sage MCP server to {claude_json}")
+
+    console.print()
+    console.print("[bold]Sage MCP server installed![/bold]")
+    console.print("[dim]Restart Claude Code for changes to take effect.[/dim]")
+    console.print()
+    console.print("Available tools:")
+    console.print("  • sage_save_checkpoint")
+    console.print("  • sage_load_checkpoint")
+    console.print("  • sage_list_checkpoints")
+    console.print("  • sage_autosave_check")
+    console.print("  • sage_save_knowledge")
+    console.print("  • sage_recall_knowledge")
+    console.print("  • sage_list_knowledge")
+    console.print("  • sage_remove_knowledge")
+
+
+@mcp.command("uninstall")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+def mcp_uninstall(force):
+    """Remove Sage MCP server from Claude Code."""
+    if not force:
+        if not click.confirm("Remove Sage MCP server from Claude Code?"):
+            console.print("Cancelled.")
+            return
+
+    claude_json = CLAUDE_JSON_PATH
+
+    if not claude_json.exists():
+        console.print("[yellow]~/.claude.json not found[/yellow]")
+        return
+
+    try:
+        config = read_json(claude_json)
+        if "mcpServers" in config and "sage" in config["mcpServers"]:
+            del config["mcpServers"]["sage"]
+
+            # Clean up empty mcpServers
+            if not config["mcpServers"]:
+                del config["mcpServers"]
+
+            result = write_json(claude_json, config)
+            if not result.ok:
+                console.print(f"[red]{format_error(result.error)}[/red]")
+                sys.exit(1)
+            console.print(f"[green]✓[/green] Removed sage MCP server from {claude_json}")
+        else:
+            console.print("[yellow]Sage MCP server not found in config[/yellow]")
+    except json.JSONDecodeError:
+        console.print("[red]Could not parse ~/.claude.json[/red]")
+
+    console.print()
+    console.print("[bold]Sage MCP server uninstalled.[/bold]")
+
+
+@mcp.command("status")
+def mcp_status():
+    """Show MCP server installation status."""
+    claude_json = CLAUDE_JSON_PATH
+
+    console.print("[bold]MCP Server Configuration:[/bold]")
+
+    if not claude_json.exists():
+        console.print(f"  [red]✗[/red] {claude_json} not found")
+        return
+
+    try:
+        config = read_json(claude_json)
+        mcp_servers = config.get("mcpServers", {})
+
+        if "sage" in mcp_servers:
+            sage_config = mcp_servers["sage"]
+            console.print("  [green]✓[/green] Sage MCP server configured")
+            console.print(f"    Command: {sage_config.get('command', 'N/A')}")
+            console.print(f"    Args: {' '.join(sage_config.get('args', []))}")
+        else:
+            console.print("  [red]✗[/red] Sage MCP server not configured")
+            console.print("  [dim]Run 'sage mcp install' to add it[/dim]")
+    except json.JSONDecodeError:
+        console.print(f"  [red]✗[/red] Could not parse {claude_json}")
@@ -0,0 +1,133 @@
+"""Sage methodology skill commands."""
+
+import sys
+
+import click
+
+from sage.cli._console import console
+
+
+@click.group()
+def skills():
+    """Manage Sage methodology skills.
+
+    Sage ships default skills that teach Claude how to use Sage effectively.
+    These are separate from research skills created via 'sage create'.
+
+    Skills are installed to ~/.claude/skills/sage/
+    """
+    pass
+
+
+@skills.command("install")
+@click.option("--force", "-f", is_flag=True, help="Overwrite existing skills")
+def skills_install(force):
+    """Install default Sage methodology skills.
+
+    Installs:
+    - sage-memory: Background Task pattern for saves
+    - sage-research: Checkpoint methodology
+    - sage-session: Session start ritual
+
+    Skills are installed to ~/.claude/skills/sage/
+    """
+    from sage.default_skills import SAGE_SKILLS_DIR, install_all_skills
+
+    console.print("[bold]Installing Sage Skills[/bold]")
+    console.print(f"Location: {SAGE_SKILLS_DIR}")
+    console.print("─" * 40)
+
+    results = install_all_skills(force=force)
+
+    for skill_name, success, message in results:
+        if success:
+            console.print(f"[green]✓[/green] {message}")
+        else:
+            console.print(f"[yellow]○[/yellow] {message}")
+
+    console.print()
+    console.print("[dim]Skills will be loaded by Claude when context matches triggers.[/dim]")
+
+
+@skills.command("list")
+def skills_list():
+    """List installed Sage methodology skills."""
+    from rich.table import Table
+
+    from sage.default_skills import (
+        SAGE_SKILLS_DIR,
+        check_skill_version,
+        get_default_skills,
+        get_installed_sage_skills,
+    )
+
+    installed = get_installed_sage_skills()
+
+    if not installed:
+        console.print("[yellow]No Sage skills installed.[/yellow]")
+        console.print("Install with: sage skills install")
+        return
+
+    console.print(f"[bold]Installed Sage Skills[/bold] ({SAGE_SKILLS_DIR})")
+    console.print("─" * 50)
+
+    table = Table()
+    table.add_column("SKILL")
+    table.add_column("VERSION")
+    table.add_column("STATUS")
+
+    available_names = [s.name for s in get_default_skills()]
+
+    for skill_name in installed:
+        installed_ver, available_ver = check_skill_version(skill_name)
+
+        if skill_name not in available_names:
+            status = "[dim]custom[/dim]"
+        elif installed_ver == available_ver:
+            status = "[green]up to date[/green]"
+        else:
+            status = f"[yellow]update available ({available_ver})[/yellow]"
+
+        table.add_row(skill_name, installed_ver or "-", status)
+
+    console.print(table)
+
+
+@skills.command("update")
+def skills_update():
+    """Update Sage methodology skills to latest versions."""
+    from sage.default_skills import install_all_skills
+
+    console.print("[bold]Updating Sage Skills[/bold]")
+    console.print("─" * 40)
+
+    results = install_all_skills(force=True)
+
+    for skill_name, success, message in results:
+        if success:
+            console.print(f"[green]✓[/green] {message}")
+        else:
+            console.print(f"[red]✗[/red] {message}")
+
+    console.print()
+    console.print("[green]Skills updated to latest versions.[/green]")
+
+
+@skills.command("show")
+@click.argument("name")
+def skills_show(name):
+    """Show a Sage methodology skill's content.
+
+    Security: skill name is sanitized to prevent path traversal.
+    """
+    from sage.default_skills import get_skill_path
+
+    skill_path = get_skill_path(name)
+
+    if not skill_path.exists():
+        console.print(f"[red]Skill not found: {name}[/red]")
+        console.print(f"  Expected: {skill_path}")
+        sys.exit(1)
+
+    content = skill_path.read_text()
+    console.print(content)
@@ -0,0 +1,75 @@
+"""Checkpoint template commands."""
+
+import click
+
+from sage.cli._console import console, truncate
+
+
+@click.group()
+def templates():
+    """Manage checkpoint templates."""
+    pass
+
+
+@templates.command("list")
+def templates_list():
+    """List available checkpoint templates."""
+    from rich.table import Table
+
+    from sage.templates import list_templates, load_template
+
+    template_names = list_templates()
+
+    if not template_names:
+        console.print("[yellow]No templates found.[/yellow]")
+        return
+
+    table = Table()
+    table.add_column("NAME")
+    table.add_column("FIELDS")
+    table.add_column("DESCRIPTION")
+
+    for name in template_names:
+        template = load_template(name)
+        if template:
+            required_count = sum(1 for f in template.fields if f.required)
+            fields_info = f"{len(template.fields)} ({required_count} required)"
+            table.add_row(name, fields_info, truncate(template.description, 40) or "-")
+
+    console.print(table)
+    console.print()
+    console.print("[dim]Use 'sage templates show <name>' for details[/dim]")
+
+
+@templates.command("show")
+@click.argument("name")
+def templates_show(name):
+    """Show details of a checkpoint template."""
+    from sage.templates import load_template
+
+    template = load_template(name)
+
+    if not template:
+        console.print(f"[red]Template '{name}' not found[/red]")
+        console.print("[dim]Use 'sage templates list' to see available templates[/dim]")
+        return
+
+    console.print()
+    console.print(f"[bold]Template: {template.name}[/bold]")
+    if template.description:
+        console.print(f"[dim]{template.description}[/dim]")
+    console.print()
+
+    console.print("[bold]Fields:[/bold]")
+    for field in template.fields:
+        required = "[cyan]*[/cyan]" if field.required else " "
+        console.print(f"  {required} {field.name}")
+        if field.description:
+            console.print(f"      [dim]{field.description}[/dim]")
+
+    console.print()
+    console.print("[dim]* = required field[/dim]")
+
+    if template.jinja_template:
+        console.print()
+        console.print("[bold]Custom Jinja2 template:[/bold] Yes")
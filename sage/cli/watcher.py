@@ -0,0 +1,165 @@
+"""Compaction watcher commands (session continuity)."""
+
+import sys
+
+import click
+
+from sage.cli._console import console
+
+
+@click.group()
+def watcher():
+    """Manage compaction watcher daemon for session continuity.
+
+    The watcher monitors Claude Code transcripts for compaction events.
+    When detected, it writes a marker so the next Sage tool call can
+    inject context from the most recent checkpoint.
+    """
+    pass
+
+
+@watcher.command("start")
+@click.option("--project", "-p", type=click.Path(exists=True), help="Project path to scope watcher")
+@click.option("--force", "-f", is_flag=True, help="Force restart if already running")
+def watcher_start(project, force):
+    """Start the compaction watcher daemon.
+
+    Runs in the background and watches Claude Code transcripts for
+    compaction events (isCompactSummary: true in JSONL).
+
+    When compaction is detected:
+    1. Finds the most recent checkpoint
+    2. Writes a continuity marker
+    3. Next sage tool call injects the checkpoint context
+
+    Use --project to scope the watcher to a specific project's transcripts.
+    Use --force to restart the watcher (e.g., when switching projects).
+    """
+    from pathlib import Path
+
+    from sage.watcher import find_active_transcript, get_watcher_status, is_running, start_daemon
+
+    project_path = Path(project) if project else None
+
+    # Check for transcript first
+    transcript = find_active_transcript(project_path)
+    if not transcript:
+        if project_path:
+            console.print(f"[red]No transcript found for project: {project_path}[/red]")
+        else:
+            console.print("[red]No Claude Code transcript found[/red]")
+        console.print("[dim]Start a Claude Code session first[/dim]")
+        sys.exit(1)
+
+    console.print(f"[dim]Found transcript: {transcript}[/dim]")
+
+    if start_daemon(project_path=project_path, force_restart=force):
+        status = get_watcher_status()
+        console.print(f"[green]✓[/green] Watcher started (PID {status['pid']})")
+        console.print(f"  Watching: {transcript}")
+        console.print(f"  Log: {status['log_file']}")
+    elif is_running():
+        console.print("[yellow]Watcher already running[/yellow]")
+        console.print("[dim]Use --force to restart, or 'sage watcher status' for details[/dim]")
+    else:
+        console.print("[red]Failed to start watcher[/red]")
+        console.print("[dim]Check ~/.sage/logs/watcher.log for details[/dim]")
+        sys.exit(1)
+
+
+@watcher.command("stop")
+def watcher_stop():
+    """Stop the compaction watcher daemon."""
+    from sage.watcher import stop_daemon
+
+    if stop_daemon():
+        console.print("[green]✓[/green] Watcher stopped")
+    else:
+        console.print("[yellow]Watcher was not running[/yellow]")
+
+
+@watcher.command("status")
+def watcher_status():
+    """Show watcher daemon status."""
+    from pathlib import Path
+
+    from sage.config import get_sage_config
+    from sage.watcher import get_watcher_status
+
+    status = get_watcher_status()
+    config = get_sage_config()
+
+    console.print("[bold]Compaction Watcher Status[/bold]")
+    console.print("─" * 40)
+
+    if status["running"]:
+        console.print(f"[green]✓[/green] Running (PID {status['pid']})")
+    else:
+        console.print("[dim]○[/dim] Not running")
+
+    # Show autostart status
+    if config.watcher_auto_start:
+        console.print("[green]✓[/green] Autostart enabled")
+    else:
+        console.print("[dim]○[/dim] Autostart disabled")
+        console.print("  [dim]Enable: sage watcher autostart enable[/dim]")
+
+    if status.get("transcript"):
+        console.print(f"  Transcript: {status['transcript']}")
+    else:
+        console.print("  [dim]No active transcript found[/dim]")
+
+    console.print(f"  Log file: {status['log_file']}")
+
+    # Show last few log lines if available
+    log_path = Path(status["log_file"])
+    if log_path.exists():
+        console.print()
+        console.print("[bold]Recent log:[/bold]")
+        lines = log_path.read_text().strip().split("\n")[-5:]
+        for line in lines:
+            console.print(f"  [dim]{line}[/dim]")
+
+
+@watcher.command("autostart")
+@click.argument("action", type=click.Choice(["enable", "disable", "status"]))
+def watcher_autostart(action):
+    """Enable or disable watcher autostart.
+
+    When autostart is enabled, the watcher daemon will automatically
+    start on the first MCP tool call of each session.
+
+    Examples:
+        sage watcher autostart enable
+        sage watcher autostart disable
+        sage watcher autostart status
+    """
+    from sage.config import SAGE_DIR, SageConfig, get_sage_config
+
+    config = get_sage_config()
+
+    if action == "status":
+        if config.watcher_auto_start:
+            console.print("[green]✓[/green] Watcher autostart is enabled")
+            console.print("  [dim]Watcher will start on first MCP tool call[/dim]")
+        else:
+            console.print("[dim]○[/dim] Watcher autostart is disabled")
+            console.print("  [dim]Enable with: sage watcher autostart enable[/dim]")
+        return
+
+    if action == "enable":
+        # Update config
+        current_dict = config.to_dict()
+        current_dict["watcher_auto_start"] = True
+        new_config = SageConfig(**current_dict)
+        new_config.save(SAGE_DIR)
+        console.print("[green]✓[/green] Watcher autostart enabled")
+        console.print("  [dim]Watcher will start on first MCP tool call[/dim]")
+
+    elif action == "disable":
+        # Update config
+        current_dict = config.to_dict()
+        current_dict["watcher_auto_start"] = False
+        new_config = SageConfig(**current_dict)
+        new_config.save(SAGE_DIR)
+        console.print("[green]✓[/green] Watcher autostart disabled")
@@ -31,12 +31,15 @@ Configuration Classes
     - embedding_model: Sentence transformer model name
 """
 
+import functools
 import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import yaml
+# yaml is imported inside _load_yaml and the save methods below: it is most of this
+# module's import time, and commands like `sage history` never read YAML.
 
 # Standard paths
 SAGE_DIR = Path.home() / ".sage"
@@ -46,6 +49,35 @@ SHARED_MEMORY_PATH = SAGE_DIR / "shared_memory.md"
 ACTIVE_SKILL_PATH = SAGE_DIR / ".active_skill"
 REFERENCE_DIR = SAGE_DIR / "reference"
 
+# Parsed YAML files keyed by path, with the (mtime_ns, size) they were read at
+_yaml_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _load_yaml(path: Path) -> dict[str, Any] | None:
+    """Parse a YAML config file, reusing the previous parse if it is unchanged.
+
+    Long-running processes (the MCP server, hooks) load the same config
+    over and over; while the file's mtime and size match, a stat replaces
+    the re-parse. Returns None if the file does not exist, otherwise a
+    fresh top-level copy of the parsed mapping.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+
+    cached = _yaml_cache.get(path)
+    if cached is None or cached[0] != key:
+        import yaml
+
+        # Prefer the libyaml-backed loader; fall back to pure Python
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path) as f:
+            data = yaml.load(f, Loader=loader) or {}  # noqa: S506 - loader is a SafeLoader
+        cached = _yaml_cache[path] = (key, data)
+    return dict(cached[1])
+
 
 @dataclass
 class Config:
@@ -62,9 +94,8 @@ class Config:
         config = cls()
 
         # Load from file if exists
-        if CONFIG_PATH.exists():
-            with open(CONFIG_PATH) as f:
-                data = yaml.safe_load(f) or {}
+        data = _load_yaml(CONFIG_PATH)
+        if data is not None:
             config = cls._from_dict(data)
 
         # Environment variables override file config
@@ -94,8 +125,13 @@ class Config:
             "cache_ttl": self.cache_ttl,
         }
 
+        import yaml
+
         with open(CONFIG_PATH, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False)
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False)
+        # Don't rely on mtime alone: coarse timestamps could hide this write
+        _yaml_cache.pop(CONFIG_PATH, None)
         # Restrict permissions - config may contain API key
         CONFIG_PATH.chmod(0o600)
 
@@ -110,15 +146,18 @@ def ensure_directories() -> None:
     (SAGE_DIR / "hooks").mkdir(exist_ok=True)
 
 
+_UNSAFE_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_-]+")
+
+
+# Skill names are a small set that path helpers sanitize over and over
+@functools.lru_cache(maxsize=512)
 def _sanitize_name(name: str) -> str:
     """Sanitize a name to prevent path traversal attacks.
 
     Only allows alphanumeric, hyphens, underscores.
     Prevents names like '../../../.bashrc' from escaping directories.
     """
-    import re
-
-    sanitized = re.sub(r"[^a-zA-Z0-9_-]+", "-", name).strip("-")
+    sanitized = _UNSAFE_NAME_CHARS.sub("-", name).strip("-")
     return sanitized or "unnamed"
 
 
@@ -158,6 +197,7 @@ class SageConfig:
     # Embedding models
     embedding_model: str = "BAAI/bge-large-en-v1.5"  # For prose (knowledge, checkpoints)
     code_embedding_model: str = "BAAI/bge-large-en-v1.5"  # For code indexing (codesage has transformers compat issues)
+    embedding_quantize: bool = False  # Store embeddings as int8 + per-row scale (~4x smaller files)
 
     # Async settings (v2.0)
     async_enabled: bool = False  # Sync by default; use CLAUDE.md Task subagent for backgrounding
@@ -271,10 +311,8 @@ class SageConfig:
         Returns:
             SageConfig with values from file, or defaults if not found
         """
-        config_path = sage_dir / "tuning.yaml"
-        if config_path.exists():
-            with open(config_path) as f:
-                overrides = yaml.safe_load(f) or {}
+        overrides = _load_yaml(sage_dir / "tuning.yaml")
+        if overrides is not None:
             # Only apply known fields - use dataclass fields, not hasattr (security)
             valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
             valid_overrides = {k: v for k, v in overrides.items() if k in valid_fields}
@@ -296,22 +334,38 @@ class SageConfig:
         sage_dir.mkdir(parents=True, exist_ok=True)
         config_path = sage_dir / "tuning.yaml"
 
-        # Only save non-default values to keep file clean
-        defaults = SageConfig()
+        # Only save non-default values to keep file clean. Every field has a
+        # plain default, so compare against those instead of a SageConfig().
         data = {}
-        for key, value in self.__dict__.items():
-            if getattr(defaults, key) != value:
+        for field in self.__dataclass_fields__.values():
+            value = getattr(self, field.name)
+            if value != field.default:
                 # Convert tuples to lists for YAML serialization
                 if isinstance(value, tuple):
                     value = list(value)
-                data[key] = value
+                data[field.name] = value
 
         # If all defaults, save empty dict (or minimal marker)
         if not data:
             data = {"_version": 1}  # Marker that config was explicitly saved
 
+        import yaml
+
+        # Leave an identical file (and its mtime) alone. A file that does not
+        # parse is simply overwritten, so saving can repair it.
+        try:
+            unchanged = _load_yaml(config_path) == data
+        except (yaml.YAMLError, TypeError, ValueError):
+            unchanged = False
+        if unchanged:
+            # Restrict permissions - tuning config is user-specific
+            config_path.chmod(0o600)
+            return config_path
+
         with open(config_path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False)
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False)
+        _yaml_cache.pop(config_path, None)
         # Restrict permissions - tuning config is user-specific
         config_path.chmod(0o600)
 
@@ -396,21 +450,16 @@ def detect_project_root(start_path: Path | None = None) -> Path | None:
     home = Path.home()
 
     while current != current.parent:
-        # Stop traversal at or above home directory
-        if current == home or home not in current.parents:
-            # Check current before stopping
-            if (current / ".sage").is_dir() or (current / ".git").exists():
-                return current
-            if current == home or len(current.parts) <= len(home.parts):
-                break
-
-        # Check for .sage first (explicit Sage project)
-        if (current / ".sage").is_dir():
+        # An explicit Sage project (.sage) or a git repository root (.git).
+        # Each level is probed once, including the one traversal stops at.
+        if (current / ".sage").is_dir() or (current / ".git").exists():
             return current
 
-        # Check for .git (git repository)
-        if (current / ".git").exists():
-            return current
+        # Stop traversal at or above home directory
+        if current == home or (
+            home not in current.parents and len(current.parts) <= len(home.parts)
+        ):
+            break
 
         current = current.parent
 
@@ -7,12 +7,16 @@ Skills are loaded from the skills/ directory in the package root,
 making them easy to edit as markdown files.
 """
 
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
 
 from sage.config import SKILLS_DIR
 
+_UNSAFE_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_-]+")
+_VERSION_FIELD = re.compile(r"version:\s*([^\n]+)")
+
 
 def _sanitize_skill_name(name: str) -> str:
     """Sanitize a skill name to prevent path traversal attacks.
@@ -21,7 +25,7 @@ def _sanitize_skill_name(name: str) -> str:
     or shell injection. Only allows alphanumeric, underscore, and hyphen.
     """
     # Remove any path separators and dangerous characters
-    sanitized = re.sub(r"[^a-zA-Z0-9_-]+", "-", name).strip("-")
+    sanitized = _UNSAFE_NAME_CHARS.sub("-", name).strip("-")
     return sanitized or "unnamed"
 
 
@@ -110,8 +114,15 @@ def install_skill(skill: DefaultSkill, force: bool = False) -> tuple[bool, str]:
     skill_dir = SAGE_SKILLS_DIR / skill.name
     skill_path = skill_dir / "SKILL.md"
 
-    if skill_path.exists() and not force:
-        return False, f"Skill '{skill.name}' already exists (use --force to overwrite)"
+    if skill_path.exists():
+        if not force:
+            return False, f"Skill '{skill.name}' already exists (use --force to overwrite)"
+        # Leave an identical file (and its mtime) alone on forced reinstalls
+        if skill_path.read_text() == skill.content:
+            return True, f"{skill.name} is up to date"
+        action = "Updated"
+    else:
+        action = "Installed"
 
     # Create directory and write skill
     skill_dir.mkdir(parents=True, exist_ok=True)
@@ -120,7 +131,6 @@ def install_skill(skill: DefaultSkill, force: bool = False) -> tuple[bool, str]:
     # Set restrictive permissions (0o644 for skill files - readable but not world-writable)
     skill_path.chmod(0o644)
 
-    action = "Updated" if skill_path.exists() else "Installed"
     return True, f"{action} {skill.name}"
 
 
@@ -139,14 +149,18 @@ def install_all_skills(force: bool = False) -> list[tuple[str, bool, str]]:
 
 def get_installed_sage_skills() -> list[str]:
     """List installed Sage methodology skills."""
-    if not SAGE_SKILLS_DIR.exists():
+    # DirEntry.is_dir() answers from the directory listing, so each entry
+    # costs only the SKILL.md check
+    try:
+        with os.scandir(SAGE_SKILLS_DIR) as entries:
+            skills = [
+                entry.name
+                for entry in entries
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "SKILL.md"))
+            ]
+    except FileNotFoundError:
         return []
 
-    skills = []
-    for skill_dir in SAGE_SKILLS_DIR.iterdir():
-        if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-            skills.append(skill_dir.name)
-
     return sorted(skills)
 
 
@@ -164,22 +178,23 @@ def check_skill_version(skill_name: str) -> tuple[str | None, str | None]:
     # Get installed version
     installed_version = None
     if skill_path.exists():
-        content = skill_path.read_text()
-        match = re.search(r"version:\s*([^\n]+)", content)
-        if match:
-            installed_version = match.group(1).strip()
+        installed_version = _extract_version(skill_path.read_text())
 
-    # Get available version from source
+    # Get available version from the source skills, read once per process
     available_version = None
-    skill = _load_skill_from_source(skill_name)
+    skill = get_skill_by_name(skill_name)
     if skill:
-        match = re.search(r"version:\s*([^\n]+)", skill.content)
-        if match:
-            available_version = match.group(1).strip()
+        available_version = _extract_version(skill.content)
 
     return installed_version, available_version
 
 
+def _extract_version(content: str) -> str | None:
+    """Return the ``version:`` value from skill content, if present."""
+    match = _VERSION_FIELD.search(content)
+    return match.group(1).strip() if match else None
+
+
 def get_skill_by_name(skill_name: str) -> DefaultSkill | None:
     """Get a specific default skill by name.
 
@@ -13,14 +13,16 @@ This module provides:
 from __future__ import annotations
 
 import fcntl
+import importlib.util
 import json
 import logging
 import sys
 import tempfile
 import threading
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -103,10 +105,20 @@ EMBEDDINGS_LOCK_FILE = EMBEDDINGS_DIR / ".embeddings.lock"
 _model: SentenceTransformer | None = None
 _model_name: str | None = None
 _first_load_warning_shown: bool = False
+_available: bool | None = None  # Cached is_available() result
 
 # Threading lock for model loading (prevents concurrent model initialization)
 _model_lock = threading.Lock()
 
+# Bumped whenever _model is replaced or cleared
+_model_generation = 0
+
+# Recent query embeddings keyed by (model name, prefixed text), each stored
+# with the _model_generation that produced it. One turn often recalls
+# knowledge and failures for the same query; this encodes that query once.
+_query_cache: dict[tuple[str, str], tuple[int, np.ndarray]] = {}
+_QUERY_CACHE_SIZE = 32
+
 
 @contextmanager
 def _embedding_file_lock(path: Path, timeout: float = 10.0) -> Generator[None, None, None]:
@@ -151,23 +163,32 @@ def clear_model_cache() -> None:
     Call this after changing the embedding_model config to force reload.
     The next call to get_model() will load the new model.
     """
-    global _model, _model_name
+    global _model, _model_name, _model_generation
 
     with _model_lock:
         if _model is not None:
             logger.info(f"Clearing cached embedding model: {_model_name}")
             _model = None
             _model_name = None
+        _model_generation += 1
+        _query_cache.clear()
 
 
 def is_available() -> bool:
-    """Check if sentence-transformers is available."""
-    try:
-        import sentence_transformers  # noqa: F401
+    """Check if sentence-transformers is available.
+
+    Looks the package up with find_spec rather than importing it, so the
+    check does not pull in torch; get_model() reports a broken install when
+    it actually loads. The answer is cached for the life of the process.
+    """
+    global _available
 
-        return True
-    except ImportError:
-        return False
+    if _available is None:
+        try:
+            _available = importlib.util.find_spec("sentence_transformers") is not None
+        except (ImportError, ValueError):
+            _available = False
+    return _available
 
 
 def is_model_loaded() -> bool:
@@ -242,7 +263,7 @@ def get_model(model_name: str | None = None) -> Result[SentenceTransformer, Sage
     Returns:
         Result containing the model or an error
     """
-    global _model, _model_name
+    global _model, _model_name, _model_generation
 
     if model_name is None:
         model_name = get_configured_model()
@@ -276,6 +297,7 @@ def get_model(model_name: str | None = None) -> Result[SentenceTransformer, Sage
             logger.info(f"Loading embedding model: {model_name}")
             _model = SentenceTransformer(model_name, trust_remote_code=True)
             _model_name = model_name
+            _model_generation += 1
             logger.info(
                 f"Model loaded successfully (dim={_model.get_sentence_embedding_dimension()})"
             )
@@ -345,7 +367,27 @@ def get_query_embedding(text: str, model_name: str | None = None) -> Result[np.n
     prefix = info.get("query_prefix", "")
     prefixed_text = prefix + text if prefix else text
 
-    return get_embedding(prefixed_text, model_name)
+    # Entries from a previous (or replaced) model are not reused. Only the
+    # generation is stored, so the cache never keeps an old model alive.
+    key = (model_name, prefixed_text)
+    cached = _query_cache.get(key)
+    if (
+        cached is not None
+        and cached[0] == _model_generation
+        and _model is not None
+        and _model_name == model_name
+    ):
+        return ok(cached[1])
+
+    result = get_embedding(prefixed_text, model_name)
+    generation = _model_generation
+    if result.is_ok() and _model is not None and _model_name == model_name:
+        embedding = result.unwrap()
+        embedding.setflags(write=False)  # Shared between callers
+        if len(_query_cache) >= _QUERY_CACHE_SIZE:
+            _query_cache.pop(next(iter(_query_cache), None), None)
+        _query_cache[key] = (generation, embedding)
+    return result
 
 
 def get_code_embedding(text: str, model_name: str | None = None) -> Result[np.ndarray, SageError]:
@@ -447,8 +489,9 @@ def get_embeddings_batch(
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """Compute cosine similarity between two vectors.
 
-    Note: If vectors are already normalized (which they are from encode),
-    this is equivalent to dot product.
+    Vectors from encode are already normalized, where this is just the dot
+    product; derived vectors such as a centroid of several embeddings are
+    not, so the norms are divided out.
 
     Args:
         a: First embedding vector
@@ -461,16 +504,22 @@ def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     if a.size == 0 or b.size == 0:
         return 0.0
 
-    # For normalized vectors, cosine similarity = dot product
-    return float(np.dot(a, b))
+    norms = float(np.sqrt(np.dot(a, a) * np.dot(b, b)))
+    if norms == 0.0:
+        return 0.0
+    return float(np.dot(a, b)) / norms
 
 
 def cosine_similarity_matrix(query: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
     """Compute cosine similarities between query and multiple embeddings.
 
+    The query is normalized here (one vector, cheap); the rows are expected
+    to be unit-norm already, as encode and load_embeddings produce them, so
+    the matrix is never rescaled per search.
+
     Args:
         query: Single query embedding (1D array)
-        embeddings: Matrix of embeddings (2D array, shape: [n, dim])
+        embeddings: Matrix of unit-norm embeddings (2D array, shape: [n, dim])
 
     Returns:
         Array of similarity scores (shape: [n])
@@ -478,6 +527,13 @@ def cosine_similarity_matrix(query: np.ndarray, embeddings: np.ndarray) -> np.nd
     if query.size == 0 or embeddings.size == 0:
         return np.array([])
 
+    # Match the query to the matrix dtype: a float64 query would otherwise
+    # upcast (copy) the whole float32 matrix before the BLAS call
+    query = np.asarray(query, dtype=embeddings.dtype)
+    norm = np.linalg.norm(query)
+    if norm > 0:
+        query = query / norm
+
     # For normalized vectors: similarities = embeddings @ query
     return embeddings @ query
 
@@ -489,6 +545,13 @@ class EmbeddingStore:
     ids: list[str]
     embeddings: np.ndarray  # Shape: [n_items, embedding_dim]
 
+    def __post_init__(self) -> None:
+        # Keep one C-contiguous float32 layout (what the models emit) so
+        # similarity search is a single SGEMV; a no-op for loaded files
+        object.__setattr__(
+            self, "embeddings", np.ascontiguousarray(self.embeddings, dtype=np.float32)
+        )
+
     @classmethod
     def empty(cls, dim: int | None = None) -> EmbeddingStore:
         """Create an empty store.
@@ -505,16 +568,23 @@ class EmbeddingStore:
     def __len__(self) -> int:
         return len(self.ids)
 
+    @cached_property
+    def _index(self) -> dict[str, int]:
+        """Row of each ID, built on first lookup.
+
+        Filled back to front so a duplicated ID maps to its first row,
+        as list.index() would.
+        """
+        last = len(self.ids) - 1
+        return {item_id: last - i for i, item_id in enumerate(reversed(self.ids))}
+
     def get(self, item_id: str) -> np.ndarray | None:
         """Get embedding by ID."""
-        try:
-            idx = self.ids.index(item_id)
-            # Check for mismatch between ids and embeddings (can happen with race conditions)
-            if idx >= len(self.embeddings):
-                return None
-            return self.embeddings[idx]
-        except ValueError:
+        idx = self._index.get(item_id)
+        # Check for mismatch between ids and embeddings (can happen with race conditions)
+        if idx is None or idx >= len(self.embeddings):
             return None
+        return self.embeddings[idx]
 
     def add(self, item_id: str, embedding: np.ndarray) -> EmbeddingStore:
         """Add or update an embedding. Returns new store (immutable)."""
@@ -523,11 +593,11 @@ class EmbeddingStore:
             self.embeddings.copy() if self.embeddings.size > 0 else np.empty((0, len(embedding)))
         )
 
-        try:
+        idx = self._index.get(item_id)
+        if idx is not None:
             # Update existing
-            idx = new_ids.index(item_id)
             new_embeddings[idx] = embedding
-        except ValueError:
+        else:
             # Add new
             new_ids.append(item_id)
             new_embeddings = (
@@ -538,15 +608,46 @@ class EmbeddingStore:
 
         return EmbeddingStore(ids=new_ids, embeddings=new_embeddings)
 
+    def add_many(
+        self, item_ids: Sequence[str], embeddings: np.ndarray | Sequence[np.ndarray]
+    ) -> EmbeddingStore:
+        """Add or update several embeddings. Returns new store (immutable).
+
+        Same result as calling add() for each pair in order, but the
+        matrix is copied once instead of once per item.
+
+        Args:
+            item_ids: IDs, one per row of ``embeddings``
+            embeddings: One embedding per ID, as a 2D array or a list of 1D arrays
+        """
+        if not item_ids:
+            return self
+        embeddings = np.asarray(embeddings)
+
+        # Last row wins for a repeated ID; new IDs keep first-seen order
+        rows = {item_id: row for row, item_id in enumerate(item_ids)}
+        updates = [(self._index[i], row) for i, row in rows.items() if i in self._index]
+        appended = [(i, row) for i, row in rows.items() if i not in self._index]
+
+        base = self.embeddings if self.embeddings.size > 0 else np.empty((0, embeddings.shape[1]))
+        if appended:
+            new_embeddings = np.concatenate([base, embeddings[[row for _, row in appended]]])
+        else:
+            new_embeddings = base.copy()
+        if updates:
+            new_embeddings[[idx for idx, _ in updates]] = embeddings[[row for _, row in updates]]
+
+        new_ids = [*self.ids, *(item_id for item_id, _ in appended)]
+        return EmbeddingStore(ids=new_ids, embeddings=new_embeddings)
+
     def remove(self, item_id: str) -> EmbeddingStore:
         """Remove an embedding by ID. Returns new store (immutable)."""
-        try:
-            idx = self.ids.index(item_id)
-            new_ids = [id_ for i, id_ in enumerate(self.ids) if i != idx]
-            new_embeddings = np.delete(self.embeddings, idx, axis=0)
-            return EmbeddingStore(ids=new_ids, embeddings=new_embeddings)
-        except ValueError:
+        idx = self._index.get(item_id)
+        if idx is None:
             return self  # ID not found, return unchanged
+        new_ids = self.ids[:idx] + self.ids[idx + 1 :]
+        new_embeddings = np.delete(self.embeddings, idx, axis=0)
+        return EmbeddingStore(ids=new_ids, embeddings=new_embeddings)
 
 
 def _load_embeddings_metadata() -> dict:
@@ -590,11 +691,41 @@ def check_model_mismatch() -> tuple[bool, str | None, str | None]:
     return is_mismatch, stored_model, current_model
 
 
+def _quantize_rows(embeddings: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Quantize embeddings to int8 with one float32 scale per row.
+
+    Each row is recovered as ``quantized * scale``; scaling by the row's own
+    peak keeps the error small relative to that row's norm.
+    """
+    peak = np.abs(embeddings).max(axis=1)
+    scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+    quantized = np.round(embeddings / scales[:, None]).astype(np.int8)
+    return quantized, scales
+
+
+def _dequantize_rows(quantized: np.ndarray, scales: list[float] | None) -> np.ndarray:
+    """Decode int8 rows saved by save_embeddings back to unit-norm float32.
+
+    Rounding leaves rows slightly off unit length, so they are renormalized
+    once here rather than on every search. Rows without a matching scale
+    (interrupted save) are dropped; the usual count-mismatch recovery in
+    load_embeddings then trims the IDs to match.
+    """
+    scale_arr = np.asarray(scales or [], dtype=np.float32)
+    count = min(len(scale_arr), quantized.shape[0])
+    rows = quantized[:count].astype(np.float32) * scale_arr[:count, None]
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    return np.divide(rows, norms, out=rows, where=norms > 0)
+
+
 def load_embeddings(path: Path) -> Result[EmbeddingStore, SageError]:
     """Load embeddings from disk.
 
     Embeddings are stored as .npy (no pickle) with IDs in a separate .json file
     for security (avoids arbitrary code execution from malicious pickle data).
+    float16 files (the default) and int8 files written with
+    ``embedding_quantize`` are decoded to float32; float32 files are
+    memory-mapped read-only (store operations always copy).
 
     If the model has changed since embeddings were saved, returns empty store
     to trigger rebuild.
@@ -625,16 +756,29 @@ def load_embeddings(path: Path) -> Result[EmbeddingStore, SageError]:
 
     try:
         with _embedding_file_lock(path):
-            # Load embeddings without pickle (security)
-            embeddings = np.load(path, allow_pickle=False)
-
-            # Load IDs from JSON
+            # Load embeddings without pickle (security). Memory-mapped so the
+            # page cache serves rows on demand instead of a full read per call;
+            # saves replace the file by rename, so an open mapping stays valid.
+            # asarray drops the memmap subclass, leaving a read-only ndarray.
+            embeddings = np.asarray(np.load(path, mmap_mode="r", allow_pickle=False))
+
+            # Load IDs from JSON (a dict with per-row scales when quantized)
+            scales = None
             if ids_path.exists():
                 with open(ids_path) as f:
                     ids = json.load(f)
+                if isinstance(ids, dict):
+                    scales = ids.get("scales")
+                    ids = ids.get("ids", [])
             else:
                 ids = []
 
+            if embeddings.dtype == np.int8:
+                embeddings = _dequantize_rows(embeddings, scales)
+            elif embeddings.dtype != np.float32:
+                # float16 (the default on save): widen once for the float32 matmul
+                embeddings = embeddings.astype(np.float32)
+
             # Check dimension mismatch (catches cases without metadata file)
             if embeddings.size > 0:
                 current_model = get_configured_model()
@@ -683,6 +827,10 @@ def save_embeddings(path: Path, store: EmbeddingStore) -> Result[None, SageError
 
     Also saves metadata about the model used for mismatch detection.
 
+    Rows are stored as float16. With ``embedding_quantize`` enabled they are
+    stored as int8 instead, and the per-row scales are kept next to the IDs,
+    so the pair stays atomic.
+
     Thread-safe: Uses file locking to prevent race conditions with concurrent
     saves. Both files are written atomically (temp file + rename) to ensure
     consistency.
@@ -704,6 +852,8 @@ def save_embeddings(path: Path, store: EmbeddingStore) -> Result[None, SageError
         with _embedding_file_lock(path):
             import os
 
+            from sage.config import get_sage_config
+
             # Create temp files for atomic write
             # Using tempfile in same directory ensures atomic rename works
             # Note: np.save auto-appends .npy, so we use .npy suffix to match
@@ -722,14 +872,23 @@ def save_embeddings(path: Path, store: EmbeddingStore) -> Result[None, SageError
             temp_json_path = Path(temp_json)
 
             try:
+                # float16 halves the file (and load I/O) at ~1e-4 error on
+                # unit vectors; int8 quarters it when quantization is enabled
+                embeddings = store.embeddings.astype(np.float16)
+                ids_payload: list[str] | dict = store.ids
+                quantize = get_sage_config().embedding_quantize
+                if quantize and store.embeddings.ndim == 2 and len(store):
+                    embeddings, scales = _quantize_rows(store.embeddings)
+                    ids_payload = {"ids": store.ids, "scales": scales.tolist()}
+
                 # Save embeddings to temp file
                 os.close(fd_npy)  # np.save needs to open the file itself
-                np.save(temp_npy_path, store.embeddings)
+                np.save(temp_npy_path, embeddings)
                 temp_npy_path.chmod(0o600)
 
                 # Save IDs to temp file
                 with os.fdopen(fd_json, "w") as f:
-                    json.dump(store.ids, f)
+                    json.dump(ids_payload, f)
                 temp_json_path.chmod(0o600)
 
                 # Atomic rename both files (order matters: embeddings first)
@@ -794,20 +953,16 @@ def find_similar(
     # Compute similarities
     similarities = cosine_similarity_matrix(query_embedding, store.embeddings)
 
-    # Filter and sort
-    results = []
-    for idx, score in enumerate(similarities):
-        if score >= threshold:
-            results.append(SimilarItem(id=store.ids[idx], score=float(score)))
-
-    # Sort by score descending
-    results.sort(key=lambda x: x.score, reverse=True)
+    # Filter and sort in numpy; only returned rows become SimilarItems.
+    # A stable sort keeps equal scores in store order.
+    candidates = np.flatnonzero(similarities >= threshold)
+    order = candidates[np.argsort(-similarities[candidates], kind="stable")]
 
     # Limit results
     if top_k is not None:
-        results = results[:top_k]
+        order = order[:top_k]
 
-    return results
+    return [SimilarItem(id=store.ids[idx], score=float(similarities[idx])) for idx in order]
 
 
 def get_knowledge_embeddings_path() -> Path:
@@ -20,11 +20,16 @@ Example failure:
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import yaml
 
@@ -36,6 +41,10 @@ logger = logging.getLogger(__name__)
 # Global failures directory
 FAILURES_DIR = SAGE_DIR / "failures"
 
+# Prefer the libyaml-backed classes; fall back to pure Python if unavailable
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def _get_failures_dir(project_path: Path | None = None) -> Path:
     """Get the failures directory, preferring project-local.
@@ -113,8 +122,12 @@ def _failure_to_markdown(failure: Failure) -> str:
     # Remove None values
     frontmatter = {k: v for k, v in frontmatter.items() if v is not None}
 
-    fm_yaml = yaml.safe_dump(
-        frontmatter, default_flow_style=False, sort_keys=False, allow_unicode=True
+    fm_yaml = yaml.dump(
+        frontmatter,
+        Dumper=_YamlDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
     )
 
     body = f"""## Why it failed
@@ -140,7 +153,7 @@ def _markdown_to_failure(content: str) -> Failure | None:
         fm_text = content[3:end_idx].strip()
         body = content[end_idx + 3:].strip()
 
-        fm = yaml.safe_load(fm_text) or {}
+        fm = yaml.load(fm_text, Loader=_YamlLoader) or {}  # noqa: S506 - a SafeLoader
 
         # Parse body sections
         why_failed = ""
@@ -252,9 +265,16 @@ def save_failure(
     return failure
 
 
+# Parsed failure files keyed by path, with the (mtime_ns, size) they were read at
+_failure_cache: dict[Path, tuple[tuple[int, int], Failure | None]] = {}
+
+
 def load_failures(project_path: Path | None = None) -> list[Failure]:
     """Load all failure records.
 
+    Files whose mtime and size are unchanged since the last load are not
+    re-read or re-parsed, so repeated recalls cost one stat per file.
+
     Args:
         project_path: Optional project path
 
@@ -266,16 +286,34 @@ def load_failures(project_path: Path | None = None) -> list[Failure]:
     if not failures_dir.exists():
         return []
 
+    # Same files and order as sorted(glob("*.md"), reverse=True)
+    with os.scandir(failures_dir) as it:
+        names = sorted((e.name for e in it if e.name.endswith(".md")), reverse=True)
+
     failures = []
-    for file_path in sorted(failures_dir.glob("*.md"), reverse=True):
+    for name in names:
+        file_path = failures_dir / name
         try:
-            content = file_path.read_text()
-            failure = _markdown_to_failure(content)
+            # Stat before reading: a concurrent write then only makes the key stale
+            st = file_path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            cached = _failure_cache.get(file_path)
+            if cached is not None and cached[0] == key:
+                failure = cached[1]
+            else:
+                failure = _markdown_to_failure(file_path.read_text())
+                _failure_cache[file_path] = (key, failure)
             if failure:
                 failures.append(failure)
         except OSError as e:
             logger.warning(f"Failed to read failure file {file_path}: {e}")
 
+    # Drop entries for files deleted from this directory so the cache can't grow
+    present = set(names)
+    stale = [p for p in _failure_cache if p.parent == failures_dir and p.name not in present]
+    for path in stale:
+        del _failure_cache[path]
+
     return failures
 
 
@@ -301,24 +339,27 @@ def recall_failures(
 
     # Try semantic search if embeddings available
     try:
+        import numpy as np
+
         from sage import embeddings
 
         if embeddings.is_available():
             similarities = _get_failure_similarities(query)
             if similarities:
-                # Score and rank failures
-                scored: list[tuple[Failure, float]] = []
-                for f in failures:
-                    # Combine embedding similarity with keyword matching
-                    emb_score = similarities.get(f.id, 0.0)
-                    kw_score = _keyword_score(f, query)
-                    combined = 0.7 * emb_score + 0.3 * kw_score
-                    scored.append((f, combined))
-
-                # Sort by score and filter
-                scored.sort(key=lambda x: x[1], reverse=True)
+                # Combine embedding similarity with keyword matching
+                count = len(failures)
+                emb_scores = np.fromiter(
+                    (similarities.get(f.id, 0.0) for f in failures), dtype=np.float64, count=count
+                )
+                kw_scores = np.fromiter(
+                    (_keyword_score(f, query) for f in failures), dtype=np.float64, count=count
+                )
+                combined = 0.7 * emb_scores + 0.3 * kw_scores
+
+                # Rank (stable, so ties keep most-recent-first order) and filter
+                top = np.argsort(-combined, kind="stable")[:limit]
                 threshold = 0.3  # Minimum score to include
-                return [f for f, score in scored[:limit] if score >= threshold]
+                return [failures[i] for i in top if combined[i] >= threshold]
     except Exception as e:
         logger.debug(f"Semantic failure search failed, using keyword: {e}")
 
@@ -326,21 +367,40 @@ def recall_failures(
     return _keyword_recall(failures, query, limit)
 
 
+_WORD_RE = re.compile(r"\w+")
+
+
+@functools.lru_cache(maxsize=64)
+def _query_words(query_lower: str) -> frozenset[str]:
+    """Word tokens of a lowercased query; shared by every failure scored against it."""
+    return frozenset(_WORD_RE.findall(query_lower))
+
+
+@functools.lru_cache(maxsize=512)
+def _keyword_pattern(kw_lower: str) -> re.Pattern[str]:
+    """Whole-word pattern for a keyword containing non-word characters."""
+    return re.compile(rf"\b{re.escape(kw_lower)}\b")
+
+
 def _keyword_score(failure: Failure, query: str) -> float:
     """Score a failure against a query using keyword matching.
 
     Returns score in 0-1 range.
     """
     query_lower = query.lower()
+    words = _query_words(query_lower)
     score = 0
 
     for kw in failure.keywords:
         kw_lower = kw.lower()
         if kw_lower in query_lower:
-            if re.search(rf"\b{re.escape(kw_lower)}\b", query_lower):
-                score += 2  # Exact word match
+            # A keyword of only word characters is bounded by \b exactly
+            # when it is a whole query word, so a set lookup replaces the regex
+            if _WORD_RE.fullmatch(kw_lower):
+                exact = kw_lower in words
             else:
-                score += 1  # Partial match
+                exact = _keyword_pattern(kw_lower).search(query_lower) is not None
+            score += 2 if exact else 1  # Exact word match vs partial match
 
     # Normalize to 0-1 range (max realistic score ~6)
     return min(score / 6.0, 1.0)
@@ -363,15 +423,44 @@ def _keyword_recall(
 # =============================================================================
 
 
+# Loaded failure embedding stores keyed by path, with the (mtime_ns, size) of
+# the array and ID files they were read at
+_embedding_store_cache: dict[Path, tuple[tuple[int, int, int, int], Any]] = {}
+
+
+def _embedding_files_key(path: Path) -> tuple[int, int, int, int] | None:
+    """Stat the embeddings array and its ID file; None if either is missing."""
+    try:
+        st = path.stat()
+        ids_st = path.with_suffix(".json").stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, ids_st.st_mtime_ns, ids_st.st_size)
+
+
 def _get_failure_embedding_store():
-    """Load the failure embedding store."""
+    """Load the failure embedding store.
+
+    Reuses the previous load while neither file has changed, so repeated
+    recalls in one process pay a stat instead of a re-read. Both files are
+    keyed because a save renames them one after the other.
+    """
     from sage import embeddings
 
     path = SAGE_DIR / "embeddings" / "failures.pkl"
+    # Stat before loading: a concurrent save then only makes the key stale
+    key = _embedding_files_key(path)
+    cached = _embedding_store_cache.get(path)
+    if key is not None and cached is not None and cached[0] == key:
+        return cached[1]
+
     result = embeddings.load_embeddings(path)
     if result.is_err():
         return embeddings.EmbeddingStore.empty()
-    return result.unwrap()
+    store = result.unwrap()
+    if key is not None:
+        _embedding_store_cache[path] = (key, store)
+    return store
 
 
 def _save_failure_embedding_store(store) -> bool:
@@ -381,17 +470,65 @@ def _save_failure_embedding_store(store) -> bool:
     path = SAGE_DIR / "embeddings" / "failures.pkl"
     path.parent.mkdir(parents=True, exist_ok=True)
     result = embeddings.save_embeddings(path, store)
+    _embedding_store_cache.pop(path, None)
+    return result.is_ok()
+
+
+def _failure_hashes_path() -> Path:
+    """Path of the {failure_id: content hash} file for stored embeddings."""
+    return SAGE_DIR / "embeddings" / "failure_hashes.json"
+
+
+def _load_failure_embedding_hashes() -> dict[str, str]:
+    """Load content hashes of embedded failures; empty if missing or unreadable."""
+    try:
+        with open(_failure_hashes_path()) as f:
+            hashes = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return hashes if isinstance(hashes, dict) else {}
+
+
+def _save_failure_embedding_hash(failure_id: str, content_hash: str, ids: list[str]) -> bool:
+    """Record a failure's content hash, dropping hashes for ids not in ``ids``.
+
+    The file is re-read and replaced under the same lock as the embedding
+    store save, so concurrent saves merge their entries instead of one
+    overwriting the other.
+    """
+    from sage.atomic import atomic_write_json
+    from sage.embeddings import _embedding_file_lock
+
+    live = set(ids)
+    with _embedding_file_lock(SAGE_DIR / "embeddings" / "failures.pkl"):
+        hashes = _load_failure_embedding_hashes()
+        hashes[failure_id] = content_hash
+        hashes = {fid: h for fid, h in hashes.items() if fid in live}
+        result = atomic_write_json(_failure_hashes_path(), hashes, mode=0o600, indent=None)
     return result.is_ok()
 
 
 def _add_failure_embedding(failure_id: str, content: str) -> bool:
-    """Generate and store embedding for a failure."""
+    """Generate and store embedding for a failure.
+
+    Skips the model call when the failure is already embedded with the same
+    content and model, e.g. when an unchanged failure is saved again.
+    """
     from sage import embeddings
 
     if not embeddings.is_available():
         return False
 
     try:
+        key = f"{embeddings.get_configured_model()}\0{content}"
+        content_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        hashes = _load_failure_embedding_hashes()
+        if (
+            hashes.get(failure_id) == content_hash
+            and _get_failure_embedding_store().get(failure_id) is not None
+        ):
+            return True
+
         result = embeddings.get_embedding(content)
         if result.is_err():
             return False
@@ -399,7 +536,12 @@ def _add_failure_embedding(failure_id: str, content: str) -> bool:
         embedding = result.unwrap()
         store = _get_failure_embedding_store()
         store = store.add(failure_id, embedding)
-        return _save_failure_embedding_store(store)
+        if not _save_failure_embedding_store(store):
+            return False
+
+        # Written after the store, so a crash in between only costs a re-embed
+        _save_failure_embedding_hash(failure_id, content_hash, store.ids)
+        return True
     except Exception as e:
         logger.debug(f"Failed to add failure embedding: {e}")
         return False
@@ -423,8 +565,14 @@ def _get_failure_similarities(query: str) -> dict[str, float]:
         if len(store) == 0:
             return {}
 
-        similar_items = embeddings.find_similar(query_embedding, store, threshold=0.0)
-        return {item.id: item.score for item in similar_items}
+        # Every failure gets scored, so skip find_similar's ranking and
+        # per-item objects; same >= 0.0 cut as its threshold
+        scores = embeddings.cosine_similarity_matrix(query_embedding, store.embeddings)
+        return {
+            item_id: score
+            for item_id, score in zip(store.ids, scores.tolist(), strict=False)
+            if score >= 0.0
+        }
     except Exception:
         return {}
 
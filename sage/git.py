@@ -284,14 +284,34 @@ def capture_git_context(path: Path | None = None, recent_count: int = 3) -> GitC
     Returns:
         GitContext or None if not a git repo
     """
-    if not is_git_repo(path):
+    # One status call answers "is this a repo", the branch, and dirtiness;
+    # one log call gives HEAD's short SHA and the recent commits. Same values
+    # as the individual helpers, in two git processes instead of five.
+    status = _run_git(["status", "--porcelain=v2", "--branch"], cwd=path)
+    if status is None:
         return None
 
+    branch = ""
+    dirty = False
+    for line in status.split("\n"):
+        if line.startswith("# branch.head "):
+            branch = line.removeprefix("# branch.head ")
+        elif line and not line.startswith("#"):
+            dirty = True  # Changed, unmerged, or untracked entry (headers come first)
+            break
+
+    if branch == "(detached)":
+        # Detached HEAD - try to get a meaningful name, as get_branch does
+        branch = _run_git(["describe", "--tags", "--always"], cwd=path) or ""
+
+    log = _run_git(["log", f"-{max(recent_count, 1)}", "--oneline", "--no-decorate"], cwd=path)
+    lines = log.split("\n") if log else []
+
     return GitContext(
-        branch=get_branch(path),
-        commit=get_commit(path),
-        dirty=is_dirty(path),
-        recent_commits=get_recent_commits(path, recent_count),
+        branch=branch,
+        commit=lines[0].split(" ", 1)[0] if lines else "",
+        dirty=dirty,
+        recent_commits=tuple(lines[: max(recent_count, 0)]),
     )
 
 
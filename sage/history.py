@@ -4,12 +4,19 @@ Append-only JSONL logs for tracking interactions, costs, and analytics.
 """
 
 import json
-from dataclasses import asdict, dataclass
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from sage.config import get_sage_skill_path
 
+# Read buffer for history files. Larger than the 8 KiB default so long
+# histories are read in a handful of syscalls.
+_READ_BUFFER_SIZE = 256 * 1024
+
 
 @dataclass(frozen=True)
 class HistoryEntry:
@@ -29,6 +36,17 @@ class HistoryEntry:
     session: str | None = None
     turns: int | None = None  # for chat sessions
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-ready dict, omitting fields that are None.
+
+        Shallow on purpose: all fields are scalars, so this skips the
+        recursive copy that dataclasses.asdict makes.
+        """
+        return {name: value for name in _ENTRY_FIELDS if (value := getattr(self, name)) is not None}
+
+
+_ENTRY_FIELDS = tuple(f.name for f in fields(HistoryEntry))
+
 
 def create_entry(
     entry_type: str,
@@ -80,34 +98,38 @@ def append_entry(skill_name: str, entry: HistoryEntry) -> None:
     path = get_history_path(skill_name)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert to dict, removing None values
-    data = {k: v for k, v in asdict(entry).items() if v is not None}
-
     with open(path, "a") as f:
-        f.write(json.dumps(data) + "\n")
+        f.write(json.dumps(entry.to_dict()) + "\n")
     # Restrict permissions - history may contain sensitive queries
     path.chmod(0o600)
 
 
+def _iter_records(path: Path) -> Iterator[dict]:
+    """Yield raw JSON records from a history file, skipping blank lines."""
+    with open(path, buffering=_READ_BUFFER_SIZE) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 def read_history(skill_name: str, limit: int | None = None) -> list[HistoryEntry]:
     """Read history entries for a skill, most recent first."""
     path = get_history_path(skill_name)
     if not path.exists():
         return []
 
-    entries = []
-    with open(path) as f:
-        for line in f:
-            if line.strip():
-                data = json.loads(line)
-                entries.append(HistoryEntry(**data))
+    if limit is not None and limit > 0:
+        # Only the last `limit` lines are kept in memory and parsed
+        with open(path, buffering=_READ_BUFFER_SIZE) as f:
+            tail = deque((line for line in f if line.strip()), maxlen=limit)
+        records = map(json.loads, tail)
+    else:
+        records = _iter_records(path)
+
+    entries = [HistoryEntry(**data) for data in records]
 
     # Most recent first
     entries.reverse()
-
-    if limit:
-        entries = entries[:limit]
-
     return entries
 
 
@@ -117,31 +139,52 @@ def get_recent_context(skill_name: str, max_entries: int = 5) -> list[dict]:
     return [{"query": e.query, "type": e.type, "ts": e.ts} for e in entries]
 
 
+def _usage_since(path: Path, cutoff: float) -> dict:
+    """Sum usage from one history file for entries newer than ``cutoff``.
+
+    Streams the file and sums matching records as it goes, without
+    materialising the full entry list. A missing file counts as no usage.
+    """
+    stats = {
+        "tokens_in": 0,
+        "tokens_out": 0,
+        "searches": 0,
+        "cost": 0.0,
+        "cache_hits": 0,
+        "entries": 0,
+    }
+    try:
+        for data in _iter_records(path):
+            if datetime.fromisoformat(data["ts"].replace("Z", "+00:00")).timestamp() <= cutoff:
+                continue
+            stats["tokens_in"] += data["tokens_in"]
+            stats["tokens_out"] += data["tokens_out"]
+            stats["searches"] += data["searches"]
+            stats["cost"] += data["cost"]
+            stats["cache_hits"] += data.get("cache_hits", 0)
+            stats["entries"] += 1
+    except FileNotFoundError:
+        pass
+
+    stats["cost"] = round(stats["cost"], 2)
+    return stats
+
+
+def _usage_cutoff(days: int) -> float:
+    """Timestamp before which entries fall outside a ``days`` window."""
+    return datetime.now(UTC).timestamp() - (days * 86400)
+
+
 def calculate_usage(skill_name: str, days: int = 7) -> dict:
     """Calculate usage statistics for a skill over a time period."""
-    entries = read_history(skill_name)
-    if not entries:
-        return {
-            "tokens_in": 0,
-            "tokens_out": 0,
-            "searches": 0,
-            "cost": 0.0,
-            "cache_hits": 0,
-            "entries": 0,
-        }
-
-    cutoff = datetime.now(UTC).timestamp() - (days * 86400)
-    recent = [
-        e
-        for e in entries
-        if datetime.fromisoformat(e.ts.replace("Z", "+00:00")).timestamp() > cutoff
-    ]
-
-    return {
-        "tokens_in": sum(e.tokens_in for e in recent),
-        "tokens_out": sum(e.tokens_out for e in recent),
-        "searches": sum(e.searches for e in recent),
-        "cost": round(sum(e.cost for e in recent), 2),
-        "cache_hits": sum(e.cache_hits for e in recent),
-        "entries": len(recent),
-    }
+    return _usage_since(get_history_path(skill_name), _usage_cutoff(days))
+
+
+def calculate_usage_batch(skill_names: Iterable[str], days: int = 7) -> dict[str, dict]:
+    """Calculate usage statistics for several skills over the same period.
+
+    Shares one cutoff across skills and reads each history file once.
+    Returns a dict keyed by skill name, in input order.
+    """
+    cutoff = _usage_cutoff(days)
+    return {name: _usage_since(get_history_path(name), cutoff) for name in skill_names}
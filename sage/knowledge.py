@@ -693,10 +693,8 @@ def rebuild_all_embeddings() -> tuple[int, int]:
     batch_embeddings = result.unwrap()
 
     # Build new store
-    store = embeddings.EmbeddingStore.empty()
-    for i, item_id in enumerate(ids):
-        store = store.add(item_id, batch_embeddings[i])
-        success += 1
+    store = embeddings.EmbeddingStore.empty().add_many(ids, batch_embeddings)
+    success += len(ids)
 
     _save_embedding_store(store)
     logger.info(f"Rebuilt {success} embeddings")
@@ -5,7 +5,9 @@ Sage metadata is stored in ~/.sage/skills/.
 """
 
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from difflib import get_close_matches
 from pathlib import Path
@@ -78,8 +80,8 @@ Cross-skill insights are injected below. These represent learnings from other re
 """
 
 
-def list_skills() -> list[str]:
-    """List all Sage-managed skills."""
+def _read_managed_skills() -> list[tuple[str, str]]:
+    """(name, SKILL.md content) for every Sage-managed skill, sorted by name."""
     if not SKILLS_DIR.exists():
         return []
 
@@ -91,7 +93,7 @@ def list_skills() -> list[str]:
                 try:
                     content = skill_md.read_text()
                     if "sage_managed: true" in content:
-                        skills.append(skill_dir.name)
+                        skills.append((skill_dir.name, content))
                 except OSError as e:
                     logger.warning("Could not read skill %s: %s", skill_dir.name, e)
                     continue
@@ -99,6 +101,11 @@ def list_skills() -> list[str]:
     return sorted(skills)
 
 
+def list_skills() -> list[str]:
+    """List all Sage-managed skills."""
+    return [name for name, _ in _read_managed_skills()]
+
+
 def find_similar_skills(name: str) -> list[str]:
     """Find skills with similar names."""
     all_skills = list_skills()
@@ -142,8 +149,34 @@ def parse_skill_frontmatter(content: str) -> SkillMetadata | None:
         return None
 
 
-def load_skill(name: str) -> Result[Skill, SageError]:
-    """Load a skill with all its context."""
+def list_doc_sizes(name: str) -> list[tuple[str, int]]:
+    """List a skill's docs as (filename, size in bytes), without reading them.
+
+    Same files and order as ``Skill.docs``, for views that only need sizes.
+    """
+    docs_dir = get_skill_path(name) / "docs"
+    sizes = []
+    try:
+        with os.scandir(docs_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md"):
+                    continue
+                try:
+                    if entry.is_file():
+                        sizes.append((entry.name, entry.stat().st_size))
+                except OSError as e:
+                    logger.warning("Could not stat doc %s: %s", entry.name, e)
+    except FileNotFoundError:
+        return []
+    return sorted(sizes)
+
+
+def load_skill(name: str, include_docs: bool = True) -> Result[Skill, SageError]:
+    """Load a skill with all its context.
+
+    With ``include_docs=False`` the docs are not read and ``Skill.docs`` is
+    empty; use :func:`list_doc_sizes` when only their sizes are needed.
+    """
     skill_path = get_skill_path(name)
     skill_md = skill_path / "SKILL.md"
 
@@ -174,7 +207,7 @@ def load_skill(name: str) -> Result[Skill, SageError]:
     # Load docs
     docs = []
     docs_dir = skill_path / "docs"
-    if docs_dir.exists():
+    if include_docs and docs_dir.exists():
         for doc_path in sorted(docs_dir.glob("*.md")):
             try:
                 docs.append((doc_path.name, doc_path.read_text()))
@@ -280,12 +313,40 @@ def create_skill(
 
 def get_skill_info(name: str) -> Result[dict, SageError]:
     """Get comprehensive info about a skill."""
-    result = load_skill(name)
+    result = load_skill(name, include_docs=False)
     if not result.ok:
         return result
 
     skill = result.value
-    history = read_history(name, limit=5)
+    return ok(_skill_info(name, skill.metadata, skill.shared_memory))
+
+
+def get_all_skill_info() -> dict[str, dict]:
+    """Get info for every Sage-managed skill, keyed by name in sorted order.
+
+    Each SKILL.md and the shared memory file are read once for the whole
+    listing, and the per-skill reads run concurrently. Skills whose
+    frontmatter cannot be parsed are left out.
+    """
+    skills = []
+    for name, content in _read_managed_skills():
+        metadata = parse_skill_frontmatter(content)
+        if metadata:
+            skills.append((name, metadata))
+    if not skills:
+        return {}
+
+    shared_memory = load_shared_memory()
+    # Per-skill info is mostly file reads; map() keeps results in order
+    with ThreadPoolExecutor(max_workers=min(32, len(skills))) as pool:
+        infos = pool.map(lambda skill: _skill_info(*skill, shared_memory), skills)
+        return {name: info for (name, _), info in zip(skills, infos, strict=True)}
+
+
+def _skill_info(name: str, metadata: SkillMetadata, shared_memory: str) -> dict:
+    """Info dict for a skill whose SKILL.md has already been parsed."""
+    doc_sizes = list_doc_sizes(name)
+    history = read_history(name)
     sage_path = get_sage_skill_path(name)
 
     # Count sessions
@@ -297,21 +358,19 @@ def get_skill_info(name: str) -> Result[dict, SageError]:
     if history:
         last_active = history[0].ts
 
-    # Calculate doc sizes (rough token estimate: 1 token ≈ 4 chars)
-    doc_info = [{"name": name, "tokens": len(content) // 4} for name, content in skill.docs]
-
-    return ok(
-        {
-            "name": skill.name,
-            "metadata": skill.metadata,
-            "docs": doc_info,
-            "doc_count": len(skill.docs),
-            "session_count": session_count,
-            "history_count": len(read_history(name)),
-            "last_active": last_active,
-            "shared_memory_size": len(skill.shared_memory) // 4,  # rough token estimate
-        }
-    )
+    # Calculate doc sizes (rough token estimate: 1 token ≈ 4 bytes)
+    doc_info = [{"name": doc_name, "tokens": size // 4} for doc_name, size in doc_sizes]
+
+    return {
+        "name": name,
+        "metadata": metadata,
+        "docs": doc_info,
+        "doc_count": len(doc_sizes),
+        "session_count": session_count,
+        "history_count": len(history),
+        "last_active": last_active,
+        "shared_memory_size": len(shared_memory) // 4,  # rough token estimate
+    }
 
 
 def build_context(skill: Skill, include_docs: bool = True) -> str:
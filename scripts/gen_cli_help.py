@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Regenerate the static ``--help`` text answered by ``sage/__main__.py``.
+
+``sage --help`` and ``sage <group> --help`` are printed from
+``sage/_help.py`` without importing Click. Run this after changing any
+command group, option or docstring:
+
+Usage:
+    python scripts/gen_cli_help.py          # Rewrite sage/_help.py
+    python scripts/gen_cli_help.py --check  # Exit 1 if it is stale
+"""
+
+import sys
+from pathlib import Path
+
+# Root of the repo
+ROOT = Path(__file__).parent.parent
+HELP_FILE = ROOT / "sage" / "_help.py"
+
+# Click wraps help to the terminal width, capped at 80 columns
+WIDTH = 80
+
+HEADER = '''"""Pre-rendered ``--help`` text for ``sage`` and its command groups.
+
+Generated by ``scripts/gen_cli_help.py`` -- do not edit by hand.
+"""
+
+'''
+
+
+def render_help() -> dict[str, str]:
+    """Render help for the top-level CLI and every command group."""
+    import click
+    from click.testing import CliRunner
+
+    from sage.cli import main
+
+    runner = CliRunner()
+
+    def invoke(args: list[str]) -> str:
+        result = runner.invoke(main, args, prog_name="sage", terminal_width=WIDTH)
+        if result.exit_code != 0:
+            raise RuntimeError(f"sage {' '.join(args)} failed:\n{result.output}")
+        return result.output
+
+    ctx = click.Context(main)
+    help_text = {"main": invoke(["--help"])}
+    for name in main.list_commands(ctx):
+        if isinstance(main.get_command(ctx, name), click.Group):
+            help_text[name] = invoke([name, "--help"])
+    return help_text
+
+
+def _quote(text: str) -> str:
+    """Double-quoted Python literal for one line of help text."""
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def render_module(help_text: dict[str, str]) -> str:
+    """Render the contents of sage/_help.py, one source line per help line."""
+    lines = [HEADER, "HELP = {\n"]
+    for name, text in help_text.items():
+        lines.append(f"    {_quote(name)}: (\n")
+        lines += [f"        {_quote(line)}\n" for line in text.splitlines(keepends=True)]
+        lines.append("    ),\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main() -> int:
+    sys.path.insert(0, str(ROOT))
+    content = render_module(render_help())
+
+    if "--check" in sys.argv:
+        if HELP_FILE.read_text() != content:
+            print(f"{HELP_FILE.relative_to(ROOT)} is stale; run scripts/gen_cli_help.py")
+            return 1
+        print(f"{HELP_FILE.relative_to(ROOT)} is up to date")
+        return 0
+
+    HELP_FILE.write_text(content)
+    print(f"Wrote {HELP_FILE.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
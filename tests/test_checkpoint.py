@@ -176,6 +176,27 @@ class TestListCheckpoints:
         # Most recent first (alphabetically by filename, which has timestamp prefix)
         assert checkpoints[0].id == cp2.id
 
+    def test_list_interns_small_vocabulary_fields(self, mock_checkpoint_paths: Path):
+        """Repeated skill/type/relation strings share one object across loads."""
+        for i in range(2):
+            cp = Checkpoint(
+                id=f"2026-01-10T1{i}-00-00_intern-{i}",
+                ts=f"2026-01-10T1{i}:00:00+00:00",
+                trigger="manual",
+                core_question="Q?",
+                thesis=f"Thesis {i}",
+                confidence=0.5,
+                sources=[Source(id="s", type="document", take="t", relation="supports")],
+                skill="research-skill",
+            )
+            save_checkpoint(cp)
+
+        first, second = list_checkpoints()
+
+        assert first.skill is second.skill
+        assert first.sources[0].type is second.sources[0].type
+        assert first.sources[0].relation is second.sources[0].relation
+
     def test_list_respects_limit(self, mock_checkpoint_paths: Path):
         """list_checkpoints() respects limit parameter."""
         for i in range(5):
@@ -193,6 +214,38 @@ class TestListCheckpoints:
         assert len(checkpoints) == 3
 
 
+class TestReadaheadHints:
+    """Tests for posix_fadvise hints on checkpoint reads."""
+
+    def test_list_uses_sequential_hint(self, mock_checkpoint_paths: Path, sample_checkpoint):
+        """Directory scans advise sequential readahead."""
+        from sage import checkpoint as checkpoint_mod
+
+        save_checkpoint(sample_checkpoint)
+
+        with patch("sage.checkpoint._advise") as mock_advise:
+            list_checkpoints()
+
+        assert mock_advise.call_args[0][1] == checkpoint_mod._ADVICE_SEQUENTIAL
+
+    def test_load_uses_random_hint(self, mock_checkpoint_paths: Path, sample_checkpoint):
+        """Single loads advise random access."""
+        from sage import checkpoint as checkpoint_mod
+
+        save_checkpoint(sample_checkpoint)
+
+        with patch("sage.checkpoint._advise") as mock_advise:
+            load_checkpoint(sample_checkpoint.id)
+
+        assert mock_advise.call_args[0][1] == checkpoint_mod._ADVICE_RANDOM
+
+    def test_advise_ignores_missing_support(self):
+        """A None hint is a no-op."""
+        from sage.checkpoint import _advise
+
+        _advise(0, None)
+
+
 class TestDeleteCheckpoint:
     """Tests for delete_checkpoint()."""
 
@@ -259,6 +312,13 @@ class TestCreateCheckpointFromDict:
         assert cp.trigger == "synthesis"
         assert len(cp.sources) == 1
 
+    def test_id_timestamp_matches_ts(self):
+        """ID prefix and ts come from the same clock sample."""
+        cp = create_checkpoint_from_dict({"thesis": "Same instant"})
+
+        id_ts = cp.id.split("_", 1)[0]
+        assert id_ts == cp.ts[:19].replace(":", "-")
+
 
 class TestCheckpointMarkdownSerialization:
     """Tests for checkpoint markdown serialization/deserialization."""
@@ -483,6 +543,26 @@ class TestCheckpointBackwardCompatibility:
         assert loaded.thesis == "Legacy thesis"
         assert loaded.confidence == 0.7
 
+    def test_unquoted_timestamp_stays_string(self, mock_checkpoint_paths: Path):
+        """Hand-written unquoted timestamps load as the original string."""
+        md_path = mock_checkpoint_paths / "hand-written.md"
+        md_path.write_text(
+            "---\n"
+            "id: hand-written\n"
+            "ts: 2026-01-10T12:00:00Z\n"
+            "trigger: manual\n"
+            "confidence: 0.5\n"
+            "---\n\n"
+            "# Question?\n\n"
+            "## Thesis\n"
+            "Answer.\n"
+        )
+
+        loaded = load_checkpoint("hand-written")
+
+        assert loaded is not None
+        assert loaded.ts == "2026-01-10T12:00:00Z"
+
     def test_list_checkpoints_includes_both_formats(
         self, mock_checkpoint_paths: Path, sample_checkpoint
     ):
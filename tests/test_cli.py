@@ -54,6 +54,41 @@ class TestListCommand:
         # Either shows skills or indicates none
         assert len(result.output) > 0
 
+    def test_list_counts_shared_memory_insights(self, runner, tmp_path, monkeypatch):
+        """Only bullet lines in shared memory are counted as insights."""
+        memory = tmp_path / "shared_memory.md"
+        memory.write_text("# Insights\n- one\n  - two\nnot a bullet\n-\n- \n- three")
+        info = {
+            "doc_count": 0, "history_count": 0, "session_count": 0, "last_active": None,
+        }
+        monkeypatch.setattr("sage.config.SHARED_MEMORY_PATH", memory)
+        monkeypatch.setattr("sage.skill.get_all_skill_info", lambda: {"demo": info})
+
+        result = runner.invoke(main, ["list"])
+
+        assert result.exit_code == 0
+        assert "Shared memory: 3 insights" in result.output
+
+    def test_list_shows_one_row_per_skill(self, runner, monkeypatch):
+        """Rows follow the order of get_all_skill_info."""
+        def info(history_count):
+            return {
+                "doc_count": 1,
+                "history_count": history_count,
+                "session_count": 0,
+                "last_active": "2026-01-02T03:04:05",
+            }
+
+        monkeypatch.setattr(
+            "sage.skill.get_all_skill_info", lambda: {"alpha": info(7), "zeta": info(9)}
+        )
+
+        result = runner.invoke(main, ["list"])
+
+        assert result.exit_code == 0
+        assert result.output.index("alpha") < result.output.index("zeta")
+        assert "2026-01-02 03:04" in result.output
+
 
 class TestInitCommand:
     """Tests for the init command."""
@@ -101,6 +136,21 @@ class TestHistoryCommand:
         # CLI should accept the flag syntax
         assert "--limit" not in result.output  # No "unknown option" error
 
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["history", "demo", "-n", "-5"],
+            ["history", "demo", "--limit", "0"],
+            ["show", "demo", "0"],
+        ],
+    )
+    def test_non_positive_counts_are_usage_errors(self, runner, args):
+        """A limit or index below 1 is rejected by Click, not by a traceback."""
+        result = runner.invoke(main, args)
+
+        assert result.exit_code == 2
+        assert "is not in the range x>=1" in result.output
+
     def test_history_accepts_json_flag(self, runner):
         """History command accepts json flag."""
         result = runner.invoke(main, ["history", "some-skill", "--json"])
@@ -108,6 +158,52 @@ class TestHistoryCommand:
         # CLI should accept the flag syntax
         assert "--json" not in result.output  # No "unknown option" error
 
+    def test_history_json_emits_one_object_per_line(self, runner, monkeypatch):
+        """--json prints JSONL, most recent first, without None fields."""
+        import json
+
+        from sage.history import create_entry
+
+        entries = [
+            create_entry("ask", "second", "model", 2, 2, response="r"),
+            create_entry("ask", "first", "model", 1, 1),
+        ]
+        monkeypatch.setattr("sage.history.read_history", lambda name, limit=None: entries)
+
+        result = runner.invoke(main, ["history", "demo", "--json"])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert [json.loads(line)["query"] for line in lines] == ["second", "first"]
+        assert json.loads(lines[0])["response"] == "r"
+        assert "response" not in json.loads(lines[1])
+
+    def test_history_table_truncates_long_queries(self, runner, monkeypatch):
+        """Each entry becomes one table row, with long queries cut short."""
+        from sage.history import create_entry
+
+        entries = [
+            create_entry("ask", "q" * 80, "model", 1200, 34),
+            create_entry("research", "short", "model", 5, 6),
+        ]
+        monkeypatch.setattr("sage.history.read_history", lambda name, limit=None: entries)
+        printed = {}
+
+        def fake_print_table(columns, rows, right=()):
+            printed["columns"] = columns
+            printed["rows"] = list(rows)
+
+        monkeypatch.setattr("sage.cli.core.print_table", fake_print_table)
+
+        result = runner.invoke(main, ["history", "demo"])
+
+        assert result.exit_code == 0
+        assert printed["columns"] == ("TIME", "TYPE", "QUERY", "TOKENS", "COST")
+        assert [row[1:4] for row in printed["rows"]] == [
+            ("ask", "q" * 50 + "...", "1,200 / 34"),
+            ("research", "short", "5 / 6"),
+        ]
+
 
 class TestContextCommand:
     """Tests for the context command."""
@@ -126,6 +222,92 @@ class TestContextCommand:
         # Missing argument should error
         assert result.exit_code != 0
 
+    def test_context_reads_history_once(self, runner, monkeypatch):
+        """The header total and recent list come from one history read."""
+        from sage.errors import ok
+        from sage.history import create_entry
+        from sage.skill import Skill, SkillMetadata
+
+        skill = Skill(
+            name="demo",
+            metadata=SkillMetadata(name="demo", description="Demo skill"),
+            content="x" * 400,
+            docs=(),
+            shared_memory="- insight\n" * 4,
+        )
+        entries = [create_entry("ask", f"q{i}", "model", 1, 1) for i in range(7)]
+        reads = []
+
+        def fake_read_history(name, limit=None):
+            reads.append(limit)
+            return entries[:limit] if limit else entries
+
+        monkeypatch.setattr("sage.skill.load_skill", lambda name, **kw: ok(skill))
+        monkeypatch.setattr("sage.skill.list_doc_sizes", lambda name: [])
+        monkeypatch.setattr("sage.history.read_history", fake_read_history)
+
+        result = runner.invoke(main, ["context", "demo"])
+
+        assert result.exit_code == 0, result.output
+        assert reads == [None]
+        assert "RECENT HISTORY (last 5 of 7)" in result.output
+        assert "SHARED MEMORY (10 tokens)" in result.output
+
+    def test_context_sizes_docs_without_loading_them(self, runner, monkeypatch):
+        """Doc token estimates come from list_doc_sizes, not loaded contents."""
+        from sage.errors import ok
+        from sage.skill import Skill, SkillMetadata
+
+        loads = []
+
+        def fake_load_skill(name, include_docs=True):
+            loads.append(include_docs)
+            return ok(
+                Skill(
+                    name="demo",
+                    metadata=SkillMetadata(name="demo", description="Demo skill"),
+                    content="x" * 400,
+                    docs=(),
+                    shared_memory="",
+                )
+            )
+
+        monkeypatch.setattr("sage.skill.load_skill", fake_load_skill)
+        monkeypatch.setattr("sage.skill.list_doc_sizes", lambda name: [("ref.md", 800)])
+        monkeypatch.setattr("sage.history.read_history", lambda name, limit=None: [])
+
+        result = runner.invoke(main, ["context", "demo"])
+
+        assert result.exit_code == 0, result.output
+        assert loads == [False]
+        assert "DOCUMENTS (1)" in result.output
+        assert "ref.md" in result.output and "200 tokens" in result.output
+        assert "Skill + Docs:          300 tokens" in result.output
+
+    def test_context_lists_first_five_insights(self, runner, monkeypatch):
+        """Shared memory shows the first five bullet lines and a remainder count."""
+        from sage.errors import ok
+        from sage.skill import Skill, SkillMetadata
+
+        memory = "# Notes\n" + "".join(f"  - insight {i}\n" for i in range(7)) + "- \ntext\n"
+        skill = Skill(
+            name="demo",
+            metadata=SkillMetadata(name="demo", description="Demo skill"),
+            content="",
+            docs=(),
+            shared_memory=memory,
+        )
+        monkeypatch.setattr("sage.skill.load_skill", lambda name, **kw: ok(skill))
+        monkeypatch.setattr("sage.skill.list_doc_sizes", lambda name: [])
+        monkeypatch.setattr("sage.history.read_history", lambda name, limit=None: [])
+
+        result = runner.invoke(main, ["context", "demo"])
+
+        assert result.exit_code == 0, result.output
+        assert "insight 4" in result.output
+        assert "insight 5" not in result.output
+        assert "... and 2 more" in result.output
+
 
 class TestStatusCommand:
     """Tests for the status command."""
@@ -261,6 +443,21 @@ class TestKnowledgeCommands:
         assert result.exit_code != 0
         assert "not found" in result.output.lower()
 
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["knowledge", "add", "{path}", "--id", "x", "--keywords", "k"],
+            ["knowledge", "edit", "some-id", "--file", "{path}"],
+        ],
+    )
+    def test_knowledge_rejects_missing_or_directory_file(self, runner, tmp_path, args):
+        """File arguments must name an existing regular file."""
+        for path in (tmp_path / "missing.md", tmp_path):
+            result = runner.invoke(main, [a.format(path=path) for a in args])
+
+            assert result.exit_code == 2
+            assert "does not exist or is not a file" in result.output
+
     def test_knowledge_deprecate_help(self, runner):
         """Knowledge deprecate help shows options."""
         result = runner.invoke(main, ["knowledge", "deprecate", "--help"])
@@ -342,6 +539,260 @@ class TestErrorHandling:
         assert result.exit_code != 0
 
 
+class TestTodoCommands:
+    """Tests for the todo commands."""
+
+    def test_pending_lists_todos_with_keywords(self, runner, monkeypatch):
+        """Each pending todo is shown with up to five keywords."""
+        from types import SimpleNamespace
+
+        todos = [
+            SimpleNamespace(id="write-docs", triggers=SimpleNamespace(keywords=tuple("abcdef"))),
+            SimpleNamespace(id="fix-bug", triggers=SimpleNamespace(keywords=())),
+        ]
+        monkeypatch.setattr("sage.knowledge.get_pending_todos", lambda project_path: todos)
+
+        result = runner.invoke(main, ["todo", "pending"])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0] == "📋 Pending Todos:"
+        assert "  ☐ write-docs" in lines
+        assert "    Keywords: a, b, c, d, e" in lines
+        assert lines[-1] == "Mark done with: sage todo done <id>"
+        assert sum("Keywords" in line for line in lines) == 1
+
+    def test_pending_without_todos(self, runner, monkeypatch):
+        """An empty list prints a short notice."""
+        monkeypatch.setattr("sage.knowledge.get_pending_todos", lambda project_path: [])
+
+        result = runner.invoke(main, ["todo", "pending"])
+
+        assert "No pending todos." in result.output
+
+
+class TestNewCommand:
+    """Tests for the new command."""
+
+    def test_missing_doc_rejected_before_creating_skill(self, runner, tmp_path, monkeypatch):
+        """A bad --docs path fails without creating the skill."""
+        monkeypatch.setattr(
+            "sage.skill.create_skill", lambda *a: pytest.fail("skill was created")
+        )
+
+        result = runner.invoke(
+            main, ["new", "demo", "-d", "Demo", "--docs", str(tmp_path / "missing.md")]
+        )
+
+        assert result.exit_code == 2
+        assert "Invalid value for '--docs'" in result.output
+
+    def test_docs_copied_into_skill(self, runner, isolated_sage):
+        """--docs files land in the new skill's docs directory."""
+        doc = isolated_sage / "notes.md"
+        doc.write_text("# Notes")
+
+        result = runner.invoke(main, ["new", "demo", "-d", "Demo", "--docs", str(doc)])
+
+        assert result.exit_code == 0, result.output
+        copied = isolated_sage / ".claude" / "skills" / "demo" / "docs" / "notes.md"
+        assert copied.read_text() == "# Notes"
+        assert "Added doc: notes.md" in result.output
+
+
+class TestRmCommand:
+    """Tests for the rm command."""
+
+    def test_rm_removes_both_skill_directories(self, runner, isolated_sage):
+        """rm deletes the Claude skill directory and its Sage metadata."""
+        skill_dir = isolated_sage / ".claude" / "skills" / "demo"
+        sage_dir = isolated_sage / ".sage" / "skills" / "demo"
+        (skill_dir / "docs").mkdir(parents=True)
+        (sage_dir / "sessions").mkdir(parents=True)
+
+        result = runner.invoke(main, ["rm", "demo", "--force"])
+
+        assert result.exit_code == 0, result.output
+        assert not skill_dir.exists()
+        assert not sage_dir.exists()
+
+    def test_rm_without_sage_metadata(self, runner, isolated_sage):
+        """A skill with no ~/.sage directory is still deleted cleanly."""
+        skill_dir = isolated_sage / ".claude" / "skills" / "demo"
+        skill_dir.mkdir()
+
+        result = runner.invoke(main, ["rm", "demo", "--force"])
+
+        assert result.exit_code == 0, result.output
+        assert not skill_dir.exists()
+        assert "Deleted skill: demo" in result.output
+
+    def test_rm_unknown_skill(self, runner, isolated_sage):
+        """Deleting a skill that does not exist fails."""
+        result = runner.invoke(main, ["rm", "missing", "--force"])
+
+        assert result.exit_code == 1
+        assert "not found" in result.output
+
+
+class TestAskCommand:
+    """Tests for the ask command with mocked API calls."""
+
+    @pytest.fixture
+    def sent(self, isolated_sage, monkeypatch):
+        """Stub out skill loading and the API; collect the messages sent."""
+        from sage.client import ApiResponse
+        from sage.errors import ok
+        from sage.knowledge import RecallResult
+
+        calls = []
+
+        def fake_send(client, system, messages, model, enable_search, on_text):
+            calls.append(messages)
+            on_text("answer")
+            return ok(ApiResponse("answer", 1, 1, 0, 0, 0, "end_turn"))
+
+        monkeypatch.setattr("sage.skill.load_skill", lambda name: ok(object()))
+        monkeypatch.setattr("sage.skill.build_context", lambda skill: "system")
+        monkeypatch.setattr("sage.client.create_client", lambda config: ok(object()))
+        monkeypatch.setattr("sage.client.send_message", fake_send)
+        monkeypatch.setattr(
+            "sage.knowledge.recall_knowledge", lambda q, s: RecallResult(items=[], total_tokens=0)
+        )
+        monkeypatch.setattr("sage.history.append_entry", lambda skill, entry: None)
+        return calls
+
+    def test_appends_input_file_and_stdin(self, runner, sent, tmp_path):
+        """--input file and piped stdin are appended to the query in order."""
+        input_file = tmp_path / "notes.txt"
+        input_file.write_text("file body")
+
+        result = runner.invoke(
+            main,
+            ["ask", "my-skill", "question", "--input", str(input_file), "--stdout"],
+            input="piped body",
+        )
+
+        assert result.exit_code == 0, result.output
+        assert sent[0][0].content == (
+            "question\n\n---\n\nFile content:\n\nfile body"
+            "\n\n---\n\nInput:\n\npiped body"
+        )
+
+    def test_blank_stdin_is_ignored(self, runner, sent):
+        """Whitespace-only stdin leaves the query untouched."""
+        result = runner.invoke(main, ["ask", "my-skill", "question", "--stdout"], input="  \n")
+
+        assert result.exit_code == 0, result.output
+        assert sent[0][0].content == "question"
+
+    def test_input_must_be_a_file(self, runner, sent, tmp_path):
+        """A missing or directory --input is a usage error, before any API call."""
+        for path in (tmp_path / "missing.txt", tmp_path):
+            result = runner.invoke(
+                main, ["ask", "my-skill", "question", "--input", str(path), "--stdout"]
+            )
+
+            assert result.exit_code == 2
+            assert "Invalid value for '--input'" in result.output
+        assert sent == []
+
+    def test_output_file_receives_streamed_response(self, runner, sent, tmp_path):
+        """--output writes the streamed text to the file."""
+        out = tmp_path / "answer.md"
+
+        result = runner.invoke(main, ["ask", "my-skill", "question", "--output", str(out)])
+
+        assert result.exit_code == 0, result.output
+        assert out.read_text() == "answer"
+        assert "Written to" in result.output
+
+    def test_output_file_not_created_on_api_error(self, runner, sent, tmp_path, monkeypatch):
+        """A failed request does not leave a partial output file behind."""
+        from sage.errors import api_error, err
+
+        def failing_send(client, system, messages, model, enable_search, on_text):
+            on_text("partial")
+            return err(api_error("boom"))
+
+        monkeypatch.setattr("sage.client.send_message", failing_send)
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+
+        result = runner.invoke(
+            main, ["ask", "my-skill", "question", "--output", str(out_dir / "answer.md")]
+        )
+
+        assert result.exit_code == 1
+        assert list(out_dir.iterdir()) == []
+
+    def test_existing_output_file_kept_on_failure(self, runner, sent, tmp_path, monkeypatch):
+        """An error Result or an exception mid-stream leaves the old file untouched."""
+        from sage.errors import api_error, err
+
+        def failing_send(client, system, messages, model, enable_search, on_text):
+            on_text("partial")
+            return err(api_error("boom"))
+
+        def raising_send(client, system, messages, model, enable_search, on_text):
+            on_text("partial")
+            raise ConnectionError("dropped")
+
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        out = out_dir / "answer.md"
+        out.write_text("previous answer")
+
+        for send in (failing_send, raising_send):
+            monkeypatch.setattr("sage.client.send_message", send)
+
+            result = runner.invoke(main, ["ask", "my-skill", "question", "--output", str(out)])
+
+            assert result.exit_code != 0
+            assert out.read_text() == "previous answer"
+            assert list(out_dir.iterdir()) == [out]
+
+    def test_output_file_replaced_with_umask_mode(self, runner, sent, tmp_path):
+        """Success replaces an existing file, keeping its mode; new files follow umask."""
+        import os
+        import stat
+
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        existing = out_dir / "existing.md"
+        existing.write_text("old")
+        existing.chmod(0o640)
+        fresh = out_dir / "fresh.md"
+
+        for out in (existing, fresh):
+            result = runner.invoke(main, ["ask", "my-skill", "question", "--output", str(out)])
+            assert result.exit_code == 0, result.output
+            assert out.read_text() == "answer"
+
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+        assert stat.S_IMODE(fresh.stat().st_mode) == 0o666 & ~umask
+        assert sorted(p.name for p in out_dir.iterdir()) == ["existing.md", "fresh.md"]
+
+    def test_streamed_text_is_printed_verbatim(self, runner, sent, monkeypatch):
+        """Streamed chunks reach the terminal untouched, even when they look like markup."""
+        from sage.client import ApiResponse
+        from sage.errors import ok
+
+        def bracket_send(client, system, messages, model, enable_search, on_text):
+            for chunk in ("Use ", "[bold]", "x[/bold] or ", "a[i]"):
+                on_text(chunk)
+            return ok(ApiResponse("Use [bold]x[/bold] or a[i]", 1, 1, 0, 0, 0, "end_turn"))
+
+        monkeypatch.setattr("sage.client.send_message", bracket_send)
+
+        result = runner.invoke(main, ["ask", "my-skill", "question"])
+
+        assert result.exit_code == 0, result.output
+        assert "Use [bold]x[/bold] or a[i]" in result.output
+
+
 class TestHealthCommand:
     """Tests for the health command."""
 
@@ -642,6 +1093,44 @@ class TestAdminCommands:
         assert result.exit_code == 0
         assert "already" in result.output.lower()
 
+    def test_admin_rebuild_saves_successful_embeddings(self, runner, monkeypatch):
+        """A forced rebuild saves every item that embedded and reports the rest."""
+        import numpy as np
+
+        from sage.embeddings import EmbeddingStore
+        from sage.errors import api_error, err, ok
+
+        class Item:
+            def __init__(self, item_id, content):
+                self.id = item_id
+                self.content = content
+
+        def fake_embedding(text):
+            if text == "bad":
+                return err(api_error("boom"))
+            return ok(np.array([float(len(text)), 1.0]))
+
+        saved = []
+        monkeypatch.setattr(
+            "sage.embeddings.check_model_mismatch", lambda: (False, "model", "model")
+        )
+        monkeypatch.setattr("sage.embeddings.get_embedding", fake_embedding)
+        monkeypatch.setattr(
+            "sage.knowledge.list_knowledge",
+            lambda: [Item("one", "a"), Item("two", "bad"), Item("three", "abc")],
+        )
+        monkeypatch.setattr("sage.knowledge._get_embedding_store", EmbeddingStore.empty)
+        monkeypatch.setattr("sage.knowledge._save_embedding_store", saved.append)
+        monkeypatch.setattr("sage.checkpoint.list_checkpoints", lambda **kwargs: [])
+
+        result = runner.invoke(main, ["admin", "rebuild-embeddings", "--force"])
+
+        assert result.exit_code == 0, result.output
+        assert "two: boom" in result.output
+        [store] = saved
+        assert store.ids == ["one", "three"]
+        np.testing.assert_array_equal(store.get("three"), [3.0, 1.0])
+
 
 class TestCheckpointPostCompactCommand:
     """Tests for the checkpoint post-compact CLI command."""
@@ -717,3 +1206,224 @@ class TestCheckpointPostCompactCommand:
         checkpoint_content = checkpoint_files[0].read_text()
         assert "This is the compaction summary from Claude Code" in checkpoint_content
         assert "extraction_method: compaction" in checkpoint_content
+
+
+class TestPrintTable:
+    """Tests for the shared table printer."""
+
+    COLUMNS = ("ID", "CONF")
+
+    def test_small_tables_use_rich(self, capsys):
+        """Up to the threshold, rows are rendered as a Rich table."""
+        from sage.cli._console import print_table
+
+        print_table(self.COLUMNS, iter([("a", "1%"), ("b", "50%")]), plain_threshold=2)
+
+        out = capsys.readouterr().out
+        assert "┃" in out or "│" in out
+        assert "50%" in out
+
+    def test_large_tables_are_plain_aligned_text(self, capsys):
+        """Past the threshold, rows are written as aligned plain text."""
+        from sage.cli._console import print_table
+
+        rows = iter([("a", "1%"), ("longer-id", "50%"), ("c", "100%")])
+        print_table(self.COLUMNS, rows, right={"CONF"}, plain_threshold=2)
+
+        assert capsys.readouterr().out.splitlines() == [
+            "ID         CONF",
+            "a            1%",
+            "longer-id   50%",
+            "c          100%",
+        ]
+
+
+class TestTruncate:
+    """Tests for the shared truncate helper."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("", ""), ("abcd", "abcd"), ("abcde", "abcd..."), ("a" * 10, "aaaa...")],
+    )
+    def test_truncate(self, text, expected):
+        """Text longer than the width is cut and marked with an ellipsis."""
+        from sage.cli._console import truncate
+
+        assert truncate(text, 4) == expected
+
+
+class TestStartupImports:
+    """Tests that importing the CLI stays cheap."""
+
+    def test_import_does_not_load_heavy_modules(self):
+        """Importing sage.cli should not pull in the API client or stores."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, sage.cli; "
+            "heavy = ('anthropic', 'sage.client', 'sage.knowledge', 'sage.skill', 'sage.history', "
+            "'yaml'); "
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
+
+    def test_import_does_not_load_rich(self):
+        """Rich is only imported once something is printed."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, sage.cli; "
+            "before = 'rich.console' in sys.modules; "
+            "sage.cli.console.width; "
+            "print(before, 'rich.console' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False True"
+
+    def test_console_is_shared(self):
+        """The lazy console hands out a single Console instance."""
+        from rich.console import Console
+
+        from sage.cli._console import get_console
+
+        assert isinstance(get_console(), Console)
+        assert get_console() is get_console()
+
+
+class TestVersionFastPath:
+    """Tests for the pre-Click --version short-circuit."""
+
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_prints_version_without_cli(self, flag, monkeypatch, capsys):
+        """Bare version flags are answered without invoking Click."""
+        from sage import __version__
+        from sage.__main__ import main as entry
+
+        monkeypatch.setattr("sys.argv", ["sage", flag])
+        monkeypatch.setattr("sage.cli.main", lambda **kw: pytest.fail("CLI was invoked"))
+
+        entry()
+
+        assert capsys.readouterr().out.strip() == f"sage, version {__version__}"
+
+    def test_other_args_delegate_to_cli(self, monkeypatch):
+        """Anything other than a bare version flag goes to sage.cli.main."""
+        from sage.__main__ import main as entry
+
+        calls = []
+        monkeypatch.setattr("sys.argv", ["sage", "list", "--version"])
+        monkeypatch.setattr("sage.cli.main", lambda **kw: calls.append(kw))
+
+        entry()
+
+        assert calls == [{"prog_name": "sage"}]
+
+    def test_click_accepts_short_version_flag(self, runner):
+        """-V also works when routed through Click."""
+        result = runner.invoke(main, ["-V"])
+
+        assert result.exit_code == 0
+        assert "version" in result.output
+
+
+class TestStaticHelp:
+    """Tests for the pre-rendered --help fast path."""
+
+    def test_help_module_is_up_to_date(self):
+        """sage/_help.py matches what scripts/gen_cli_help.py would write."""
+        import runpy
+        from pathlib import Path
+
+        script = Path(__file__).parent.parent / "scripts" / "gen_cli_help.py"
+        gen = runpy.run_path(str(script))
+
+        assert gen["HELP_FILE"].read_text() == gen["render_module"](gen["render_help"]()), (
+            "sage/_help.py is stale; run scripts/gen_cli_help.py"
+        )
+
+    @pytest.mark.parametrize(
+        ("argv", "key"),
+        [(["sage", "--help"], "main"), (["sage", "config", "--help"], "config")],
+    )
+    def test_prints_static_help_without_cli(self, argv, key, monkeypatch, capsys):
+        """Top-level and group help are printed without invoking Click."""
+        from sage.__main__ import main as entry
+        from sage._help import HELP
+
+        monkeypatch.setattr("sys.argv", argv)
+        monkeypatch.setattr("sage.cli.main", lambda **kw: pytest.fail("CLI was invoked"))
+
+        entry()
+
+        assert capsys.readouterr().out == HELP[key]
+
+    @pytest.mark.parametrize(
+        "args", [["list", "--help"], ["config", "set", "--help"], ["--help", "config"]]
+    )
+    def test_other_help_requests_delegate_to_cli(self, args, monkeypatch):
+        """Help for leaf commands and nested subcommands still goes through Click."""
+        from sage.__main__ import main as entry
+
+        calls = []
+        monkeypatch.setattr("sys.argv", ["sage", *args])
+        monkeypatch.setattr("sage.cli.main", lambda **kw: calls.append(kw))
+
+        entry()
+
+        assert calls == [{"prog_name": "sage"}]
+
+
+class TestLazyGroup:
+    """Tests for lazily loaded subcommands."""
+
+    def test_every_lazy_subcommand_resolves(self):
+        """Each registered name imports to a Click command of the same name."""
+        import click
+
+        ctx = click.Context(main)
+        for name in main.lazy_subcommands:
+            command = main.get_command(ctx, name)
+            assert isinstance(command, click.Command)
+            assert command.name == name
+
+    def test_list_commands_includes_eager_and_lazy(self):
+        """Commands defined in sage.cli and lazy ones are both listed."""
+        import click
+
+        names = main.list_commands(click.Context(main))
+
+        assert names == sorted(names)
+        assert {"init", "health", "config", "ask", "knowledge", "skills"} <= set(names)
+
+    def test_unknown_command_returns_none(self):
+        """Unknown names fall through to Click's normal lookup."""
+        import click
+
+        assert main.get_command(click.Context(main), "nope") is None
+
+    def test_running_one_command_skips_other_modules(self):
+        """Invoking a group only imports that group's module."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from sage.cli import main\n"
+            "CliRunner().invoke(main, ['templates', '--help'])\n"
+            "print(','.join(sorted(m for m in sys.modules if m.startswith('sage.cli.'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "sage.cli._console,sage.cli.templates"
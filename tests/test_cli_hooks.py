@@ -0,0 +1,289 @@
+"""Tests for CLI hooks and MCP install commands."""
+
+import json
+import stat
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from sage.cli import main
+
+
+@pytest.fixture
+def runner():
+    """Create a CLI runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Point the Claude Code config paths at a temporary home directory."""
+    claude_dir = tmp_path / ".claude"
+    monkeypatch.setattr("sage.cli.hooks.CLAUDE_HOOKS_DIR", claude_dir / "hooks")
+    monkeypatch.setattr("sage.cli.hooks.CLAUDE_SETTINGS_PATH", claude_dir / "settings.json")
+    monkeypatch.setattr("sage.cli.mcp.CLAUDE_JSON_PATH", tmp_path / ".claude.json")
+    return tmp_path
+
+
+@pytest.fixture
+def settings_path(home):
+    """Path of Claude Code's settings.json in the temporary home."""
+    return home / ".claude" / "settings.json"
+
+
+class TestHooksInstall:
+    """Tests for 'sage hooks install'."""
+
+    def test_installs_hooks_and_settings(self, runner, settings_path):
+        """Hook scripts are copied and registered in settings.json."""
+        result = runner.invoke(main, ["hooks", "install"])
+
+        assert result.exit_code == 0, result.output
+        hooks_dir = settings_path.parent / "hooks"
+        assert (hooks_dir / "session-start-sage.sh").stat().st_mode & stat.S_IXUSR
+        settings = json.loads(settings_path.read_text())
+        assert set(settings["hooks"]) == {"SessionStart", "Stop"}
+        assert len(settings["hooks"]["Stop"][0]["hooks"]) == 2
+
+    def test_keeps_other_settings_and_permissions(self, runner, settings_path):
+        """Existing settings survive and the file mode is preserved."""
+        settings_path.parent.mkdir()
+        settings_path.write_text(json.dumps({"theme": "dark", "hooks": {"Other": []}}))
+        settings_path.chmod(0o644)
+
+        result = runner.invoke(main, ["hooks", "install"])
+
+        assert result.exit_code == 0, result.output
+        settings = json.loads(settings_path.read_text())
+        assert settings["theme"] == "dark"
+        assert "Other" in settings["hooks"]
+        assert stat.S_IMODE(settings_path.stat().st_mode) == 0o644
+        assert list(settings_path.parent.glob("*.tmp")) == []
+
+    def test_reinstall_skips_identical_hooks(self, runner, settings_path):
+        """Unchanged hooks are left alone; changed ones still need --force."""
+        runner.invoke(main, ["hooks", "install"])
+        hooks_dir = settings_path.parent / "hooks"
+        (hooks_dir / "session-start-sage.sh").write_text("#!/bin/sh\n# local edit\n")
+
+        with patch("shutil.copy2") as copy:
+            result = runner.invoke(main, ["hooks", "install"])
+
+        assert result.exit_code == 0, result.output
+        copy.assert_not_called()
+        assert result.output.count("is up to date") == 2
+        assert "Skipping session-start-sage.sh" in result.output
+
+        result = runner.invoke(main, ["hooks", "install", "--force"])
+
+        assert "Copied session-start-sage.sh" in result.output
+        assert "local edit" not in (hooks_dir / "session-start-sage.sh").read_text()
+
+    def test_reinstall_leaves_settings_untouched(self, runner, settings_path):
+        """A second install with the same configuration does not rewrite settings.json."""
+        runner.invoke(main, ["hooks", "install"])
+        before = settings_path.stat().st_mtime_ns
+
+        with patch("sage.cli.hooks.write_json") as write:
+            result = runner.invoke(main, ["hooks", "install"])
+
+        assert result.exit_code == 0, result.output
+        write.assert_not_called()
+        assert settings_path.stat().st_mtime_ns == before
+        assert "unchanged" in result.output
+
+    def test_missing_hook_sources(self, runner, settings_path, tmp_path, monkeypatch):
+        """Install stops with an error when the bundled hooks cannot be found."""
+        monkeypatch.setattr("sage.cli.hooks._HOOKS_SRC", tmp_path / "missing")
+
+        result = runner.invoke(main, ["hooks", "install"])
+
+        assert result.exit_code == 1
+        assert "Could not find hook source files" in result.output
+        assert not settings_path.exists()
+
+    def test_write_failure_exits_with_error(self, runner, settings_path):
+        """A failed settings write is reported instead of raising."""
+        from sage.errors import err, file_error
+
+        with patch(
+            "sage.cli.hooks.write_json",
+            return_value=err(file_error(str(settings_path), "disk full")),
+        ):
+            result = runner.invoke(main, ["hooks", "install"])
+
+        assert result.exit_code == 1
+        assert "disk full" in result.output
+
+
+class TestHookConfig:
+    """Tests for the settings.json hook entries."""
+
+    def test_full_config(self, tmp_path):
+        """Every installed hook is registered under its event."""
+        from sage.cli.hooks import _HOOK_FILES, _hook_config
+
+        config = _hook_config(tmp_path, set(_HOOK_FILES))
+
+        assert config == {
+            "SessionStart": [
+                {
+                    "matcher": "",
+                    "hooks": [
+                        {"type": "command", "command": str(tmp_path / "session-start-sage.sh")}
+                    ],
+                }
+            ],
+            "Stop": [
+                {
+                    "matcher": "",
+                    "hooks": [
+                        {
+                            "type": "command",
+                            "command": str(tmp_path / "post-response-context-check.sh"),
+                        },
+                        {
+                            "type": "command",
+                            "command": str(tmp_path / "post-response-semantic-detector.sh"),
+                        },
+                    ],
+                }
+            ],
+        }
+
+    def test_missing_hooks_are_left_out(self, tmp_path):
+        """Events whose scripts are all missing get no entry."""
+        from sage.cli.hooks import _hook_config
+
+        config = _hook_config(tmp_path, {"post-response-semantic-detector.sh"})
+
+        assert list(config) == ["Stop"]
+        assert [h["command"] for h in config["Stop"][0]["hooks"]] == [
+            str(tmp_path / "post-response-semantic-detector.sh")
+        ]
+
+
+class TestPresentHookFiles:
+    """Tests for the hooks directory scan."""
+
+    def test_lists_files_only(self, tmp_path):
+        """Files are listed by name; subdirectories are ignored."""
+        from sage.cli.hooks import _present_hook_files
+
+        (tmp_path / "a.sh").write_text("")
+        (tmp_path / "subdir").mkdir()
+
+        assert _present_hook_files(tmp_path) == {"a.sh"}
+
+    def test_missing_directory(self, tmp_path):
+        """A missing hooks directory has no files."""
+        from sage.cli.hooks import _present_hook_files
+
+        assert _present_hook_files(tmp_path / "missing") == set()
+
+
+class TestHooksUninstall:
+    """Tests for 'sage hooks uninstall'."""
+
+    def test_removes_hooks_and_config(self, runner, settings_path):
+        """Uninstall deletes the scripts and Sage's hook entries."""
+        runner.invoke(main, ["hooks", "install"])
+
+        result = runner.invoke(main, ["hooks", "uninstall", "--force"])
+
+        assert result.exit_code == 0, result.output
+        assert list((settings_path.parent / "hooks").iterdir()) == []
+        assert "hooks" not in json.loads(settings_path.read_text())
+
+    def test_leaves_unrelated_settings_untouched(self, runner, settings_path):
+        """Without any Sage events, settings.json is neither parsed nor rewritten."""
+        settings_path.parent.mkdir()
+        settings_path.write_text('{"theme": "dark", "hooks": {"Notification": []}}')
+        before = settings_path.stat().st_mtime_ns
+
+        with patch("sage.cli.hooks.json.loads") as loads:
+            result = runner.invoke(main, ["hooks", "uninstall", "--force"])
+
+        assert result.exit_code == 0, result.output
+        loads.assert_not_called()
+        assert settings_path.stat().st_mtime_ns == before
+        assert "Updated" not in result.output
+
+    def test_removes_legacy_precompact_entry(self, runner, settings_path):
+        """Old PreCompact entries are cleaned up alongside other hooks."""
+        settings_path.parent.mkdir()
+        settings_path.write_text(json.dumps({"hooks": {"PreCompact": [], "Notification": []}}))
+
+        result = runner.invoke(main, ["hooks", "uninstall", "--force"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(settings_path.read_text()) == {"hooks": {"Notification": []}}
+
+
+class TestHooksStatus:
+    """Tests for 'sage hooks status'."""
+
+    def test_reports_installed_hooks(self, runner, settings_path):
+        """Status shows files and settings entries after install."""
+        runner.invoke(main, ["hooks", "install"])
+
+        result = runner.invoke(main, ["hooks", "status"])
+
+        assert result.exit_code == 0
+        assert "Stop hooks configured" in result.output
+        assert "not found" not in result.output
+
+    def test_reports_unparseable_settings(self, runner, settings_path):
+        """A corrupt settings.json is reported, not raised."""
+        settings_path.parent.mkdir()
+        settings_path.write_text("{not json")
+
+        result = runner.invoke(main, ["hooks", "status"])
+
+        assert result.exit_code == 0
+        assert "Could not parse" in result.output
+
+
+class TestMcpCommands:
+    """Tests for 'sage mcp install/uninstall/status'."""
+
+    def test_install_and_uninstall(self, runner, home):
+        """The sage server is added and removed without touching other keys."""
+        claude_json = home / ".claude.json"
+        claude_json.write_text(json.dumps({"mcpServers": {"other": {}}, "numStartups": 3}))
+
+        result = runner.invoke(main, ["mcp", "install"])
+
+        assert result.exit_code == 0, result.output
+        config = json.loads(claude_json.read_text())
+        assert config["mcpServers"]["sage"]["args"] == ["-m", "sage.mcp_server"]
+        assert config["numStartups"] == 3
+
+        result = runner.invoke(main, ["mcp", "uninstall", "--force"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(claude_json.read_text()) == {
+            "mcpServers": {"other": {}},
+            "numStartups": 3,
+        }
+
+    def test_reinstall_leaves_config_untouched(self, runner, home):
+        """Installing again with the same server entry does not rewrite the file."""
+        runner.invoke(main, ["mcp", "install"])
+
+        with patch("sage.cli.mcp.write_json") as write:
+            result = runner.invoke(main, ["mcp", "install"])
+
+        assert result.exit_code == 0, result.output
+        write.assert_not_called()
+        assert "already configured" in result.output
+
+    def test_status(self, runner, home):
+        """Status reports whether the sage server is configured."""
+        assert "not found" in runner.invoke(main, ["mcp", "status"]).output
+
+        runner.invoke(main, ["mcp", "install"])
+        result = runner.invoke(main, ["mcp", "status"])
+
+        assert "Sage MCP server configured" in result.output
@@ -1,5 +1,6 @@
 """Tests for default Sage methodology skills."""
 
+import os
 import re
 from pathlib import Path
 from unittest.mock import patch
@@ -203,6 +204,32 @@ class TestInstallSkill:
 
         assert success
         assert skill_path.read_text() == "new content"
+        assert message == "Updated existing"
+
+    def test_force_skips_identical_content(self, tmp_path):
+        """A forced reinstall of unchanged content does not rewrite the file."""
+        skills_dir = tmp_path / "skills" / "sage"
+        skill_path = skills_dir / "same" / "SKILL.md"
+        skill_path.parent.mkdir(parents=True)
+        skill_path.write_text("same content")
+        os.utime(skill_path, ns=(0, 0))
+
+        with patch("sage.default_skills.SAGE_SKILLS_DIR", skills_dir):
+            skill = DefaultSkill(name="same", content="same content")
+            success, message = install_skill(skill, force=True)
+
+        assert success
+        assert message == "same is up to date"
+        assert skill_path.stat().st_mtime_ns == 0
+
+    def test_reports_fresh_install(self, tmp_path):
+        """A skill that was not there before is reported as installed."""
+        with patch("sage.default_skills.SAGE_SKILLS_DIR", tmp_path / "skills" / "sage"):
+            skill = DefaultSkill(name="fresh", content="content")
+            success, message = install_skill(skill)
+
+        assert success
+        assert message == "Installed fresh"
 
     def test_sets_file_permissions(self, tmp_path):
         """Sets restrictive file permissions."""
@@ -289,6 +316,21 @@ class TestGetInstalledSageSkills:
 
         assert result == ["alpha", "beta", "zebra"]
 
+    def test_ignores_files_and_follows_symlinked_dirs(self, tmp_path):
+        """Stray files are skipped; a symlinked skill directory still counts."""
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        (skills_dir / "notes.txt").write_text("not a skill")
+        target = tmp_path / "elsewhere" / "linked"
+        target.mkdir(parents=True)
+        (target / "SKILL.md").write_text("content")
+        (skills_dir / "linked").symlink_to(target)
+
+        with patch("sage.default_skills.SAGE_SKILLS_DIR", skills_dir):
+            result = get_installed_sage_skills()
+
+        assert result == ["linked"]
+
 
 class TestCheckSkillVersion:
     """Tests for check_skill_version function."""
@@ -322,6 +364,20 @@ class TestCheckSkillVersion:
         assert installed is None
         assert available is None
 
+    def test_available_version_does_not_reread_source(self, tmp_path):
+        """The bundled skill is read once per process, not once per check."""
+        from sage.default_skills import _get_default_skills_cached
+
+        _get_default_skills_cached()
+        with (
+            patch("sage.default_skills.SAGE_SKILLS_DIR", tmp_path),
+            patch(
+                "sage.default_skills._load_skill_from_source",
+                side_effect=AssertionError("source re-read"),
+            ),
+        ):
+            assert check_skill_version("sage-memory") == (None, "1.0.0")
+
 
 class TestSanitizeSkillName:
     """Security tests for skill name sanitization."""
@@ -77,6 +77,16 @@ class TestCosineSimilarity:
         v3 = sample_embeddings[2]
         assert cosine_similarity(v1, v3) == pytest.approx(0.707, rel=0.01)
 
+    def test_unnormalized_vectors(self):
+        """Norms are divided out for vectors that are not unit length."""
+        assert cosine_similarity(np.array([2.0, 0.0]), np.array([3.0, 3.0])) == pytest.approx(
+            0.7071, rel=1e-3
+        )
+
+    def test_zero_vector_returns_0(self):
+        """A zero vector has no direction; similarity is 0."""
+        assert cosine_similarity(np.zeros(2), np.array([1.0, 0.0])) == 0.0
+
     def test_empty_vectors_return_0(self):
         """Empty vectors return 0 similarity."""
         empty = np.array([])
@@ -107,6 +117,23 @@ class TestCosineSimilarityMatrix:
         result = cosine_similarity_matrix(query, embeddings)
         assert len(result) == 0
 
+    def test_unnormalized_query(self, sample_embeddings):
+        """Query length does not scale the scores."""
+        similarities = cosine_similarity_matrix(sample_embeddings[0] * 5.0, sample_embeddings)
+
+        assert similarities[0] == pytest.approx(1.0)
+        assert similarities[2] == pytest.approx(0.707, rel=0.01)
+
+    def test_query_matches_matrix_dtype(self):
+        """A float64 query does not upcast a float32 matrix."""
+        embeddings = np.eye(3, dtype=np.float32)
+        query = np.array([0.0, 1.0, 0.0])  # float64
+
+        result = cosine_similarity_matrix(query, embeddings)
+
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, [0.0, 1.0, 0.0])
+
 
 class TestEmbeddingStore:
     """Tests for EmbeddingStore operations."""
@@ -177,6 +204,69 @@ class TestEmbeddingStore:
 
         assert new_store == store  # Same object (unchanged)
 
+    def test_remove_keeps_other_rows_aligned(self):
+        """Removing a middle item keeps the remaining IDs on their own rows."""
+        store = EmbeddingStore.empty()
+        for i, item_id in enumerate(["a", "b", "c"]):
+            store = store.add(item_id, np.array([float(i), 1.0]))
+
+        store = store.remove("b")
+
+        assert store.ids == ["a", "c"]
+        np.testing.assert_array_equal(store.get("c"), [2.0, 1.0])
+        store = store.add("c", np.array([9.0, 9.0]))
+        assert len(store) == 2
+        np.testing.assert_array_equal(store.get("c"), [9.0, 9.0])
+
+    def test_duplicate_id_resolves_to_first_row(self):
+        """A duplicated ID (e.g. from a racy save) reads its first row."""
+        store = EmbeddingStore(ids=["x", "y", "x"], embeddings=np.eye(3))
+
+        np.testing.assert_array_equal(store.get("x"), [1.0, 0.0, 0.0])
+        assert store.remove("x").ids == ["y", "x"]
+
+    def test_add_many_matches_sequential_add(self):
+        """add_many gives the same store as add() called in order."""
+        base = EmbeddingStore.empty().add("a", np.array([1.0, 0.0]))
+        ids = ["b", "a", "c", "b"]
+        vectors = np.array([[0.0, 1.0], [2.0, 2.0], [3.0, 3.0], [4.0, 4.0]])
+
+        expected = base
+        for item_id, vector in zip(ids, vectors, strict=True):
+            expected = expected.add(item_id, vector)
+        result = base.add_many(ids, vectors)
+
+        assert result.ids == expected.ids == ["a", "b", "c"]
+        np.testing.assert_array_equal(result.embeddings, expected.embeddings)
+        np.testing.assert_array_equal(base.get("a"), [1.0, 0.0])  # Original unchanged
+
+    def test_add_many_into_empty_store_from_list(self):
+        """An empty store takes its width from the added vectors."""
+        store = EmbeddingStore.empty().add_many(
+            ["x", "y"], [np.array([1.0, 2.0]), np.array([3.0, 4.0])]
+        )
+
+        assert store.embeddings.shape == (2, 2)
+        np.testing.assert_array_equal(store.get("y"), [3.0, 4.0])
+        assert store.add_many([], []) is store
+
+    def test_embeddings_are_contiguous_float32(self):
+        """Stores normalize their matrix to C-contiguous float32."""
+        fortran = np.asfortranarray(np.arange(6, dtype=np.float64).reshape(3, 2))
+
+        store = EmbeddingStore(ids=["a", "b", "c"], embeddings=fortran)
+
+        assert store.embeddings.dtype == np.float32
+        assert store.embeddings.flags.c_contiguous
+        np.testing.assert_array_equal(store.embeddings, fortran)
+        assert store.add("d", np.array([6.0, 7.0])).embeddings.dtype == np.float32
+
+    def test_float32_input_is_not_copied(self):
+        """Already-compatible arrays (e.g. memory-mapped loads) are kept as-is."""
+        matrix = np.ones((2, 3), dtype=np.float32)
+
+        assert EmbeddingStore(ids=["a", "b"], embeddings=matrix).embeddings is matrix
+
     def test_immutability(self):
         """Store operations return new store, don't modify original."""
         store = EmbeddingStore.empty()
@@ -285,6 +375,113 @@ class TestSaveLoadEmbeddings:
         assert len(loaded) == 2  # Truncated to match IDs count
         assert loaded.embeddings.shape[0] == 2
 
+    def test_load_is_memory_mapped_read_only(self, mock_embeddings_dir: Path, monkeypatch):
+        """float32 files map read-only and survive a save over the same path."""
+        import json
+
+        monkeypatch.setattr(
+            "sage.embeddings.get_model_info",
+            lambda model_name: {"dim": 3, "query_prefix": "", "size_mb": 0},
+        )
+
+        path = mock_embeddings_dir / "mapped.npy"
+        np.save(path, np.array([[1.0, 0.0, 0.0]], dtype=np.float32))
+        with open(path.with_suffix(".json"), "w") as f:
+            json.dump(["a"], f)
+
+        loaded = load_embeddings(path).unwrap()
+        assert type(loaded.embeddings) is np.ndarray
+        assert not loaded.embeddings.flags.writeable
+        with pytest.raises(ValueError):
+            loaded.embeddings[0, 0] = 2.0
+
+        updated = loaded.add("b", np.array([0.0, 1.0, 0.0]))
+        assert save_embeddings(path, updated).is_ok()
+
+        # The old mapping still sees the old file; a fresh load sees the new one
+        np.testing.assert_array_equal(loaded.embeddings, [[1.0, 0.0, 0.0]])
+        reloaded = load_embeddings(path).unwrap()
+        assert reloaded.ids == ["a", "b"]
+        np.testing.assert_array_equal(reloaded.embeddings, [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+
+    def test_saves_float16_and_loads_float32(self, mock_embeddings_dir: Path, monkeypatch):
+        """Default saves halve the file; loads widen back to float32."""
+        monkeypatch.setattr(
+            "sage.embeddings.get_model_info",
+            lambda model_name: {"dim": 8, "query_prefix": "", "size_mb": 0},
+        )
+
+        rng = np.random.default_rng(1)
+        vectors = rng.normal(size=(5, 8)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        path = mock_embeddings_dir / "half.npy"
+        assert save_embeddings(path, EmbeddingStore(ids=list("abcde"), embeddings=vectors)).is_ok()
+
+        assert np.load(path).dtype == np.float16
+        loaded = load_embeddings(path).unwrap()
+        assert loaded.embeddings.dtype == np.float32
+        np.testing.assert_allclose(loaded.embeddings, vectors, atol=1e-3)
+        query = vectors[0]
+        np.testing.assert_allclose(
+            cosine_similarity_matrix(query, loaded.embeddings), vectors @ query, atol=1e-3
+        )
+
+    def test_quantized_save_and_load(self, mock_embeddings_dir: Path, monkeypatch):
+        """embedding_quantize stores int8 rows and loads them back as float32."""
+        import json
+
+        from sage.config import SageConfig
+
+        monkeypatch.setattr(
+            "sage.embeddings.get_model_info",
+            lambda model_name: {"dim": 3, "query_prefix": "", "size_mb": 0},
+        )
+        monkeypatch.setattr(
+            "sage.config.get_sage_config", lambda *a, **k: SageConfig(embedding_quantize=True)
+        )
+
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(4, 3))
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors[3] = 0.0  # All-zero rows must survive the per-row scale
+        store = EmbeddingStore(ids=["a", "b", "c", "d"], embeddings=vectors)
+
+        path = mock_embeddings_dir / "quant.npy"
+        assert save_embeddings(path, store).is_ok()
+
+        assert np.load(path).dtype == np.int8
+        with open(path.with_suffix(".json")) as f:
+            payload = json.load(f)
+        assert payload["ids"] == ["a", "b", "c", "d"]
+        assert len(payload["scales"]) == 4
+
+        loaded = load_embeddings(path).unwrap()
+        assert loaded.ids == ["a", "b", "c", "d"]
+        assert loaded.embeddings.dtype == np.float32
+        np.testing.assert_allclose(loaded.embeddings, vectors, atol=1 / 127)
+        np.testing.assert_allclose(np.linalg.norm(loaded.embeddings[:3], axis=1), 1.0, rtol=1e-6)
+        for i in range(3):
+            assert cosine_similarity(loaded.embeddings[i], vectors[i]) > 0.999
+
+    def test_load_quantized_without_scales_recovers(self, mock_embeddings_dir: Path, monkeypatch):
+        """int8 rows next to an old plain ID list load as empty (interrupted save)."""
+        import json
+
+        monkeypatch.setattr(
+            "sage.embeddings.get_model_info",
+            lambda model_name: {"dim": 3, "query_prefix": "", "size_mb": 0},
+        )
+
+        npy_path = mock_embeddings_dir / "halfway.npy"
+        np.save(npy_path, np.array([[127, 0, 0], [0, 127, 0]], dtype=np.int8))
+        with open(mock_embeddings_dir / "halfway.json", "w") as f:
+            json.dump(["item1", "item2"], f)
+
+        result = load_embeddings(npy_path)
+
+        assert result.is_ok()
+        assert len(result.unwrap()) == 0
+
     def test_concurrent_saves_maintain_consistency(self, mock_embeddings_dir: Path, monkeypatch):
         """Concurrent saves don't corrupt the embedding store (file locking test)."""
         import concurrent.futures
@@ -400,39 +597,74 @@ class TestFindSimilar:
         assert len(results) == 1
         assert results[0].id == "doc1"
 
+    def test_find_similar_ties_keep_store_order(self):
+        """Equal scores come back in store order, cut at top_k."""
+        store = EmbeddingStore(
+            ids=["low", "dup1", "high", "dup2", "dup3"],
+            embeddings=np.array([[0.0, 1.0], [0.6, 0.8], [1.0, 0.0], [0.6, 0.8], [0.6, 0.8]]),
+        )
+        query = np.array([1.0, 0.0])
+
+        results = find_similar(query, store, threshold=0.5, top_k=3)
+
+        assert [r.id for r in results] == ["high", "dup1", "dup2"]
+        assert all(isinstance(r.score, float) for r in results)
+
+    def test_find_similar_top_k_zero(self, sample_embeddings):
+        """top_k=0 returns nothing."""
+        store = EmbeddingStore(
+            ids=["doc1", "doc2", "doc3"],
+            embeddings=sample_embeddings,
+        )
+
+        assert find_similar(sample_embeddings[0], store, top_k=0) == []
+
 
 class TestIsAvailable:
     """Tests for availability check."""
 
-    def test_available_when_installed(self):
+    def test_available_when_installed(self, monkeypatch):
         """is_available() returns True when sentence-transformers installed."""
-        with patch.dict("sys.modules", {"sentence_transformers": MagicMock()}):
-            # Need to reimport to pick up the mock
-            from sage import embeddings
+        import importlib.machinery
+        import types
+
+        from sage import embeddings
 
-            # Create a mock that returns True
-            with patch.object(embeddings, "is_available", return_value=True):
-                assert embeddings.is_available() is True
+        module = types.ModuleType("sentence_transformers")
+        module.__spec__ = importlib.machinery.ModuleSpec("sentence_transformers", None)
+        monkeypatch.setattr(embeddings, "_available", None)
+        with patch.dict("sys.modules", {"sentence_transformers": module}):
+            assert embeddings.is_available() is True
 
-    def test_unavailable_when_not_installed(self):
+    def test_unavailable_when_not_installed(self, monkeypatch):
         """is_available() returns False when sentence-transformers not installed."""
+        from sage import embeddings
+
+        monkeypatch.setattr(embeddings, "_available", None)
         with patch.dict("sys.modules", {"sentence_transformers": None}):
-            from sage import embeddings
+            assert embeddings.is_available() is False
+
+    def test_checks_once_without_importing(self, monkeypatch):
+        """The package is looked up once and never imported by the check."""
+        import sys
+
+        from sage import embeddings
+
+        monkeypatch.setattr(embeddings, "_available", None)
+        calls = []
+
+        def fake_find_spec(name):
+            calls.append(name)
+            return MagicMock()
 
-            # Create a version that actually checks import
-            def check_available():
-                try:
-                    import sentence_transformers  # noqa: F401
+        monkeypatch.setattr(embeddings.importlib.util, "find_spec", fake_find_spec)
+        had_module = "sentence_transformers" in sys.modules
 
-                    return True
-                except (ImportError, TypeError):
-                    return False
+        assert embeddings.is_available() is True
+        assert embeddings.is_available() is True
 
-            with patch.object(embeddings, "is_available", side_effect=check_available):
-                # This might be True or False depending on environment
-                # Just check it returns a boolean
-                result = embeddings.is_available()
-                assert isinstance(result, bool)
+        assert calls == ["sentence_transformers"]
+        assert ("sentence_transformers" in sys.modules) == had_module
 
 
 class TestGetEmbedding:
@@ -615,6 +847,60 @@ class TestQueryEmbedding:
             text_arg = call_args[0][0]
             assert text_arg == "test query"
 
+    def test_repeated_query_is_encoded_once(self, monkeypatch):
+        """The same query against the loaded model reuses its embedding."""
+        from sage import embeddings
+        from sage.embeddings import get_query_embedding, ok
+
+        mock_model = MagicMock()
+        mock_model.encode.side_effect = lambda text, **kwargs: np.array([1.0, 0.0])
+        monkeypatch.setattr(embeddings, "_query_cache", {})
+        monkeypatch.setattr(embeddings, "_model", mock_model)
+        monkeypatch.setattr(embeddings, "_model_name", "all-MiniLM-L6-v2")
+        monkeypatch.setattr(embeddings, "get_model", lambda name=None: ok(mock_model))
+        monkeypatch.setattr(embeddings, "get_configured_model", lambda: "all-MiniLM-L6-v2")
+
+        first = get_query_embedding("auth tokens").unwrap()
+        second = get_query_embedding("auth tokens").unwrap()
+        get_query_embedding("something else")
+
+        assert second is first
+        assert not first.flags.writeable
+        assert mock_model.encode.call_count == 2
+        # Entries are tagged with the model generation, not the model itself
+        assert all(isinstance(gen, int) for gen, _ in embeddings._query_cache.values())
+
+        # A reloaded model does not reuse the old model's vectors
+        new_model = MagicMock()
+        new_model.encode.return_value = np.array([0.0, 1.0])
+        monkeypatch.setattr(embeddings, "_model", new_model)
+        monkeypatch.setattr(embeddings, "_model_generation", embeddings._model_generation + 1)
+        monkeypatch.setattr(embeddings, "get_model", lambda name=None: ok(new_model))
+
+        np.testing.assert_array_equal(get_query_embedding("auth tokens").unwrap(), [0.0, 1.0])
+
+        embeddings.clear_model_cache()
+        assert embeddings._query_cache == {}
+
+    def test_query_cache_is_bounded(self, monkeypatch):
+        """Oldest entries are dropped once the cache is full."""
+        from sage import embeddings
+        from sage.embeddings import get_query_embedding, ok
+
+        mock_model = MagicMock()
+        mock_model.encode.side_effect = lambda text, **kwargs: np.array([1.0, 0.0])
+        monkeypatch.setattr(embeddings, "_query_cache", {})
+        monkeypatch.setattr(embeddings, "_QUERY_CACHE_SIZE", 2)
+        monkeypatch.setattr(embeddings, "_model", mock_model)
+        monkeypatch.setattr(embeddings, "_model_name", "all-MiniLM-L6-v2")
+        monkeypatch.setattr(embeddings, "get_model", lambda name=None: ok(mock_model))
+        monkeypatch.setattr(embeddings, "get_configured_model", lambda: "all-MiniLM-L6-v2")
+
+        for text in ("a", "b", "c"):
+            get_query_embedding(text)
+
+        assert [text for _, text in embeddings._query_cache] == ["b", "c"]
+
     def test_document_embedding_no_prefix(self):
         """Document embedding never adds prefix."""
         mock_model = MagicMock()
@@ -3,6 +3,8 @@
 Tests the failure memory functionality for tracking what didn't work.
 """
 
+import numpy as np
+import pytest
 
 from sage.failures import (
     Failure,
@@ -16,6 +18,10 @@ from sage.failures import (
     _failure_to_markdown,
     _markdown_to_failure,
     _keyword_score,
+    _get_failure_embedding_store,
+    _save_failure_embedding_store,
+    _add_failure_embedding,
+    _get_failure_similarities,
 )
 
 
@@ -149,6 +155,32 @@ What I learned
         assert parsed.why_failed == original.why_failed
         assert parsed.learned == original.learned
 
+    def test_frontmatter_matches_pure_python_yaml(self):
+        """The libyaml dumper writes the same frontmatter the pure-Python one did."""
+        import yaml
+
+        failure = Failure(
+            id="unicode-failure",
+            approach="Retrying: naïve backoff — \"quoted\" & 'single' #hash",
+            why_failed="Why",
+            learned="Learned",
+            keywords=("重试", "yes", "null", "2026-01-01"),
+            related_to=("checkpoint-1",),
+            added="2026-01-01T00:00:00",
+        )
+
+        md = _failure_to_markdown(failure)
+        fm_text = md[4 : md.index("---", 4)]
+
+        expected = yaml.safe_dump(
+            yaml.safe_load(fm_text), default_flow_style=False, sort_keys=False, allow_unicode=True
+        )
+        assert fm_text == expected
+        parsed = _markdown_to_failure(md)
+        assert parsed is not None
+        assert parsed.approach == failure.approach
+        assert parsed.keywords == failure.keywords
+
 
 class TestSaveFailure:
     """Tests for saving failures."""
@@ -270,6 +302,80 @@ class TestLoadFailures:
         assert failures[1].id == "old"
 
 
+class TestLoadFailuresCache:
+    """Tests for reusing parsed failure files between loads."""
+
+    def _save(self, tmp_path, failure_id, approach="Approach"):
+        save_failure(
+            failure_id=failure_id,
+            approach=approach,
+            why_failed="Why",
+            learned="Learned",
+            keywords=["kw"],
+            project_path=tmp_path,
+        )
+
+    def _count_parses(self, monkeypatch):
+        import sage.failures as failures_module
+
+        calls = []
+        real_parse = failures_module._markdown_to_failure
+
+        def counting_parse(content):
+            calls.append(content)
+            return real_parse(content)
+
+        monkeypatch.setattr(failures_module, "_markdown_to_failure", counting_parse)
+        return calls
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path, monkeypatch):
+        """A second load of unchanged files parses nothing."""
+        self._save(tmp_path, "one")
+        self._save(tmp_path, "two")
+        calls = self._count_parses(monkeypatch)
+
+        first = load_failures(tmp_path)
+        second = load_failures(tmp_path)
+
+        assert [f.id for f in second] == [f.id for f in first]
+        assert len(calls) == 2
+
+    def test_changed_and_deleted_files_are_seen(self, tmp_path, monkeypatch):
+        """Edits are re-parsed and deleted files drop out."""
+        import os
+
+        import sage.failures as failures_module
+
+        self._save(tmp_path, "one")
+        self._save(tmp_path, "two")
+        load_failures(tmp_path)
+        calls = self._count_parses(monkeypatch)
+
+        (deleted,) = (tmp_path / ".sage" / "failures").glob("*_two.md")
+        (path,) = (tmp_path / ".sage" / "failures").glob("*_one.md")
+        path.write_text(path.read_text().replace("Approach", "Edited!!"))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        delete_failure("two", project_path=tmp_path)
+
+        failures = load_failures(tmp_path)
+
+        assert [(f.id, f.approach) for f in failures] == [("one", "Edited!!")]
+        assert len(calls) == 1
+        assert deleted not in failures_module._failure_cache
+        assert path in failures_module._failure_cache
+
+    def test_skips_non_markdown_files(self, tmp_path):
+        """Only .md files are loaded, in descending name order."""
+        self._save(tmp_path, "a-first")
+        self._save(tmp_path, "b-second")
+        failures_dir = tmp_path / ".sage" / "failures"
+        (failures_dir / "notes.txt").write_text("not a failure")
+        names = sorted((p.name for p in failures_dir.glob("*.md")), reverse=True)
+
+        assert [f.id for f in load_failures(tmp_path)] == [n.split("_", 1)[1][:-3] for n in names]
+
+
 class TestKeywordScore:
     """Tests for keyword matching."""
 
@@ -312,6 +418,33 @@ class TestKeywordScore:
         score = _keyword_score(failure, "database query")
         assert score == 0
 
+    def test_matches_per_keyword_regex(self):
+        """Scores agree with a whole-word regex check for every keyword shape."""
+        import re
+
+        def reference(keywords, query):
+            query_lower = query.lower()
+            score = 0
+            for kw in keywords:
+                kw_lower = kw.lower()
+                if kw_lower in query_lower:
+                    score += 2 if re.search(rf"\b{re.escape(kw_lower)}\b", query_lower) else 1
+            return min(score / 6.0, 1.0)
+
+        keywords = ("JWT", "auth", "refresh token", "c++", ".env", "node.js", "db", "")
+        queries = [
+            "JWT authentication",
+            "refresh tokens in c++ code",
+            "load .env before node.js starts",
+            "dbms vs db",
+            "auth, auth!",
+            "",
+            "!!!",
+        ]
+        for query in queries:
+            failure = Failure(id="test", approach="", why_failed="", learned="", keywords=keywords)
+            assert _keyword_score(failure, query) == reference(keywords, query), query
+
     def test_normalizes_to_one(self):
         """Should normalize score to 0-1 range."""
         failure = Failure(
@@ -385,6 +518,221 @@ class TestRecallFailures:
         assert len(results) <= 1
 
 
+class TestFailureEmbeddingStoreCache:
+    """Tests for reusing the loaded failure embedding store."""
+
+    def _isolate(self, tmp_path, monkeypatch):
+        from sage import embeddings
+
+        monkeypatch.setattr("sage.failures.SAGE_DIR", tmp_path)
+        monkeypatch.setattr("sage.embeddings.EMBEDDINGS_DIR", tmp_path / "embeddings")
+        monkeypatch.setattr("sage.embeddings.EMBEDDINGS_META_FILE", tmp_path / "meta.json")
+        monkeypatch.setattr(
+            "sage.embeddings.get_model_info",
+            lambda model_name: {"dim": 2, "query_prefix": "", "size_mb": 0},
+        )
+
+        calls = []
+        real_load = embeddings.load_embeddings
+
+        def counting_load(path):
+            calls.append(path)
+            return real_load(path)
+
+        monkeypatch.setattr(embeddings, "load_embeddings", counting_load)
+        return embeddings, calls
+
+    def test_reuses_store_while_files_unchanged(self, tmp_path, monkeypatch):
+        """Repeated loads of unchanged files read from disk once."""
+        embeddings, calls = self._isolate(tmp_path, monkeypatch)
+        store = embeddings.EmbeddingStore(ids=["f1"], embeddings=np.array([[1.0, 0.0]]))
+        assert _save_failure_embedding_store(store)
+
+        first = _get_failure_embedding_store()
+        second = _get_failure_embedding_store()
+
+        assert first is second
+        assert first.ids == ["f1"]
+        assert len(calls) == 1
+
+    def test_save_and_external_writes_invalidate(self, tmp_path, monkeypatch):
+        """A save, or files rewritten by another process, force a reload."""
+        import json
+        import os
+
+        embeddings, calls = self._isolate(tmp_path, monkeypatch)
+        store = embeddings.EmbeddingStore(ids=["f1"], embeddings=np.array([[1.0, 0.0]]))
+        assert _save_failure_embedding_store(store)
+        _get_failure_embedding_store()
+
+        assert _save_failure_embedding_store(store.add("f2", np.array([0.0, 1.0])))
+        assert _get_failure_embedding_store().ids == ["f1", "f2"]
+
+        # Another process rewrites the ID file in place with the same size
+        ids_path = tmp_path / "embeddings" / "failures.json"
+        ids_path.write_text(json.dumps(["g1", "g2"]))
+        st = ids_path.stat()
+        os.utime(ids_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert _get_failure_embedding_store().ids == ["g1", "g2"]
+        assert len(calls) == 3
+
+    def test_missing_files_are_not_cached(self, tmp_path, monkeypatch):
+        """No files means an empty store and nothing cached."""
+        _, calls = self._isolate(tmp_path, monkeypatch)
+
+        assert len(_get_failure_embedding_store()) == 0
+        assert len(_get_failure_embedding_store()) == 0
+        assert len(calls) == 2
+
+
+class TestFailureEmbeddingReuse:
+    """Tests for skipping the embedding model on unchanged content."""
+
+    def _isolate(self, tmp_path, monkeypatch):
+        from sage import embeddings
+        from sage.errors import ok
+
+        monkeypatch.setattr("sage.failures.SAGE_DIR", tmp_path)
+        monkeypatch.setattr("sage.embeddings.EMBEDDINGS_DIR", tmp_path / "embeddings")
+        monkeypatch.setattr("sage.embeddings.EMBEDDINGS_META_FILE", tmp_path / "meta.json")
+        monkeypatch.setattr(
+            "sage.embeddings.get_model_info",
+            lambda model_name: {"dim": 2, "query_prefix": "", "size_mb": 0},
+        )
+        monkeypatch.setattr(embeddings, "is_available", lambda: True)
+
+        calls = []
+
+        def fake_embedding(text, model_name=None):
+            calls.append(text)
+            return ok(np.array([1.0, 0.0]))
+
+        monkeypatch.setattr(embeddings, "get_embedding", fake_embedding)
+        return calls
+
+    def test_unchanged_content_is_not_reembedded(self, tmp_path, monkeypatch):
+        """Saving the same content twice runs the model once."""
+        calls = self._isolate(tmp_path, monkeypatch)
+
+        assert _add_failure_embedding("f1", "approach why learned")
+        assert _add_failure_embedding("f1", "approach why learned")
+
+        assert calls == ["approach why learned"]
+        assert _get_failure_embedding_store().ids == ["f1"]
+
+    def test_changed_content_is_reembedded(self, tmp_path, monkeypatch):
+        """New content, or a new id with the same content, runs the model."""
+        calls = self._isolate(tmp_path, monkeypatch)
+
+        _add_failure_embedding("f1", "first")
+        _add_failure_embedding("f1", "second")
+        _add_failure_embedding("f2", "second")
+
+        assert calls == ["first", "second", "second"]
+
+    def test_missing_embedding_is_recomputed(self, tmp_path, monkeypatch):
+        """A recorded hash does not count once the store lost the row."""
+        calls = self._isolate(tmp_path, monkeypatch)
+
+        _add_failure_embedding("f1", "content")
+        store = _get_failure_embedding_store()
+        assert _save_failure_embedding_store(store.remove("f1"))
+        _add_failure_embedding("f1", "content")
+
+        assert len(calls) == 2
+        assert _get_failure_embedding_store().ids == ["f1"]
+
+    def test_hashes_keep_other_entries_and_drop_removed_ids(self, tmp_path, monkeypatch):
+        """Hash saves merge with the file on disk and forget ids gone from the store."""
+        import json
+        import stat
+
+        self._isolate(tmp_path, monkeypatch)
+        hashes_path = tmp_path / "embeddings" / "failure_hashes.json"
+
+        _add_failure_embedding("f1", "one")
+        _add_failure_embedding("f2", "two")
+        store = _get_failure_embedding_store()
+        assert _save_failure_embedding_store(store.remove("f1"))
+        _add_failure_embedding("f3", "three")
+
+        assert set(json.loads(hashes_path.read_text())) == {"f2", "f3"}
+        assert stat.S_IMODE(hashes_path.stat().st_mode) == 0o600
+
+    def test_model_change_is_reembedded(self, tmp_path, monkeypatch):
+        """Switching the configured model invalidates recorded hashes."""
+        calls = self._isolate(tmp_path, monkeypatch)
+
+        _add_failure_embedding("f1", "content")
+        monkeypatch.setattr("sage.embeddings.get_configured_model", lambda: "other/model")
+        _add_failure_embedding("f1", "content")
+
+        assert len(calls) == 2
+
+
+class TestFailureSimilarities:
+    """Tests for scoring every failure against the query embedding."""
+
+    def test_scores_each_failure_and_drops_negatives(self, tmp_path, monkeypatch):
+        """Scores match find_similar with a 0.0 threshold."""
+        from sage import embeddings
+        from sage.errors import ok
+
+        monkeypatch.setattr(embeddings, "is_available", lambda: True)
+        monkeypatch.setattr(
+            embeddings, "get_query_embedding", lambda text: ok(np.array([1.0, 0.0]))
+        )
+        store = embeddings.EmbeddingStore(
+            ids=["same", "angled", "orthogonal", "opposite"],
+            embeddings=np.array([[1.0, 0.0], [0.6, 0.8], [0.0, 1.0], [-1.0, 0.0]]),
+        )
+        monkeypatch.setattr("sage.failures._get_failure_embedding_store", lambda: store)
+
+        similarities = _get_failure_similarities("query")
+
+        expected = embeddings.find_similar(np.array([1.0, 0.0]), store, threshold=0.0)
+        assert similarities == {item.id: item.score for item in expected}
+        assert similarities["angled"] == pytest.approx(0.6)
+        assert "opposite" not in similarities
+
+
+class TestSemanticRecallRanking:
+    """Tests for ranking when embedding similarities are available."""
+
+    def test_mixes_scores_ranks_and_filters(self, tmp_path, monkeypatch):
+        """0.7 * similarity + 0.3 * keyword score, ties in load order, cut at limit."""
+        import sage.failures as failures_module
+        from sage import embeddings
+
+        for failure_id in ("low", "tie-a", "tie-b", "kw-only", "top"):
+            save_failure(
+                failure_id=failure_id,
+                approach="Approach",
+                why_failed="Why",
+                learned="Learned",
+                keywords=["cache"] if failure_id == "kw-only" else ["unrelated"],
+                project_path=tmp_path,
+            )
+        order = [f.id for f in load_failures(tmp_path)]
+
+        monkeypatch.setattr(embeddings, "is_available", lambda: True)
+        monkeypatch.setattr(
+            failures_module,
+            "_get_failure_similarities",
+            lambda query: {"top": 0.9, "tie-a": 0.6, "tie-b": 0.6, "low": 0.2},
+        )
+
+        results = recall_failures("cache", limit=4, project_path=tmp_path)
+
+        # kw-only: 0.3 * (2 / 6) = 0.1 and low: 0.14 fall below the 0.3 threshold
+        ties = [i for i in order if i.startswith("tie-")]
+        assert [f.id for f in results] == ["top", *ties]
+
+        limited = recall_failures("cache", limit=2, project_path=tmp_path)
+        assert [f.id for f in limited] == ["top", ties[0]]
+
+
 class TestListFailures:
     """Tests for listing failures."""
 
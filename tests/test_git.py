@@ -262,26 +262,19 @@ class TestGitCliHelpers:
 class TestCaptureGitContext:
     """Tests for capture_git_context function."""
 
-    @patch("sage.git.is_git_repo")
-    def test_capture_returns_none_for_non_repo(self, mock_is_repo):
+    @patch("sage.git._run_git")
+    def test_capture_returns_none_for_non_repo(self, mock_run):
         """capture_git_context should return None for non-git directories."""
-        mock_is_repo.return_value = False
+        mock_run.return_value = None
         assert capture_git_context() is None
 
-    @patch("sage.git.get_recent_commits")
-    @patch("sage.git.is_dirty")
-    @patch("sage.git.get_commit")
-    @patch("sage.git.get_branch")
-    @patch("sage.git.is_git_repo")
-    def test_capture_returns_context(
-        self, mock_is_repo, mock_branch, mock_commit, mock_dirty, mock_recent
-    ):
+    @patch("sage.git._run_git")
+    def test_capture_returns_context(self, mock_run):
         """capture_git_context should return GitContext for git repos."""
-        mock_is_repo.return_value = True
-        mock_branch.return_value = "main"
-        mock_commit.return_value = "abc1234"
-        mock_dirty.return_value = True
-        mock_recent.return_value = ("commit 1", "commit 2")
+        mock_run.side_effect = [
+            "# branch.oid abc1234def\n# branch.head main\n? new_file.py",
+            "abc1234 commit 1\ndef5678 commit 2",
+        ]
 
         ctx = capture_git_context()
 
@@ -289,7 +282,34 @@ class TestCaptureGitContext:
         assert ctx.branch == "main"
         assert ctx.commit == "abc1234"
         assert ctx.dirty is True
-        assert ctx.recent_commits == ("commit 1", "commit 2")
+        assert ctx.recent_commits == ("abc1234 commit 1", "def5678 commit 2")
+        assert mock_run.call_count == 2
+
+    @patch("sage.git._run_git")
+    def test_capture_clean_detached_head(self, mock_run):
+        """Detached HEAD falls back to describe; header-only status is clean."""
+        mock_run.side_effect = [
+            "# branch.oid abc1234def\n# branch.head (detached)",
+            "v1.2.0",
+            "abc1234 commit 1",
+        ]
+
+        ctx = capture_git_context(recent_count=0)
+
+        assert ctx is not None
+        assert ctx.branch == "v1.2.0"
+        assert ctx.commit == "abc1234"
+        assert ctx.dirty is False
+        assert ctx.recent_commits == ()
+
+    @patch("sage.git._run_git")
+    def test_capture_repo_without_commits(self, mock_run):
+        """An unborn branch has a name but no commit or history."""
+        mock_run.side_effect = ["# branch.oid (initial)\n# branch.head main", None]
+
+        ctx = capture_git_context()
+
+        assert ctx == GitContext(branch="main", commit="", dirty=False, recent_commits=())
 
 
 class TestCheckFilChanged:
@@ -414,6 +434,46 @@ class TestGitIntegration:
             # Each commit should have SHA and message
             assert " " in commits[0]
 
+    def test_capture_git_context_matches_helpers(self, tmp_path):
+        """The combined capture agrees with the individual helpers."""
+        import subprocess
+
+        def git(*args):
+            subprocess.run(
+                ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                cwd=tmp_path,
+                check=True,
+                capture_output=True,
+            )
+
+        git("init", "-q", "-b", "feature/x")
+        for i in range(4):
+            (tmp_path / "f.txt").write_text(str(i))
+            git("add", "f.txt")
+            git("commit", "-q", "-m", f"change {i}")
+
+        def from_helpers():
+            return GitContext(
+                branch=get_branch(tmp_path),
+                commit=get_commit(tmp_path),
+                dirty=is_dirty(tmp_path),
+                recent_commits=get_recent_commits(tmp_path, 3),
+            )
+
+        assert capture_git_context(tmp_path) == from_helpers()
+        assert capture_git_context(tmp_path).dirty is False
+
+        (tmp_path / "untracked.txt").write_text("x")
+        assert capture_git_context(tmp_path) == from_helpers()
+        assert capture_git_context(tmp_path).dirty is True
+
+        git("checkout", "-q", "--detach", "HEAD~1")
+        assert capture_git_context(tmp_path) == from_helpers()
+
+    def test_capture_git_context_outside_repo(self, tmp_path):
+        """A plain directory has no git context."""
+        assert capture_git_context(tmp_path) is None
+
     def test_capture_git_context_returns_context(self):
         """capture_git_context should return valid context for sage repo."""
         ctx = capture_git_context(Path.cwd())
@@ -10,6 +10,7 @@ import pytest
 from sage.history import (
     append_entry,
     calculate_usage,
+    calculate_usage_batch,
     create_entry,
     get_recent_context,
     read_history,
@@ -73,6 +74,20 @@ class TestCreateEntry:
         assert entry.session == "session-123"
 
 
+class TestEntryToDict:
+    """Tests for HistoryEntry.to_dict."""
+
+    def test_matches_asdict_without_none(self):
+        """to_dict equals asdict minus None-valued fields."""
+        from dataclasses import asdict
+
+        entry = create_entry("ask", "q", "model", 10, 5, response="r", session="s1")
+
+        expected = {k: v for k, v in asdict(entry).items() if v is not None}
+        assert entry.to_dict() == expected
+        assert "depth" not in entry.to_dict()
+
+
 class TestAppendAndReadHistory:
     """Tests for append_entry and read_history functions."""
 
@@ -135,6 +150,27 @@ class TestAppendAndReadHistory:
 
         assert len(entries) == 3
 
+    def test_read_with_limit_only_parses_tail(self, mock_history_dir: Path):
+        """With a limit, lines before the requested tail are never parsed."""
+        history_path = mock_history_dir / "history.jsonl"
+        history_path.write_text("not json\n\n")
+        for i in range(3):
+            append_entry("test-skill", create_entry("ask", f"query {i}", "model", 1, 1))
+        with open(history_path, "a") as f:
+            f.write("\n")
+
+        entries = read_history("test-skill", limit=2)
+
+        assert [e.query for e in entries] == ["query 2", "query 1"]
+
+    def test_read_with_non_positive_limit_returns_everything(self, mock_history_dir: Path):
+        """A zero or negative limit reads the whole history instead of raising."""
+        for i in range(3):
+            append_entry("test-skill", create_entry("ask", f"query {i}", "model", 1, 1))
+
+        assert len(read_history("test-skill", limit=0)) == 3
+        assert len(read_history("test-skill", limit=-1)) == 3
+
     def test_read_empty_file_returns_empty_list(self, mock_history_dir: Path):
         """Reading non-existent history returns empty list."""
         entries = read_history("test-skill")
@@ -179,6 +215,50 @@ class TestCalculateUsage:
         assert usage["tokens_out"] == 150
         assert usage["entries"] == 2
 
+    def test_excludes_entries_outside_period(self, mock_history_dir: Path):
+        """Entries older than the period are not counted."""
+        history_path = mock_history_dir / "history.jsonl"
+        old = {
+            "ts": "2020-01-01T00:00:00+00:00",
+            "type": "ask",
+            "query": "old",
+            "model": "m",
+            "tokens_in": 1000,
+            "tokens_out": 1000,
+            "searches": 1,
+            "cost": 1.0,
+        }
+        history_path.write_text(json.dumps(old) + "\n")
+        append_entry("test-skill", create_entry("ask", "new", "model", 10, 5, cache_hits=4))
+
+        usage = calculate_usage("test-skill", days=7)
+
+        assert usage["entries"] == 1
+        assert usage["tokens_in"] == 10
+        assert usage["searches"] == 0
+        assert usage["cache_hits"] == 4
+
+
+class TestCalculateUsageBatch:
+    """Tests for calculate_usage_batch function."""
+
+    def test_matches_per_skill_usage(self, tmp_path: Path):
+        """Batch results equal calculate_usage for each skill, missing files included."""
+        paths = {name: tmp_path / f"{name}.jsonl" for name in ("a", "b", "missing")}
+
+        with patch("sage.history.get_history_path", side_effect=lambda name: paths[name]):
+            append_entry("a", create_entry("ask", "q", "model", 100, 50))
+            append_entry("b", create_entry("ask", "q", "model", 7, 3, searches=2))
+            append_entry("b", create_entry("ask", "q", "model", 1, 1))
+
+            batch = calculate_usage_batch(["a", "b", "missing"], days=7)
+            single = {name: calculate_usage(name, days=7) for name in paths}
+
+        assert batch == single
+        assert list(batch) == ["a", "b", "missing"]
+        assert batch["b"]["tokens_in"] == 8
+        assert batch["missing"]["entries"] == 0
+
 
 class TestGetRecentContext:
     """Tests for get_recent_context function."""
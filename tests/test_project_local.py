@@ -77,6 +77,36 @@ class TestDetectProjectRoot:
 
         assert result == project_dir
 
+    def test_stops_at_home_directory(self, tmp_path: Path):
+        """Markers above the home directory are not considered."""
+        home = tmp_path / "home"
+        start = home / "notes"
+        start.mkdir(parents=True)
+        (tmp_path / ".git").mkdir()
+
+        with patch("sage.config.Path.home", return_value=home):
+            assert detect_project_root(start_path=start) is None
+
+            (home / ".sage").mkdir()
+            assert detect_project_root(start_path=start) == home
+
+    def test_probes_each_level_once(self, tmp_path: Path):
+        """Every directory on the way up is checked for markers only once."""
+        start = tmp_path / "a" / "b"
+        start.mkdir(parents=True)
+        probed = []
+        real_is_dir = Path.is_dir
+
+        def spy_is_dir(self, *args, **kwargs):
+            probed.append(self)
+            return real_is_dir(self, *args, **kwargs)
+
+        with patch.object(Path, "is_dir", spy_is_dir):
+            detect_project_root(start_path=start)
+
+        assert start.resolve() / ".sage" in probed
+        assert len(probed) == len(set(probed))
+
 
 class TestProjectLocalCheckpoints:
     """Tests for project-local checkpoint storage."""
@@ -1,5 +1,6 @@
 """Tests for SageConfig tuning system."""
 
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -129,6 +130,43 @@ class TestSageConfigLoad:
         assert isinstance(cfg.depth_min_messages, int)
         assert cfg.embedding_model == "custom-model"
 
+    def test_repeat_load_reuses_parse(self, tmp_path: Path):
+        """An unchanged file is parsed once across repeated loads."""
+        (tmp_path / "tuning.yaml").write_text("recall_threshold: 0.6\n")
+
+        with patch("yaml.load", wraps=yaml.load) as load:
+            first = SageConfig.load(tmp_path)
+            second = SageConfig.load(tmp_path)
+
+        assert first.recall_threshold == second.recall_threshold == 0.6
+        assert load.call_count == 1
+
+    def test_load_sees_external_edit(self, tmp_path: Path):
+        """Editing the file invalidates the cached parse."""
+        config_path = tmp_path / "tuning.yaml"
+        config_path.write_text("recall_threshold: 0.6\n")
+        SageConfig.load(tmp_path)
+
+        config_path.write_text("recall_threshold: 0.7\n")
+        # Same size as before; make sure the mtime moves on any filesystem
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert SageConfig.load(tmp_path).recall_threshold == 0.7
+
+    def test_save_then_load_is_not_stale(self, tmp_path: Path):
+        """Saving drops the cached parse even if the mtime did not change."""
+        SageConfig(recall_threshold=0.61).save(tmp_path)
+        assert SageConfig.load(tmp_path).recall_threshold == 0.61
+
+        config_path = tmp_path / "tuning.yaml"
+        st = config_path.stat()
+        SageConfig(recall_threshold=0.62).save(tmp_path)
+        # Same size and, after this, the same mtime as the cached parse
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert SageConfig.load(tmp_path).recall_threshold == 0.62
+
 
 class TestSageConfigSave:
     """Tests for SageConfig.save()."""
@@ -181,6 +219,50 @@ class TestSageConfigSave:
 
         assert "_version" in data
 
+    def test_save_skips_unchanged_file(self, tmp_path: Path):
+        """Saving the same values again does not rewrite the file."""
+        SageConfig(recall_threshold=0.65).save(tmp_path)
+        config_path = tmp_path / "tuning.yaml"
+        os.utime(config_path, ns=(0, 0))
+
+        SageConfig(recall_threshold=0.65).save(tmp_path)
+        assert config_path.stat().st_mtime_ns == 0
+
+        SageConfig(recall_threshold=0.66).save(tmp_path)
+        assert config_path.stat().st_mtime_ns != 0
+        assert SageConfig.load(tmp_path).recall_threshold == 0.66
+
+    def test_save_repairs_malformed_file(self, tmp_path: Path):
+        """An unparseable tuning.yaml is overwritten instead of raising."""
+        config_path = tmp_path / "tuning.yaml"
+        config_path.write_text("recall_threshold: [unclosed\n")
+
+        SageConfig().save(tmp_path)
+
+        assert yaml.safe_load(config_path.read_text()) == {"_version": 1}
+
+    def test_save_unchanged_still_restricts_permissions(self, tmp_path: Path):
+        """The no-op path still tightens a loosely permissioned file."""
+        SageConfig(recall_threshold=0.65).save(tmp_path)
+        config_path = tmp_path / "tuning.yaml"
+        config_path.chmod(0o644)
+        os.utime(config_path, ns=(0, 0))
+
+        SageConfig(recall_threshold=0.65).save(tmp_path)
+
+        assert config_path.stat().st_mtime_ns == 0
+        assert config_path.stat().st_mode & 0o777 == 0o600
+
+    def test_save_modules_as_list(self, tmp_path: Path):
+        """Non-default modules are written as a YAML list and load back as a tuple."""
+        sage_dir = tmp_path / ".sage"
+
+        SageConfig(modules=("core", "knowledge")).save(sage_dir)
+
+        data = yaml.safe_load((sage_dir / "tuning.yaml").read_text())
+        assert data == {"modules": ["core", "knowledge"]}
+        assert SageConfig.load(sage_dir).modules == ("core", "knowledge")
+
     def test_save_roundtrip(self, tmp_path: Path):
         """Save then load preserves values."""
         sage_dir = tmp_path / ".sage"
@@ -721,6 +803,31 @@ class TestConfigCLI:
         assert result.exit_code == 1
         assert "Unknown config key" in result.output
 
+    @pytest.mark.parametrize(
+        ("key", "label"),
+        [("recall_threshold", "float"), ("depth_min_messages", "integer")],
+    )
+    def test_config_set_rejects_non_numeric(self, tmp_path: Path, key: str, label: str):
+        """Numeric tuning keys reject values that don't parse."""
+        from click.testing import CliRunner
+
+        from sage.cli import main
+
+        sage_dir = tmp_path / ".sage"
+        sage_dir.mkdir(parents=True)
+
+        with (
+            patch("sage.cli.SAGE_DIR", sage_dir),
+            patch("sage.config.SAGE_DIR", sage_dir),
+            patch("sage.config.CONFIG_PATH", sage_dir / "config.yaml"),
+            patch("sage.config.detect_project_root", return_value=None),
+        ):
+            result = CliRunner().invoke(main, ["config", "set", key, "abc"])
+
+        assert result.exit_code == 1
+        assert f"Invalid {label} value: abc" in result.output
+        assert not (sage_dir / "tuning.yaml").exists()
+
     def test_config_shows_non_default_highlighted(self, tmp_path: Path):
         """Non-default tuning values are highlighted in output."""
         from click.testing import CliRunner
@@ -801,6 +908,55 @@ class TestConfigCLIEdgeCases:
         assert content["depth_min_messages"] == 12
         assert isinstance(content["depth_min_messages"], int)
 
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("false", False), ("No", False), ("0", False), ("true", True), ("yes", True)],
+    )
+    def test_config_set_bool_type_coercion(self, tmp_path: Path, raw: str, expected: bool):
+        """Boolean values are stored as bools, not truthy strings."""
+        from click.testing import CliRunner
+
+        from sage.cli import main
+
+        sage_dir = tmp_path / ".sage"
+        sage_dir.mkdir(parents=True)
+
+        runner = CliRunner()
+
+        with (
+            patch("sage.cli.SAGE_DIR", sage_dir),
+            patch("sage.config.SAGE_DIR", sage_dir),
+            patch("sage.config.detect_project_root", return_value=None),
+        ):
+            result = runner.invoke(main, ["config", "set", "embedding_quantize", raw])
+
+        assert result.exit_code == 0
+
+        # Defaults are omitted from tuning.yaml, so check the loaded value
+        assert SageConfig.load(sage_dir).embedding_quantize is expected
+
+    def test_config_set_invalid_bool_fails(self, tmp_path: Path):
+        """Unrecognized boolean input shows error and saves nothing."""
+        from click.testing import CliRunner
+
+        from sage.cli import main
+
+        sage_dir = tmp_path / ".sage"
+        sage_dir.mkdir(parents=True)
+
+        runner = CliRunner()
+
+        with (
+            patch("sage.cli.SAGE_DIR", sage_dir),
+            patch("sage.config.SAGE_DIR", sage_dir),
+            patch("sage.config.detect_project_root", return_value=None),
+        ):
+            result = runner.invoke(main, ["config", "set", "embedding_quantize", "maybe"])
+
+        assert result.exit_code == 1
+        assert "Invalid boolean value: maybe" in result.output
+        assert not (sage_dir / "tuning.yaml").exists()
+
     def test_config_set_invalid_float_fails(self, tmp_path: Path):
         """Invalid float input shows error."""
         from click.testing import CliRunner
@@ -932,3 +1088,21 @@ class TestStorageMaintenanceConfig:
         assert cfg.checkpoint_max_age_days == 0
         assert cfg.checkpoint_max_count == 0
         assert cfg.knowledge_max_age_days == 0
+
+
+class TestSkillPaths:
+    """Tests for skill path helpers and name sanitization."""
+
+    def test_traversal_names_stay_inside_skill_dirs(self):
+        """Path separators and dots cannot escape the skills directories."""
+        from sage.config import SAGE_DIR, SKILLS_DIR, get_sage_skill_path, get_skill_path
+
+        assert get_skill_path("../../../.bashrc") == SKILLS_DIR / "bashrc"
+        assert get_sage_skill_path("a/b") == SAGE_DIR / "skills" / "a-b"
+
+    def test_empty_after_sanitizing_is_unnamed(self):
+        """Names with no safe characters map to a fixed placeholder."""
+        from sage.config import _sanitize_name
+
+        assert _sanitize_name("..") == "unnamed"
+        assert _sanitize_name("my-skill_v2") == "my-skill_v2"
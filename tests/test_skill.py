@@ -1,8 +1,19 @@
 """Tests for sage.skill module."""
 
 from pathlib import Path
+from unittest.mock import patch
 
-from sage.skill import Skill, SkillMetadata, build_context, create_skill, load_skill
+from sage.history import append_entry, create_entry, read_history
+from sage.skill import (
+    Skill,
+    SkillMetadata,
+    build_context,
+    create_skill,
+    get_all_skill_info,
+    get_skill_info,
+    list_doc_sizes,
+    load_skill,
+)
 
 
 class TestLoadSkill:
@@ -54,6 +65,122 @@ class TestLoadSkill:
         assert result.error.code == "skill_not_found"
         assert "nonexistent-skill" in result.error.message
 
+    def test_load_skill_can_skip_docs(self, mock_paths: dict, sample_skill_content: str):
+        """include_docs=False leaves Skill.docs empty."""
+        skill_path = mock_paths["skills_dir"] / "test-skill"
+        (skill_path / "docs").mkdir(parents=True)
+        (skill_path / "SKILL.md").write_text(sample_skill_content)
+        (skill_path / "docs" / "reference.md").write_text("# Reference")
+
+        result = load_skill("test-skill", include_docs=False)
+
+        assert result.ok is True
+        assert result.value.docs == ()
+
+
+class TestListDocSizes:
+    """Tests for list_doc_sizes()."""
+
+    def test_matches_loaded_docs(self, mock_paths: dict, sample_skill_content: str):
+        """Sizes cover the same files, in the same order, as Skill.docs."""
+        skill_path = mock_paths["skills_dir"] / "test-skill"
+        docs_dir = skill_path / "docs"
+        (docs_dir / "nested.md").mkdir(parents=True)
+        (skill_path / "SKILL.md").write_text(sample_skill_content)
+        (docs_dir / "b.md").write_text("b" * 40)
+        (docs_dir / "a.md").write_text("a" * 8)
+        (docs_dir / "notes.txt").write_text("ignored")
+
+        sizes = list_doc_sizes("test-skill")
+
+        assert sizes == [("a.md", 8), ("b.md", 40)]
+        assert [name for name, _ in sizes] == [n for n, _ in load_skill("test-skill").value.docs]
+
+    def test_missing_docs_dir(self, mock_paths: dict):
+        """A skill without a docs directory has no docs."""
+        assert list_doc_sizes("test-skill") == []
+
+
+class TestGetSkillInfo:
+    """Tests for get_skill_info()."""
+
+    def test_history_read_once(self, mock_paths: dict, sample_skill_content: str):
+        """History count and last-active time come from a single read."""
+        skill_path = mock_paths["skills_dir"] / "test-skill"
+        skill_path.mkdir()
+        (skill_path / "SKILL.md").write_text(sample_skill_content)
+        history_path = mock_paths["sage_dir"] / "history.jsonl"
+
+        with patch("sage.history.get_history_path", return_value=history_path):
+            for query in ("first", "second", "third"):
+                append_entry("test-skill", create_entry("ask", query, "model", 1, 1))
+            latest = read_history("test-skill")[0]
+            with patch("sage.skill.read_history", wraps=read_history) as spy:
+                result = get_skill_info("test-skill")
+
+        assert result.ok is True
+        assert result.value["history_count"] == 3
+        assert result.value["last_active"] == latest.ts
+        assert spy.call_count == 1
+
+    def test_doc_tokens_from_file_sizes(self, mock_paths: dict, sample_skill_content: str):
+        """Doc token estimates come from file sizes, without reading the docs."""
+        skill_path = mock_paths["skills_dir"] / "test-skill"
+        (skill_path / "docs").mkdir(parents=True)
+        (skill_path / "SKILL.md").write_text(sample_skill_content)
+        (skill_path / "docs" / "reference.md").write_text("x" * 400)
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as spy:
+            result = get_skill_info("test-skill")
+
+        assert result.value["doc_count"] == 1
+        assert result.value["docs"] == [{"name": "reference.md", "tokens": 100}]
+        assert all(call.args[0].name != "reference.md" for call in spy.call_args_list)
+
+
+class TestGetAllSkillInfo:
+    """Tests for get_all_skill_info()."""
+
+    def test_matches_per_skill_info(self, mock_paths: dict, sample_skill_content: str):
+        """Bulk info equals get_skill_info for each managed skill, in name order."""
+        skills_dir = mock_paths["skills_dir"]
+        for name in ("zeta", "alpha"):
+            (skills_dir / name / "docs").mkdir(parents=True)
+            (skills_dir / name / "SKILL.md").write_text(sample_skill_content)
+            (skills_dir / name / "docs" / "ref.md").write_text("x" * 40)
+        (skills_dir / "unmanaged").mkdir()
+        (skills_dir / "unmanaged" / "SKILL.md").write_text("---\nname: other\n---\n")
+        (mock_paths["sage_dir"] / "shared_memory.md").write_text("- insight\n" * 10)
+
+        with patch("sage.skill.read_history", return_value=[]):
+            infos = get_all_skill_info()
+            expected = {name: get_skill_info(name).value for name in ("alpha", "zeta")}
+
+        assert list(infos) == ["alpha", "zeta"]
+        assert infos == expected
+
+    def test_reads_shared_memory_once(self, mock_paths: dict, sample_skill_content: str):
+        """Shared memory is loaded once for the whole listing."""
+        for name in ("a", "b", "c"):
+            (mock_paths["skills_dir"] / name).mkdir()
+            (mock_paths["skills_dir"] / name / "SKILL.md").write_text(sample_skill_content)
+
+        with (
+            patch("sage.skill.read_history", return_value=[]),
+            patch("sage.skill.load_shared_memory", return_value="") as load,
+        ):
+            infos = get_all_skill_info()
+
+        assert len(infos) == 3
+        assert load.call_count == 1
+
+    def test_skips_invalid_frontmatter(self, mock_paths: dict):
+        """Managed skills whose metadata cannot be parsed are left out."""
+        (mock_paths["skills_dir"] / "broken").mkdir()
+        (mock_paths["skills_dir"] / "broken" / "SKILL.md").write_text("sage_managed: true\n")
+
+        assert get_all_skill_info() == {}
+
 
 class TestCreateSkill:
     """Tests for create_skill()."""
@@ -94,6 +94,21 @@ class TestDetectTopicDrift:
         assert trigger.type == TriggerType.TOPIC_SHIFT
         assert trigger.source == TriggerSource.STRUCTURAL
 
+    def test_spread_recent_messages_centroid_is_not_drift(self):
+        """A message aligned with the centroid of varied recent ones is not drift."""
+        # Each recent message is unit-norm, but their mean is much shorter
+        current = np.array([1.0, 0.0, 0.0])
+        recent = [
+            np.array([0.6, 0.8, 0.0]),
+            np.array([0.6, -0.8, 0.0]),
+            np.array([0.6, 0.0, 0.8]),
+            np.array([0.6, 0.0, -0.8]),
+            np.array([1.0, 0.0, 0.0]),
+        ]
+
+        trigger = detect_topic_drift(current, recent, threshold=0.9)
+        assert trigger is None
+
     def test_insufficient_buffer_no_trigger(self):
         """Insufficient buffer size returns None."""
         current = np.array([0.0, 1.0, 0.0])